@@ -3,15 +3,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple, List, Dict
 
 import pytest
 
+from download_comparison import digest_file
+
 if TYPE_CHECKING:
     import _pytest.fixtures
 
     from page_object.add_job_page.input_settings import InputSettings
     from page_object.add_job_page.add_job_page import AddJobPage
+    from webadmin_api.client import WebadminApiClient
 
 @dataclass(frozen=True)
 class EncryptedFileTestInput:
@@ -19,24 +22,56 @@ class EncryptedFileTestInput:
     expected_hash:str
     expected_hash_type:str
 
+class ExtractionResult(NamedTuple):
+    """What Webadmin filled in the input settings after extracting the hash from a file."""
+    hashes:List[str]
+    hash_type:str
+
 from .data_test_encrypted_file import TEST_DATA
 
+
+def extract_hash(input_settings:InputSettings,filepath:Path,extraction_results:Dict[str,ExtractionResult]) -> ExtractionResult:
+    """Extracts the hash from the file and stores the result in `extraction_results` under the SHA-256 of the file."""
+    input_settings.extract_hash_from_file(filepath)
+    result = ExtractionResult(input_settings.get_input_hashes(),input_settings.get_selected_hash_type())
+    extraction_results[digest_file(filepath,as_binary=True).sha256] = result
+    return result
+
+
+@pytest.fixture(scope='session')
+def _extraction_results() -> Dict[str,ExtractionResult]:
+    """You probably want to use the extraction_result fixture instead.
+
+    Fixture holding the results of the hash extractions done during the test session,
+    keyed by the SHA-256 of the file the hash was extracted from.
+    """
+    return {}
+
+
+@pytest.fixture
+def extraction_result(request:_pytest.fixtures.FixtureRequest,test_data:EncryptedFileTestInput,_extraction_results:Dict[str,ExtractionResult]) -> ExtractionResult:
+    """Fixture that returns the result of extracting the hash from the file of `test_data`.
+    The file is uploaded and the hash extracted only if no test of the session has done it yet
+    (the browser is not even started otherwise).
+    """
+    result = _extraction_results.get(digest_file(test_data.filepath,as_binary=True).sha256)
+    if result is None:
+        result = extract_hash(request.getfixturevalue('input_settings'),test_data.filepath,_extraction_results)
+    return result
+
+
 @pytest.mark.parametrize('test_data',TEST_DATA)
 class TestEncryptedFile:
-    def test_extraction_did_not_fail(self,input_settings:InputSettings, test_data:EncryptedFileTestInput):
-        input_settings.extract_hash_from_file(test_data.filepath)
+    def test_extraction_did_not_fail(self,input_settings:InputSettings, test_data:EncryptedFileTestInput,_extraction_results:Dict[str,ExtractionResult]):
+        extract_hash(input_settings,test_data.filepath,_extraction_results)
 
-    def test_output_has_expected_hash(self,input_settings:InputSettings, test_data:EncryptedFileTestInput):
-        input_settings.extract_hash_from_file(test_data.filepath)
-        extracted_hashes = input_settings.get_input_hashes()
-        assert extracted_hashes == [test_data.expected_hash]
+    def test_output_has_expected_hash(self,extraction_result:ExtractionResult, test_data:EncryptedFileTestInput):
+        assert extraction_result.hashes == [test_data.expected_hash]
 
-    def test_output_has_expected_hash_type(self,input_settings:InputSettings, test_data:EncryptedFileTestInput):
-        input_settings.extract_hash_from_file(test_data.filepath)
-        hash_type = input_settings.get_selected_hash_type()
-        assert hash_type == test_data.expected_hash_type
+    def test_output_has_expected_hash_type(self,extraction_result:ExtractionResult, test_data:EncryptedFileTestInput):
+        assert extraction_result.hash_type == test_data.expected_hash_type
 
-    def test_extracted_hash_should_get_cracked(self,add_job_page:AddJobPage,input_settings:InputSettings, test_data:EncryptedFileTestInput):
+    def test_extracted_hash_should_get_cracked(self,add_job_page:AddJobPage,input_settings:InputSettings,webadmin_api:WebadminApiClient, test_data:EncryptedFileTestInput):
         input_settings.extract_hash_from_file(test_data.filepath)
         attack_settings = add_job_page.open_attack_settings()
         brute_force_settings = attack_settings.choose_brute_force_mode()
@@ -44,6 +79,6 @@ class TestEncryptedFile:
 
         job_detail_page = add_job_page.create_job()
         job_detail_page.start_job()
-        job_detail_page.wait_until_job_finished(600)
+        job_detail_page.wait_until_job_finished(600,webadmin_api)
 
         assert job_detail_page.get_hashes()[0][1] == 'password'
\ No newline at end of file
@@ -3,10 +3,14 @@ from typing import TYPE_CHECKING
 from pathlib import Path
 
 import pytest
+from selenium.webdriver.support.wait import WebDriverWait
 
 
 if TYPE_CHECKING:
+    from typing import Callable
+    from selenium.webdriver.remote.webdriver import WebDriver
     from page_object.add_job_page.add_job_page import AddJobPage
+    from hash_file_generator import GeneratedHashFile
 
 
 HASH_TEST_FILES = [
@@ -30,3 +34,13 @@ def test_add_from_file_works_two_appends(add_job_page:AddJobPage):
     input_settings.append_hashes_from_hash_file(HASH_TEST_FILES[1])
     
     assert input_settings.get_input_hashes() == expected_hashes
+
+@pytest.mark.parametrize('hash_count',[10000])
+def test_add_from_large_generated_file(selenium:WebDriver,add_job_page:AddJobPage,generated_hash_file:Callable[...,GeneratedHashFile],hash_count:int):
+    hash_file = generated_hash_file(hash_count)
+
+    input_settings = add_job_page.open_input_settings()
+    input_settings.append_hashes_from_hash_file(hash_file.path)
+    WebDriverWait(selenium,30).until(lambda _: len(input_settings.get_input_hashes()) == hash_count)
+
+    assert input_settings.get_input_hashes() == list(hash_file.hashes())
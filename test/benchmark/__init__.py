@@ -0,0 +1 @@
+"""Benchmarks of page objects, run against the stand-in Webadmin (see `standin_webadmin`)."""
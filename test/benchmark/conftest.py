@@ -0,0 +1,76 @@
+"""Fixtures of the benchmarks. The benchmarks run in a headless browser against the stand-in
+Webadmin (see `standin_webadmin`) instead of the Fitcrack instance given by `--base-url`.
+
+For detailed information about conftest.py files, see
+https://docs.pytest.org/en/6.2.x/fixture.html#conftest-py-sharing-fixtures-across-multiple-files
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, Dict, Iterator
+
+import pytest
+
+from standin_webadmin.server import StandInWebadmin
+from page_object.common.command_counter import COMMAND_COUNTER
+
+if TYPE_CHECKING:
+    import _pytest.fixtures
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from selenium.webdriver.chrome.options import Options as ChromeOptions
+    from selenium.webdriver.firefox.options import Options as FirefoxOptions
+    from page_object.login_page import LoginSession
+    from benchmark.recorder import Benchmark, BenchmarkRecorder
+    from conftest import Credentials
+
+
+@pytest.fixture(scope='session')
+def standin_webadmin() -> Iterator[StandInWebadmin]:
+    """Fixture that runs the stand-in Webadmin for the whole test session.
+    Benchmarks set the size of its tables with `resize`.
+    """
+    with StandInWebadmin() as webadmin:
+        yield webadmin
+
+
+@pytest.fixture(scope='session')
+def base_url(standin_webadmin:StandInWebadmin) -> str:
+    """Overrides the base URL for the benchmarks, so that they run against the stand-in Webadmin."""
+    return standin_webadmin.url
+
+
+@pytest.fixture(scope='session')
+def _login_sessions() -> Dict[Credentials,LoginSession]:
+    """Overrides the login sessions for the benchmarks, so that the sessions captured in
+    the stand-in Webadmin and in the tested Fitcrack instance are kept apart.
+    """
+    return {}
+
+
+@pytest.fixture
+def chrome_options(chrome_options:ChromeOptions) -> ChromeOptions:
+    """Runs Chrome headless for the benchmarks."""
+    chrome_options.add_argument('--headless=new')
+    return chrome_options
+
+
+@pytest.fixture
+def firefox_options(firefox_options:FirefoxOptions) -> FirefoxOptions:
+    """Runs Firefox headless for the benchmarks."""
+    firefox_options.add_argument('-headless')
+    return firefox_options
+
+
+@pytest.fixture
+def benchmark(selenium:WebDriver,request:_pytest.fixtures.FixtureRequest) -> Iterator[Benchmark]:
+    """Fixture that returns a Benchmark object (see the `benchmark.recorder` module) for timing
+    a page-object call. The result is stored as the `benchmark` user property of the test:
+
+    ```
+    dictionaries = benchmark(lambda page: page.get_available_dictionaries(),setup=side_bar.goto_dictionary_library)
+    ```
+    """
+    recorder : BenchmarkRecorder = request.config.pluginmanager.get_plugin('fitcrack_benchmark_recorder') # type: ignore
+    COMMAND_COUNTER.install(selenium)
+    benchmark = recorder.create_benchmark(request.node.name,request.config.getoption('benchmark_rounds'))
+    yield benchmark
+    if benchmark.times:
+        request.node.user_properties.append(('benchmark',benchmark.result()))
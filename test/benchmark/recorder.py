@@ -0,0 +1,125 @@
+"""pytest plugin that collects the results of benchmarks and compares them with baselines.
+
+BenchmarkRecorder --
+the plugin; registered by `conftest.py` when the `--benchmark` option is used
+
+Benchmark --
+times a function over several rounds; see the `benchmark` fixture in `benchmark/conftest.py`
+
+The result of each benchmark (latency over the rounds and the number of WebDriver commands of a
+round) is stored in the `benchmark` user property of its test, so it is carried over from
+pytest-xdist workers too. At the end of the run, the plugin shows the results next to the stored
+baselines; with `--benchmark-save-baseline`, it stores the results as the new baselines.
+
+Latency depends on the machine and the browser, so it is only reported. The number of WebDriver
+commands does not, so a benchmark fails if it sends more commands than its baseline.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, TypeVar
+from pathlib import Path
+import json
+import statistics
+import time
+
+import pytest
+
+from page_object.common.command_counter import COMMAND_COUNTER
+
+if TYPE_CHECKING:
+    import _pytest.config
+    import _pytest.reports
+    import _pytest.terminal
+    X = TypeVar('X')
+
+
+DEFAULT_BASELINE_PATH = Path(__file__).parent / 'baselines.json'
+
+
+class Benchmark:
+    """Times a function over `rounds` rounds and counts the WebDriver commands it sends.
+    `baseline` is the stored baseline of the benchmark, if any.
+    """
+
+    def __init__(self,name:str,rounds:int,baseline:Optional[Dict[str,Any]]=None):
+        self.name = name
+        self.rounds = rounds
+        self.baseline = baseline
+        self.times : List[float] = []
+        self.commands : List[int] = []
+
+    def __call__(self,function:Callable[...,X],setup:Optional[Callable[[],Any]]=None) -> X:
+        """Calls `function` once per round and returns the result of the last call.
+        If `setup` is given, it is called (untimed) before every round and its result is passed
+        to `function`; use it to bring the page to the state the function expects.
+
+        Fails the test if a round sends more WebDriver commands than the baseline.
+        """
+        for _ in range(self.rounds):
+            arguments = () if setup is None else (setup(),)
+            count_before = COMMAND_COUNTER.total.count
+            start = time.perf_counter()
+            result = function(*arguments)
+            self.times.append(time.perf_counter()-start)
+            self.commands.append(COMMAND_COUNTER.total.count-count_before)
+        if self.baseline is not None and max(self.commands) > self.baseline['commands']:
+            pytest.fail(f'{self.name} sent {max(self.commands)} WebDriver commands; the baseline is {self.baseline["commands"]}.')
+        return result
+
+    def result(self) -> Dict[str,Any]:
+        return {
+            'name': self.name,
+            'rounds': len(self.times),
+            'median': statistics.median(self.times),
+            'min': min(self.times),
+            'max': max(self.times),
+            'commands': max(self.commands),
+        }
+
+
+class BenchmarkRecorder:
+    """The plugin. `baseline_path` is the JSON file with the baselines, `save_baseline` makes the
+    plugin store the results there and `json_path` is the path of a JSON file to write the results
+    to, if any.
+    """
+
+    def __init__(self,baseline_path:Path=DEFAULT_BASELINE_PATH,save_baseline:bool=False,json_path:Optional[str]=None):
+        self.baseline_path = baseline_path
+        self.save_baseline = save_baseline
+        self.json_path = json_path
+        self.baselines : Dict[str,Dict[str,Any]] = json.loads(baseline_path.read_text()) if baseline_path.is_file() else {}
+        self.results : Dict[str,Dict[str,Any]] = {}
+
+    def create_benchmark(self,name:str,rounds:int) -> Benchmark:
+        return Benchmark(name,rounds,None if self.save_baseline else self.baselines.get(name))
+
+    # Hooks
+
+    def pytest_runtest_logreport(self,report:_pytest.reports.TestReport) -> None:
+        if report.when != 'teardown':
+            return
+        result = dict(report.user_properties).get('benchmark')
+        if result is not None:
+            self.results[result['name']] = result
+
+    def pytest_terminal_summary(self,terminalreporter:_pytest.terminal.TerminalReporter) -> None:
+        if not self.results:
+            return
+        terminalreporter.write_sep('=','benchmarks')
+        terminalreporter.write_line(f'{"benchmark":60} {"median":>9} {"min":>9} {"commands":>9}  vs. baseline')
+        for name, result in sorted(self.results.items()):
+            baseline = self.baselines.get(name)
+            comparison = 'no baseline' if baseline is None else (
+                f'{result["median"]/baseline["median"]-1:+.0%} time, {result["commands"]-baseline["commands"]:+d} commands'
+            )
+            terminalreporter.write_line(f'{name:60} {result["median"]:8.3f}s {result["min"]:8.3f}s {result["commands"]:9d}  {comparison}')
+
+    def pytest_sessionfinish(self,session:pytest.Session) -> None:
+        if hasattr(session.config,'workerinput'): # pytest-xdist workers leave it to the controller.
+            return
+        if self.save_baseline and self.results:
+            baselines = {**self.baselines, **{name: {'median': result['median'], 'commands': result['commands']} for name, result in self.results.items()}}
+            self.baseline_path.write_text(json.dumps(baselines,indent=2,sort_keys=True)+'\n')
+        if self.json_path is not None:
+            with open(self.json_path,'w') as file:
+                json.dump(self.results,file,indent=2)
@@ -0,0 +1,42 @@
+"""Benchmarks of the hash input: typing the hashes in, setting them in bulk and reading them from a file."""
+from __future__ import annotations
+from typing import TYPE_CHECKING, Callable
+import hashlib
+
+import pytest
+from selenium.webdriver.support.wait import WebDriverWait
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from page_object.side_bar import SideBar
+    from benchmark.recorder import Benchmark
+    from hash_file_generator import GeneratedHashFile
+
+
+HASH_COUNTS = [100,10000,100000]
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.parametrize('hash_count',HASH_COUNTS)]
+
+
+@pytest.mark.parametrize('method',['input_hashes_manually','input_hashes_in_bulk'])
+def test_manual_hash_input(benchmark:Benchmark,side_bar:SideBar,hash_count:int,method:str):
+    hashes = [hashlib.sha1(f'password{index}'.encode()).hexdigest() for index in range(hash_count)]
+    def open_input_settings():
+        return side_bar.goto_add_job().open_input_settings()
+    def input_hashes(input_settings):
+        getattr(input_settings,method)(hashes)
+        return input_settings
+    input_settings = benchmark(input_hashes,setup=open_input_settings)
+    assert input_settings.get_input_hashes() == hashes
+
+
+def test_hash_file_input(benchmark:Benchmark,selenium:WebDriver,side_bar:SideBar,generated_hash_file:Callable[...,GeneratedHashFile],hash_count:int):
+    hash_file = generated_hash_file(hash_count)
+    def open_input_settings():
+        return side_bar.goto_add_job().open_input_settings()
+    def append_hashes(input_settings):
+        input_settings.append_hashes_from_hash_file(hash_file.path)
+        WebDriverWait(selenium,60).until(lambda _: len(input_settings.get_input_hashes()) == hash_count)
+        return input_settings
+    input_settings = benchmark(append_hashes,setup=open_input_settings)
+    assert input_settings.get_input_hashes() == list(hash_file.hashes())
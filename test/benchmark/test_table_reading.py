@@ -0,0 +1,89 @@
+"""Benchmarks of reading and selecting rows of tables at growing numbers of rows."""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import pytest
+from selenium.webdriver.common.by import By
+
+from page_object.job_detail_page import JobDetailPage
+from page_object.common.helper import predicate_in_list
+from page_object.table.dictionary_management_row import DictionaryManagementRow
+from page_object.table.dictionary_selection import DictionarySelection
+from page_object.table.table_manipulation import load_table_elements, activate_elements_from_table_by_list_lookup, iterate_table_elements
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from standin_webadmin.server import StandInWebadmin
+    from page_object.side_bar import SideBar
+    from benchmark.recorder import Benchmark
+
+
+ROWS = [10,100,1000,10000]
+
+LIBRARY_PAGE_SIZE = 50
+"""The largest number of rows per page of the library tables."""
+
+pytestmark = [pytest.mark.benchmark, pytest.mark.parametrize('rows',ROWS)]
+
+
+def test_load_table_elements(benchmark:Benchmark,standin_webadmin:StandInWebadmin,selenium:WebDriver,side_bar:SideBar,rows:int):
+    standin_webadmin.resize(rows)
+    def open_dictionary_selection_table():
+        side_bar.goto_add_job().open_attack_settings().choose_dictionary_mode()
+        return selenium.find_element(By.TAG_NAME,'table')
+    names = benchmark(
+        lambda table: [row.name for row in load_table_elements(selenium,table,DictionarySelection)],
+        setup=open_dictionary_selection_table
+    )
+    assert len(names) == rows
+
+
+def test_iterate_table_elements(benchmark:Benchmark,standin_webadmin:StandInWebadmin,selenium:WebDriver,side_bar:SideBar,rows:int):
+    standin_webadmin.resize(rows)
+    last_name = standin_webadmin.get_library_files('dictionary')[-1]['name']
+    def open_dictionary_table():
+        side_bar.goto_dictionary_library()
+        return selenium.find_element(By.TAG_NAME,'table')
+    found = benchmark(
+        lambda table: predicate_in_list(lambda x: x.name == last_name,iterate_table_elements(selenium,table,DictionaryManagementRow)),
+        setup=open_dictionary_table
+    )
+    assert found.name == last_name
+
+
+def test_find_row_by_name(benchmark:Benchmark,standin_webadmin:StandInWebadmin,side_bar:SideBar,rows:int):
+    standin_webadmin.resize(rows)
+    last_name = standin_webadmin.get_library_files('dictionary')[-1]['name']
+    def find_row_name(page) -> str:
+        with page.find_row_by_name(last_name) as row:
+            return row.name
+    found = benchmark(find_row_name,setup=side_bar.goto_dictionary_library)
+    assert found == last_name
+
+
+def test_activate_elements_from_table_by_list_lookup(benchmark:Benchmark,standin_webadmin:StandInWebadmin,side_bar:SideBar,rows:int):
+    standin_webadmin.resize(rows)
+    files = standin_webadmin.get_library_files('dictionary')
+    wanted = sorted({files[0]['name'], files[rows//2]['name'], files[-1]['name']})
+    benchmark(
+        lambda dictionaries: activate_elements_from_table_by_list_lookup(dictionaries,lambda x: x.name,wanted),
+        setup=lambda: side_bar.goto_add_job().open_attack_settings().choose_dictionary_mode().get_available_dictionaries()
+    )
+
+
+def test_get_available_dictionaries(benchmark:Benchmark,standin_webadmin:StandInWebadmin,side_bar:SideBar,rows:int):
+    standin_webadmin.resize(rows)
+    dictionaries = benchmark(lambda page: page.get_available_dictionaries(),setup=side_bar.goto_dictionary_library)
+    assert len(dictionaries) == min(rows,LIBRARY_PAGE_SIZE)
+
+
+def test_get_workunits(benchmark:Benchmark,standin_webadmin:StandInWebadmin,selenium:WebDriver,side_bar:SideBar,rows:int):
+    standin_webadmin.resize(rows)
+    def open_job_detail_page():
+        job_detail_page = JobDetailPage(selenium,no_ensure_loaded=True)
+        job_detail_page.navigate(standin_webadmin.url,1)
+        job_detail_page.ensure_loaded()
+        job_detail_page.wait_for_network_idle()
+        return job_detail_page
+    workunits = benchmark(lambda page: page.get_workunits(),setup=open_job_detail_page)
+    assert len(workunits) == rows
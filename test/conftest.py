@@ -6,20 +6,30 @@ https://docs.pytest.org/en/6.2.x/fixture.html#conftest-py-sharing-fixtures-acros
 https://docs.pytest.org/en/6.2.x/writing_plugins.html#conftest-py-plugins
 """
 from __future__ import annotations
-from typing import NamedTuple, Tuple, Iterator, TYPE_CHECKING
+from typing import NamedTuple, Tuple, Iterator, Dict, List, Set, Hashable, Callable, TYPE_CHECKING
 from datetime import datetime
-import shutil
+from pathlib import Path
+import os
 
 import pytest
 
-from page_object.login_page import LoginPage
+from page_object.login_page import LoginPage, LoginSession, capture_login_session, restore_login_session
+from page_object.common.exception import InvalidStateError
+from page_object.common.helper import get_webadmin_auth
+from webadmin_api.client import WebadminApiClient
+from timing_breakdown import TimingBreakdownPlugin
+from hash_file_generator import GeneratedHashFile, generate_hash_file
+from file_staging import FileStaging
+from benchmark.recorder import BenchmarkRecorder
+from page_object.common.locator_cache import LOCATOR_CACHE_STATISTICS
+from page_object.common.command_counter import COMMAND_COUNTER
+from page_object.add_job_page.hash_type_catalog import HashTypeCatalog
 
 if TYPE_CHECKING:
-    from pathlib import Path
-    
     import _pytest.config.argparsing
     import _pytest.config
     import _pytest.fixtures
+    import _pytest.reports
     from selenium.webdriver.remote.webdriver import WebDriver
 
     from page_object.dashboard import Dashboard
@@ -28,6 +38,18 @@ if TYPE_CHECKING:
     from page_object.add_job_page.input_settings import InputSettings
 
 
+def unique_name_suffix() -> str:
+    """Returns a string to be appended to names of things the tests create in Webadmin
+    (jobs, uploaded files), so that the names do not collide.
+
+    The string consists of a timestamp with microsecond resolution and the name of the
+    pytest-xdist worker the test runs in ("master" when the tests are not run in parallel),
+    so the names are unique even when the tests run in several worker processes at once.
+    """
+    worker = os.environ.get('PYTEST_XDIST_WORKER','master')
+    return f'{datetime.utcnow():%Y%m%d%H%M%S%f}-{worker}'
+
+
 class Credentials(NamedTuple):
     """Named tuple for Fitcrack login credentials"""
     user_name : str
@@ -49,6 +71,23 @@ def pytest_addoption(parser:_pytest.config.argparsing.Parser):
 
     group = parser.getgroup("fitcrack", "fitcrack")
     group.addoption('--credentials',nargs=2,metavar=('username','password'),help=HELP)
+    group.addoption('--concurrent-cracking',action='store_true',help=(
+        'start the jobs of end-to-end cracking tests without waiting for them to finish; '
+        'the jobs are then waited for concurrently and the result of each test is reported '
+        'once its job finishes'
+    ))
+    group.addoption('--timing-breakdown',action='store_true',help=(
+        'show how the time of the tests splits into sleeps, waits, WebDriver commands and HTTP '
+        'requests, and which page-object methods are the slowest'
+    ))
+    group.addoption('--timing-json',metavar='path',help='write the timing breakdown (see --timing-breakdown) to a JSON file')
+    group.addoption('--benchmark',action='store_true',help=(
+        'run the benchmarks (tests marked with `benchmark`) against the stand-in Webadmin; '
+        'they are skipped otherwise'
+    ))
+    group.addoption('--benchmark-rounds',type=int,default=3,metavar='rounds',help='number of rounds of each benchmark (default: 3)')
+    group.addoption('--benchmark-save-baseline',action='store_true',help='store the results of the benchmarks as their baselines')
+    group.addoption('--benchmark-json',metavar='path',help='write the results of the benchmarks to a JSON file')
 
 
 def pytest_configure(config:_pytest.config.Config):
@@ -57,6 +96,7 @@ def pytest_configure(config:_pytest.config.Config):
     Parameters are first taken from command-line options,
     then pytest configuration files, and finally default values
     are used if parameters aren't input.
+    The timing-breakdown and benchmark plugins are registered here if they are requested.
 
     This is a special function used by pytest.
     Relevant pytest documentation: https://docs.pytest.org/en/6.2.x/reference.html#pytest.hookspec.pytest_configure
@@ -67,6 +107,36 @@ def pytest_configure(config:_pytest.config.Config):
         or ('fitcrack', 'FITCRACK')
     )) #type: ignore
 
+    config.addinivalue_line('markers','command_budget(max_commands): fail the test if it sends more than max_commands WebDriver commands')
+    config.addinivalue_line('markers','destroys_library_asset: the test destroys the library asset it shares with the other tests of its class (see the library_asset fixture)')
+
+    if config.getoption('timing_breakdown') or config.getoption('timing_json'):
+        config.pluginmanager.register(TimingBreakdownPlugin(config.getoption('timing_json')),'fitcrack_timing_breakdown')
+
+    config.addinivalue_line('markers','benchmark: benchmark run against the stand-in Webadmin; skipped unless --benchmark is used')
+    if config.getoption('benchmark'):
+        config.pluginmanager.register(BenchmarkRecorder(
+            save_baseline=config.getoption('benchmark_save_baseline'),
+            json_path=config.getoption('benchmark_json'),
+        ),'fitcrack_benchmark_recorder')
+
+    if getattr(config,'cache',None) is not None: # the cacheprovider plugin may be disabled
+        HashTypeCatalog.cache_directory = Path(config.cache.makedir('fitcrack_hash_type_catalog'))
+
+
+def pytest_collection_modifyitems(config:_pytest.config.Config,items:List[pytest.Item]):
+    """Skips the benchmarks unless the `--benchmark` option is used.
+
+    This is a special function used by pytest.
+    Relevant pytest documentation: https://docs.pytest.org/en/6.2.x/reference.html#pytest.hookspec.pytest_collection_modifyitems
+    """
+    if config.getoption('benchmark'):
+        return
+    skip_benchmark = pytest.mark.skip(reason='benchmarks run only with --benchmark')
+    for item in items:
+        if item.get_closest_marker('benchmark') is not None:
+            item.add_marker(skip_benchmark)
+
 
 def pytest_report_header(config:_pytest.config.Config, startdir):
     """Configures pytest to display the custom test-configuration parameters that are set
@@ -84,10 +154,11 @@ def pytest_report_header(config:_pytest.config.Config, startdir):
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
-    """THIS FUNCTION IS TAKEN VERBATIM FROM THE OFFICIAL PYTEST DOCUMENTATION AT:
+    """THE FIRST PART OF THIS FUNCTION IS TAKEN VERBATIM FROM THE OFFICIAL PYTEST DOCUMENTATION AT:
     <https://docs.pytest.org/en/6.2.x/example/simple.html#making-test-result-information-available-in-fixtures>
 
     This code is responsible for allowing to see the test results in fixtures.
+    It also enforces the WebDriver-command budgets of the tests (see `_enforce_command_budget`).
     """
     # execute all other hooks to obtain the report object
     outcome = yield
@@ -98,6 +169,25 @@ def pytest_runtest_makereport(item, call):
 
     setattr(item, "rep_" + rep.when, rep)
 
+    if rep.when == 'call':
+        _enforce_command_budget(item,rep)
+
+
+def _enforce_command_budget(item:pytest.Item,report:_pytest.reports.TestReport) -> None:
+    """Fails the call phase of a test that sent more WebDriver commands (up to the end of its
+    call phase, see `count_webdriver_commands`) than its `command_budget` marker allows,
+    so that the test itself fails instead of erroring in teardown.
+    """
+    marker = item.get_closest_marker('command_budget')
+    count_before = getattr(item,'webdriver_command_count_before',None)
+    if marker is None or count_before is None or not report.passed:
+        return
+    used = COMMAND_COUNTER.total.count - count_before
+    if used > marker.args[0]:
+        report.outcome = 'failed'
+        report.longrepr = f'The test sent {used} WebDriver commands; its budget is {marker.args[0]}.'
+
+
 @pytest.fixture(scope='session',autouse=True)
 def require_base_url(base_url) -> None:
     """Fixture that fixes a problem in pytest-selenium.
@@ -111,6 +201,46 @@ def require_base_url(base_url) -> None:
             )
 
 
+@pytest.fixture(autouse=True)
+def record_locator_cache_statistics(request:_pytest.fixtures.FixtureRequest) -> Iterator[None]:
+    """Fixture that records how many element lookups the locator caches of page objects
+    saved (hits) and how many they had to perform (misses) during a test.
+    The numbers are stored as user properties of the test (and thus appear e.g. in JUnit XML reports).
+    """
+    hits_before, misses_before = LOCATOR_CACHE_STATISTICS.hits, LOCATOR_CACHE_STATISTICS.misses
+    yield
+    request.node.user_properties.append(('locator_cache_hits',LOCATOR_CACHE_STATISTICS.hits-hits_before))
+    request.node.user_properties.append(('locator_cache_misses',LOCATOR_CACHE_STATISTICS.misses-misses_before))
+
+
+@pytest.fixture(autouse=True)
+def count_webdriver_commands(request:_pytest.fixtures.FixtureRequest) -> Iterator[None]:
+    """Fixture that counts the WebDriver commands a test sends (see the `command_counter` module)
+    and records their number, time and the page-object methods that sent them as user properties
+    of the test.
+
+    A test can limit the number of commands it may send with the `command_budget` marker
+    (e.g. `@pytest.mark.command_budget(500)`); the test fails if it sends more by the end of
+    its call phase (see `pytest_runtest_makereport`).
+    """
+    if 'selenium' not in request.fixturenames:
+        yield
+        return
+    COMMAND_COUNTER.install(request.getfixturevalue('selenium'))
+    count_before, time_before = COMMAND_COUNTER.total.count, COMMAND_COUNTER.total.time
+    request.node.webdriver_command_count_before = count_before
+    by_method_before = {method: statistics.count for method, statistics in COMMAND_COUNTER.by_method.items()}
+    yield
+    used = COMMAND_COUNTER.total.count - count_before
+    request.node.user_properties.append(('webdriver_commands',used))
+    request.node.user_properties.append(('webdriver_command_time',COMMAND_COUNTER.total.time-time_before))
+    request.node.user_properties.append(('webdriver_commands_by_method',{
+        str(method): statistics.count - by_method_before.get(method,0)
+        for method, statistics in COMMAND_COUNTER.by_method.items()
+        if statistics.count != by_method_before.get(method,0)
+    }))
+
+
 @pytest.fixture(scope='session')
 def credentials(pytestconfig:_pytest.config.Config) -> Credentials:
     """Fixture that returns the configured login credentials. Login credentials should be valid."""
@@ -126,14 +256,39 @@ def login_page(selenium:WebDriver,base_url:str) -> LoginPage:
     return login_page
 
 
+@pytest.fixture(scope='session')
+def _login_sessions() -> Dict[Credentials,LoginSession]:
+    """Fixture holding the authenticated browser states captured during the test session,
+    so that tests need not log in through the login page (see `_start_logged_in`).
+    """
+    return {}
+
+
 @pytest.fixture
-def _start_logged_in(login_page:LoginPage,credentials:Credentials) -> Tuple[SideBar,Dashboard]:
+def _start_logged_in(selenium:WebDriver,base_url:str,credentials:Credentials,_login_sessions:Dict[Credentials,LoginSession]) -> Tuple[SideBar,Dashboard]:
     """You probably want to use the side_bar and dashboard fixtures instead.
     
     Fixture that logs into Fitcrack with the provided default credentials supplied to the test
     session, and returns two values, the SideBar object and the Dashboard object.
+
+    Only the first test of the session logs in through the login page; the authenticated state
+    of its browser is captured and later tests restore it (see `restore_login_session`).
+    If Webadmin does not accept the restored state, the login page is used again.
+    Tests of the login page itself should use the `login_page` fixture.
     """
-    return login_page.login(*credentials)
+    session = _login_sessions.get(credentials)
+    if session is not None:
+        try:
+            return restore_login_session(selenium,base_url,session)
+        except InvalidStateError:
+            del _login_sessions[credentials]
+
+    login_page = LoginPage(selenium,no_ensure_loaded=True)
+    login_page.navigate(base_url)
+    login_page.ensure_loaded()
+    side_bar, dashboard = login_page.login(*credentials)
+    _login_sessions[credentials] = capture_login_session(selenium)
+    return side_bar, dashboard
 
 
 @pytest.fixture
@@ -151,13 +306,48 @@ def dashboard(_start_logged_in:Tuple[SideBar,Dashboard]) -> Dashboard:
     return _start_logged_in[1]
 
 
+@pytest.fixture(scope='session')
+def _webadmin_api_client() -> Iterator[Dict[str,WebadminApiClient]]:
+    """You probably want to use the webadmin_api fixture instead.
+
+    Fixture holding the Webadmin API client of the test session (under the key 'client' once it
+    is created), so that all tests share its connections.
+    """
+    holder : Dict[str,WebadminApiClient] = {}
+    yield holder
+    if 'client' in holder:
+        holder['client'].close()
+
+
+@pytest.fixture
+def webadmin_api(selenium:WebDriver,side_bar:SideBar,_webadmin_api_client:Dict[str,WebadminApiClient]) -> WebadminApiClient:
+    """Fixture that returns a client of the Webadmin REST API authenticated as the logged-in user.
+    Use it in fixtures that prepare state for tests where the UI is not what is being tested.
+    """
+    client = _webadmin_api_client.get('client')
+    if client is None:
+        client = _webadmin_api_client['client'] = WebadminApiClient.from_driver(selenium)
+    else:
+        client.set_auth(*get_webadmin_auth(selenium))
+    return client
+
+
+@pytest.fixture
+def job_name(request:_pytest.fixtures.FixtureRequest) -> str:
+    """Fixture that returns a unique name identifying the currently run test, to be used for
+    jobs the test creates.
+    """
+    return f'Job created by an automatic Fitcrack test -- {request.node.name} -- {unique_name_suffix()}'
+
+
 @pytest.fixture
-def add_job_page(side_bar:SideBar,request:_pytest.fixtures.FixtureRequest) -> AddJobPage:
+def add_job_page(side_bar:SideBar,job_name:str) -> AddJobPage:
     """Fixture that returns an AddJobPage object.
-    The name of the test is automatically set to a string identifying the currently run test.
+    The name of the test is automatically set to a string identifying the currently run test
+    (see `job_name`).
     """
     add_job_page = side_bar.goto_add_job()
-    add_job_page.set_job_name(f'Job created by an automatic Fitcrack test -- {request.node.name} -- {datetime.utcnow().isoformat()}')
+    add_job_page.set_job_name(job_name)
     return add_job_page
 
 
@@ -167,39 +357,91 @@ def input_settings(add_job_page:AddJobPage) -> InputSettings:
     return add_job_page.open_input_settings()
 
 
+@pytest.fixture(scope='session')
+def file_staging(tmp_path_factory:pytest.TempPathFactory) -> Iterator[FileStaging]:
+    """Fixture that returns the FileStaging (see the `file_staging` module) which stages the test
+    files of the `test_file_path` fixture. The staged files are removed at the end of the session.
+    """
+    staging = FileStaging(tmp_path_factory.mktemp('staged_files'))
+    yield staging
+    staging.cleanup()
+
+
 @pytest.fixture
-def test_file_path(request:_pytest.fixtures.FixtureRequest) -> Iterator[Path]:
+def test_file_path(request:_pytest.fixtures.FixtureRequest,file_staging:FileStaging) -> Path:
     """Fixture for working with test files in tests.
     This fixture MUST be used with indirect parametrisation.
-    The parameter given MUST be of `pathlib.Path` type (or equivalent).
-    This fixture yields a `Path` object ready to be used with Selenium for uploading files
+    The parameter given MUST be of `pathlib.Path` type (or equivalent);
+    a relative path is taken relative to the repository root.
+    This fixture returns a `Path` object ready to be used with Selenium for uploading files
     through `<input>` elements.
-    The yielded `Path` object is an absolute path to a temporary COPY (!) of the given path.
-    The yielded `Path` object has a timestamp appended to the the filename.
+    The returned `Path` object is an absolute path to a staged file with the content of the given
+    path (a hardlink to a cached copy where possible, see the `file_staging` module), which must
+    not be modified.
+    The returned `Path` object has a timestamp and the name of the test worker appended to the
+    filename (see `unique_name_suffix`).
 
     This is useful for testing Webadmin because sometimes filenames cannot be reused;
-    appending the timestamp ensures that the filenames are unique for each test.
+    appending the suffix ensures that the filenames are unique for each test,
+    even when tests run in parallel.
+    Parametrising with `scope='class'` gives all tests of a class the same file
+    (see `library_asset`).
     """
-    test_file_path:Path = request.param.with_stem(f'{request.param.stem}-{datetime.utcnow():%Y%m%d%H%M%S}') # type: ignore
-    shutil.copyfile(request.param,test_file_path) # type: ignore 
-    yield test_file_path.absolute()
-    test_file_path.unlink()
+    source : Path = request.param # type: ignore
+    return file_staging.stage(source,f'{source.stem}-{unique_name_suffix()}{source.suffix}')
 
-@pytest.fixture
-def test_file_text_content(test_file_path) -> str:
-    """Fixture that returns the text content of the test file supplied by the `test_file_path`
-    fixture. Must be used with the `test_file_path` fixture.
 
-    The test file is opened using `encoding='ascii', errors='surrogateescape'` to support
-    arbitrarily encoded files.
+@pytest.fixture(scope='class')
+def _library_assets() -> Set[Hashable]:
+    """You probably want to use the library_asset fixture instead.
+
+    Fixture holding the keys of the library assets created in the current test class.
     """
-    with open(test_file_path,'r', encoding='ascii', errors='surrogateescape') as file:
-        return file.read()
-    
+    return set()
+
+
 @pytest.fixture
-def test_file_binary_content(test_file_path) -> bytes:
-    """Fixture that returns the binary content of the test file supplied by the `test_file_path`
-    fixture. Must be used with the `test_file_path` fixture.
+def library_asset(request:_pytest.fixtures.FixtureRequest,_library_assets:Set[Hashable]) -> Callable[[Hashable,Callable[[],object]],None]:
+    """Fixture that returns a function `library_asset(key,create)` for creating a library asset
+    (uploading a file, making a Markov file from a dictionary...) once per test class instead of
+    once per test: `create()` is called only by the first test of the class asking for `key`,
+    the following tests share what it created. Use it with a class-scoped `test_file_path`
+    as the key:
+
+    ```
+    @pytest.mark.parametrize('test_file_path',TEST_FILES,indirect=True,scope='class')
+    class TestDictionaryProperUpload:
+        @pytest.fixture(autouse=True)
+        def dictionary_management(self,test_file_path:Path,side_bar:SideBar,library_asset:Callable[...,None]) -> DictionaryManagement:
+            dictionary_management = side_bar.goto_dictionary_library()
+            library_asset(test_file_path,lambda: dictionary_management.upload_dictionary(test_file_path))
+            return dictionary_management
+    ```
+
+    Tests that destroy the asset (like deleting it) must be marked `destroys_library_asset`
+    and should be the last tests of the class; tests running after them create the asset again.
+    If `create()` raises, the asset is not considered created.
+    """
+    def library_asset(key:Hashable,create:Callable[[],object]) -> None:
+        if key not in _library_assets:
+            create()
+            _library_assets.add(key)
+        if request.node.get_closest_marker('destroys_library_asset'):
+            _library_assets.discard(key)
+    return library_asset
+
+
+@pytest.fixture(scope='session')
+def generated_hash_file(tmp_path_factory:pytest.TempPathFactory) -> Callable[...,GeneratedHashFile]:
+    """Fixture that returns a function writing a hash file of a given size (and optionally
+    hash algorithm) to a temporary directory and returning the GeneratedHashFile
+    (see the `hash_file_generator` module), e.g. `generated_hash_file(1000000,'md5')`.
+    Each size and algorithm is generated only once per test session.
     """
-    with open(test_file_path,'rb') as file:
-        return file.read()
+    directory = tmp_path_factory.mktemp('generated_hash_files')
+    hash_files : Dict[Tuple[int,str],GeneratedHashFile] = {}
+    def generate(count:int,algorithm:str='sha1') -> GeneratedHashFile:
+        if (count,algorithm) not in hash_files:
+            hash_files[count,algorithm] = generate_hash_file(directory/f'fc_auto_test_generated_{algorithm}_{count}.txt',count,algorithm)
+        return hash_files[count,algorithm]
+    return generate
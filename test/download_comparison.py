@@ -0,0 +1,153 @@
+"""Comparison of files downloaded from Webadmin with local files, in constant memory.
+
+FileDigest --
+the SHA-256 digest and size of a file's content
+
+digest_file --
+computes the FileDigest of a local file
+
+assert_download_matches --
+checks that a file downloaded from a library table row is the same as a local file
+
+Instead of reading the whole local file and the whole download into memory and comparing them,
+both are streamed through a hash, with line endings normalised on the fly (unless the files are
+compared as binary). Only when the digests differ is the file downloaded once more and compared
+with the local file chunk by chunk, to report where the first difference is.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, Iterator, Union
+import hashlib
+
+from page_object.common.helper import normalise_line_endings
+
+if TYPE_CHECKING:
+    from page_object.table.generic_library_table_row import GenericLibraryTableRow
+
+
+_CHUNK_SIZE = 1024*1024
+"""The number of bytes read from the local file at once."""
+
+
+@dataclass(frozen=True)
+class FileDigest:
+    """The SHA-256 digest (hexadecimal) and size (in bytes) of a file's content."""
+    sha256 : str
+    size : int
+
+
+class _DigestSink:
+    """Binary sink (see `stream_file_webadmin`) that hashes whatever is written into it."""
+    def __init__(self):
+        self._hash = hashlib.sha256()
+        self._size = 0
+
+    def write(self,data:bytes) -> int:
+        self._hash.update(data)
+        self._size += len(data)
+        return len(data)
+
+    def digest(self) -> FileDigest:
+        return FileDigest(self._hash.hexdigest(),self._size)
+
+
+class _FirstDifferenceFound(Exception):
+    """Raised by `_ComparingSink` to stop the download once the first difference is found."""
+
+
+class _ComparingSink:
+    """Binary sink that compares whatever is written into it with the expected chunks of bytes,
+    keeping track of the line the comparison is at.
+    """
+    def __init__(self,expected_chunks:Iterable[bytes]):
+        self._expected_chunks = iter(expected_chunks)
+        self._expected_buffer = b''
+        self.offset = 0
+        """Byte offset of the first difference once found, the number of matching bytes so far otherwise."""
+        self.line = 1
+        self.line_offset = 0
+        """Byte offset of the start of `line`."""
+        self.expected = b''
+        self.actual = b''
+        """The rest of the line where the first difference is (up to 80 bytes) in the expected and actual content."""
+
+    def _read_expected(self,size:int) -> bytes:
+        while len(self._expected_buffer) < size:
+            chunk = next(self._expected_chunks,None)
+            if chunk is None:
+                break
+            self._expected_buffer += chunk
+        data, self._expected_buffer = self._expected_buffer[:size], self._expected_buffer[size:]
+        return data
+
+    def _advance(self,matching:bytes) -> None:
+        newlines = matching.count(b'\n')
+        if newlines:
+            self.line += newlines
+            self.line_offset = self.offset + matching.rindex(b'\n') + 1
+        self.offset += len(matching)
+
+    def write(self,data:bytes) -> int:
+        expected = self._read_expected(len(data))
+        if expected == data:
+            self._advance(data)
+            return len(data)
+        differing = next((i for i, (x, y) in enumerate(zip(expected,data)) if x != y),min(len(expected),len(data)))
+        self._advance(data[:differing])
+        self.expected = (expected[differing:] + self._read_expected(80)).split(b'\n')[0][:80]
+        self.actual = data[differing:].split(b'\n')[0][:80]
+        raise _FirstDifferenceFound
+
+    def finish(self) -> bool:
+        """Returns whether the compared content is the same, after everything has been written."""
+        remaining = self._read_expected(80)
+        self.expected = remaining.split(b'\n')[0]
+        return not remaining
+
+
+def _read_local_file(path:Union[str,Path],as_binary:bool) -> Iterator[bytes]:
+    with open(path,'rb') as file:
+        chunks = iter(lambda: file.read(_CHUNK_SIZE),b'')
+        yield from (chunks if as_binary else normalise_line_endings(chunks))
+
+
+def digest_file(path:Union[str,Path],as_binary:bool=False) -> FileDigest:
+    """Returns the FileDigest of the file at `path`, reading it chunk by chunk.
+    Line endings are normalised to `\n` first, unless `as_binary=True`.
+    """
+    sink = _DigestSink()
+    for chunk in _read_local_file(path,as_binary):
+        sink.write(chunk)
+    return sink.digest()
+
+
+def assert_download_matches(row:GenericLibraryTableRow,expected_path:Union[str,Path],as_binary:bool=False) -> None:
+    """Downloads the file of the library table `row` and checks that it is the same as the file
+    at `expected_path`. Line endings of both are normalised to `\n`, unless `as_binary=True`.
+
+    Raises AssertionError reporting the line (and its byte offset) where the files first differ
+    if they are not the same.
+    """
+    expected_digest = digest_file(expected_path,as_binary)
+    download_sink = _DigestSink()
+    row.download_to(download_sink,as_binary=as_binary)
+    if download_sink.digest() == expected_digest:
+        return
+
+    comparing_sink = _ComparingSink(_read_local_file(expected_path,as_binary))
+    try:
+        row.download_to(comparing_sink,as_binary=as_binary)
+        if comparing_sink.finish():
+            raise AssertionError(
+                f'The downloaded file {row.name} ({download_sink.digest()}) differs from {expected_path} ({expected_digest}), '
+                'but downloading it again gave the expected file.'
+            )
+    except _FirstDifferenceFound:
+        pass
+    raise AssertionError(
+        f'The downloaded file {row.name} ({download_sink.digest()}) differs from {expected_path} ({expected_digest}) '
+        f'first on line {comparing_sink.line} (starting at byte {comparing_sink.line_offset}), byte {comparing_sink.offset}: '
+        f'expected {comparing_sink.expected!r}, got {comparing_sink.actual!r}.'
+    )
@@ -1,43 +1,73 @@
-"""Common fixture and common test-input dataclass used by end-to-end cracking tests.
+"""Common fixture, common test-input dataclass and the concurrent-cracking mode used by
+end-to-end cracking tests.
 
 For detailed information about conftest.py files, see
 https://docs.pytest.org/en/6.2.x/fixture.html#conftest-py-sharing-fixtures-across-multiple-files
 """
 from __future__ import annotations
 from dataclasses import dataclass, KW_ONLY
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
 
 import pytest
+from _pytest.runner import runtestprotocol
+
+from webadmin_api.client import WebadminApiClient
+from webadmin_api.job_watcher import watch_job_until_finished
 
 if TYPE_CHECKING:
-    import _pytest.fixtures
+    import _pytest.reports
     from page_object.add_job_page.add_job_page import AddJobPage
-    
 
 
 @dataclass(frozen=True)
 class GenericE2ECrackingTestInput:
     """A generic dataclass to be inherited from for the use in end-to-end cracking tests.
-    Contains hash type and a list of hashes and their expected cracked output since
+    Contains the hash type (its Hashcat mode, e.g. '100' for SHA1) and a list of hashes and their expected cracked output since
     all end-to-end cracking tests input hashes at the start and check results at the end.
     And contains the maximum time the test should wait for the cracking result after starting
     the job (in seconds); the default wait time is one hour.
     """
-    hash_type:str
+    hash_mode:str
     hashes:List[tuple[str,str]]
     _: KW_ONLY
     wait_time:float = 600
 
 
+@dataclass
+class PendingCrackingJob:
+    """A job of an end-to-end cracking test that was started in the concurrent-cracking mode
+    (see `e2e_cracking_test`) and whose result has not been checked yet.
+    `webadmin_api` is a client of the job's own, as the jobs are waited for in separate threads.
+    `deadline` is the `time.monotonic()` time by which the job must finish.
+    """
+    job_id:int
+    testdata:GenericE2ECrackingTestInput
+    webadmin_api:WebadminApiClient
+    deadline:float
+
+
 @pytest.fixture
-def e2e_cracking_test(add_job_page:AddJobPage,testdata:GenericE2ECrackingTestInput,request:_pytest.fixtures.FixtureRequest):
+def e2e_cracking_test(add_job_page:AddJobPage,webadmin_api:WebadminApiClient,testdata:GenericE2ECrackingTestInput):
     """Fixture for end-to-end cracking tests.
     
     Before the test, it inputs hashes (using the manual mode) and selects the hash type.
     The name of the cracking job is set to indicate the currently run test.
-    It then yields control to the test function so that the test can set up the cracking task.
-    After the test function ends, the fixture starts the cracking job, waits for the cracking job
-    to end, and then checks the output of the cracking task and compares it to the test data.
+    The test function then sets up the cracking task.
+    After the test function passes, `pytest_runtest_call` starts the cracking job, waits for the
+    cracking job to end (watching its state through the Webadmin API), and then checks the output
+    of the cracking task and compares it to the test data, so that a wrong output fails the test
+    itself. The states the job went through and the times they were first seen are recorded as
+    the `job_state_transitions` user property of the test.
+
+    Besides the setup, the fixture marks the tests the hooks of this module apply to (they look
+    for it in the fixture names of the test) and makes `webadmin_api` available to them in the
+    fixture values of the test, so it has to stay even though it has no teardown.
+
+    With the `--concurrent-cracking` option, the job is not waited for; it is only started and
+    `pytest_runtest_protocol` waits for the jobs of all the cracking tests at once and reports
+    the results of the tests as their jobs finish.
 
     This fixture expects Webadmin be on the Add Job page at the beginning and end of the test.
 
@@ -45,18 +75,108 @@ def e2e_cracking_test(add_job_page:AddJobPage,testdata:GenericE2ECrackingTestInp
     GenericE2ECrackingTestInput or derived object (see concrete test implementations for example.)
     """
     input_settings = add_job_page.open_input_settings()
-    input_settings.select_hash_type_exactly(testdata.hash_type)
+    input_settings.select_hash_type_by_mode(testdata.hash_mode)
     input_settings.input_hashes_manually([x[0] for x in testdata.hashes])
-    
-    yield
-    
-    #We want to run asserts only if the the test code does not raise an exception
-    #The _rep attributes do not exist by default; see /test/conftest.py::pytest_runtest_makereport
-    #to understand how these are made available.
-    if request.node.rep_setup.passed and request.node.rep_call.passed: # type: ignore
-        job_detail_page = add_job_page.create_job()
-        assert job_detail_page.get_job_state() == 'Ready'
-        job_detail_page.start_job()
-        job_detail_page.wait_until_job_finished(testdata.wait_time)
-        worked_on_hashes = job_detail_page.get_hashes()
-        assert set(worked_on_hashes) == set(testdata.hashes)
\ No newline at end of file
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_runtest_call(item:pytest.Item) -> None:
+    """Runs the cracking job of an end-to-end cracking test (see `e2e_cracking_test`) as a part of
+    the call phase of the test, after the test function has set up the cracking task.
+    The hook runs only if the test function passed.
+
+    This is a special function used by pytest.
+    Relevant pytest documentation: https://docs.pytest.org/en/6.2.x/reference.html#pytest.hookspec.pytest_runtest_call
+    """
+    if 'e2e_cracking_test' not in getattr(item,'fixturenames',()):
+        return
+    add_job_page:AddJobPage = item.funcargs['add_job_page'] # type: ignore
+    testdata:GenericE2ECrackingTestInput = item.funcargs['testdata'] # type: ignore
+    job_detail_page = add_job_page.create_job()
+    assert job_detail_page.get_job_state() == 'Ready'
+    job_detail_page.start_job()
+    if item.config.getoption('concurrent_cracking'):
+        item.pending_cracking_job = PendingCrackingJob( # type: ignore
+            job_detail_page.get_job_id(),testdata,WebadminApiClient.from_driver(add_job_page.driver),time.monotonic()+testdata.wait_time
+        )
+        return
+    webadmin_api:WebadminApiClient = item.funcargs['webadmin_api'] # type: ignore
+    transitions = job_detail_page.wait_until_job_finished(testdata.wait_time,webadmin_api)
+    item.user_properties.append(('job_state_transitions',[tuple(transition) for transition in transitions]))
+    worked_on_hashes = job_detail_page.get_hashes()
+    assert set(worked_on_hashes) == set(testdata.hashes), f'The job gave {worked_on_hashes}, expected {testdata.hashes}.'
+
+
+def _check_pending_cracking_job(item:pytest.Item,call_report:_pytest.reports.TestReport) -> None:
+    """Waits for the job of a test run in the concurrent-cracking mode to finish and compares its
+    output to the test data; raises AssertionError if they differ.
+    The `job_state_transitions` user property is added to the held-back `call_report` too,
+    as the report copied the user properties of the test when it was made.
+    """
+    job:PendingCrackingJob = item.pending_cracking_job # type: ignore
+    try:
+        transitions = watch_job_until_finished(job.webadmin_api,job.job_id,max(job.deadline-time.monotonic(),0))
+        job_state_transitions = ('job_state_transitions',[tuple(transition) for transition in transitions])
+        item.user_properties.append(job_state_transitions)
+        call_report.user_properties.append(job_state_transitions)
+        worked_on_hashes = job.webadmin_api.get_job_hashes(job.job_id)
+    finally:
+        job.webadmin_api.close()
+    assert set(worked_on_hashes) == set(job.testdata.hashes), f'Job {job.job_id} gave {worked_on_hashes}, expected {job.testdata.hashes}.'
+
+
+_pending_items : List[Tuple[pytest.Item,List[_pytest.reports.TestReport]]] = []
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item:pytest.Item, nextitem:Optional[pytest.Item]) -> Optional[bool]:
+    """Runs the tests in the concurrent-cracking mode (the `--concurrent-cracking` option).
+
+    Only the end-to-end cracking tests (those using `e2e_cracking_test`) are run by this hook;
+    other tests are left to the other implementations of the hook. The cracking tests run as
+    usual, except that the reports of the tests that started a cracking job are held back.
+    Once the last of the consecutive cracking tests has run, the jobs of all the held-back tests
+    are waited for concurrently, each in its own thread with its own Webadmin API client.
+    The result of each test is reported as soon as its job finishes; a job that does not give
+    the expected output fails the call phase of its test, as it does without the option.
+
+    This is a special function used by pytest.
+    Relevant pytest documentation: https://docs.pytest.org/en/6.2.x/reference.html#pytest.hookspec.pytest_runtest_protocol
+    """
+    if not item.config.getoption('concurrent_cracking') or 'e2e_cracking_test' not in getattr(item,'fixturenames',()):
+        return None
+
+    item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+    reports = runtestprotocol(item, nextitem=nextitem, log=False)
+    if hasattr(item,'pending_cracking_job'):
+        _pending_items.append((item,reports))
+    else:
+        _log_reports(item,reports)
+
+    if _pending_items and (nextitem is None or 'e2e_cracking_test' not in getattr(nextitem,'fixturenames',())):
+        pending = {item: reports for item, reports in _pending_items}
+        _pending_items.clear()
+        call_reports = {
+            pending_item: next(report for report in reports if report.when == 'call')
+            for pending_item, reports in pending.items()
+        }
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            futures = {
+                executor.submit(_check_pending_cracking_job,pending_item,call_reports[pending_item]): pending_item
+                for pending_item in pending
+            }
+            for future in as_completed(futures):
+                pending_item = futures[future]
+                if future.exception() is not None:
+                    call_report = call_reports[pending_item]
+                    call_report.outcome = 'failed'
+                    call_report.longrepr = f'{type(future.exception()).__name__}: {future.exception()}'
+                _log_reports(pending_item,pending[pending_item])
+    return True
+
+
+def _log_reports(item:pytest.Item,reports:List[_pytest.reports.TestReport]) -> None:
+    """Logs the reports of a test, as pytest would right after running it."""
+    for report in reports:
+        item.ihook.pytest_runtest_logreport(report=report)
+    item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
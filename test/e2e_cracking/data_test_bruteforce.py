@@ -5,7 +5,7 @@ from page_object.add_job_page.brute_force_attack_settings import MarkovMode
 
 testdata = [
     BruteForceTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('9282dbcb46212929fcc2bdfcc4836ea694465dc7', 'ZDARXX'),
             ('26b0da18d000abc9f5804395cb5bcfe22f253151', 'AAABBB'),
@@ -20,7 +20,7 @@ testdata = [
         markov_threshold=None
     ),
     BruteForceTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('9282dbcb46212929fcc2bdfcc4836ea694465dc7', 'ZDARXX'),
             ('26b0da18d000abc9f5804395cb5bcfe22f253151', 'AAABBB'),
@@ -35,7 +35,7 @@ testdata = [
         markov_threshold=None
     ),
     BruteForceTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('9282dbcb46212929fcc2bdfcc4836ea694465dc7', ''),
             ('26b0da18d000abc9f5804395cb5bcfe22f253151', ''),
@@ -50,7 +50,7 @@ testdata = [
         markov_threshold=7
     ),
     BruteForceTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('9282dbcb46212929fcc2bdfcc4836ea694465dc7', ''),
             ('26b0da18d000abc9f5804395cb5bcfe22f253151', 'AAABBB'),
@@ -65,7 +65,7 @@ testdata = [
         markov_threshold=7
     ),
     BruteForceTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('9282dbcb46212929fcc2bdfcc4836ea694465dc7', 'ZDARXX'),
             ('26b0da18d000abc9f5804395cb5bcfe22f253151', 'AAABBB'),
@@ -80,7 +80,7 @@ testdata = [
         markov_threshold=None
     ),
     BruteForceTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('9282dbcb46212929fcc2bdfcc4836ea694465dc7', ''),
             ('26b0da18d000abc9f5804395cb5bcfe22f253151', ''),
@@ -95,7 +95,7 @@ testdata = [
         markov_threshold=7
     ),
     BruteForceTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('9282dbcb46212929fcc2bdfcc4836ea694465dc7', ''),
             ('26b0da18d000abc9f5804395cb5bcfe22f253151', 'AAABBB'),
@@ -110,7 +110,7 @@ testdata = [
         markov_threshold=7
     ),
     BruteForceTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('b26940e5e462f4d4767933d02e870b00b884d0c5', 'HEX<bbc8cdcf>'),
         ],
@@ -5,7 +5,7 @@ from .test_combination import CombinationTestInput
 
 testdata = [
     CombinationTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('75da3d6038c28b57c8b3b34ae2f8121357bae1b9', 'footballwhatever'),
             ('6514189a7cbd9c61518d560d67690e08984e26da', ''),
@@ -19,7 +19,7 @@ testdata = [
         right_rule=''
     ),
     CombinationTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('75da3d6038c28b57c8b3b34ae2f8121357bae1b9', ''),
             ('6514189a7cbd9c61518d560d67690e08984e26da', 'football-whatever'),
@@ -33,7 +33,7 @@ testdata = [
         right_rule=''
     ),
     CombinationTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('75da3d6038c28b57c8b3b34ae2f8121357bae1b9', ''),
             ('6514189a7cbd9c61518d560d67690e08984e26da', ''),
@@ -47,7 +47,7 @@ testdata = [
         right_rule='$!'
     ),
     CombinationTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('75da3d6038c28b57c8b3b34ae2f8121357bae1b9', ''),
             ('6514189a7cbd9c61518d560d67690e08984e26da', ''),
@@ -61,7 +61,7 @@ testdata = [
         right_rule='u $! $! $!'
     ),
     CombinationTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('75da3d6038c28b57c8b3b34ae2f8121357bae1b9', 'footballwhatever'),
             ('6514189a7cbd9c61518d560d67690e08984e26da', ''),
@@ -75,7 +75,7 @@ testdata = [
         right_rule=''
     ),
     CombinationTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('75da3d6038c28b57c8b3b34ae2f8121357bae1b9', ''),
             ('6514189a7cbd9c61518d560d67690e08984e26da', ''),
@@ -5,7 +5,7 @@ from .test_dictionary import DictionaryTestInput
 
 testdata = [
     DictionaryTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('c0b51c46e4dcde6189e48ec9695fe55efc0ea703', 'strawberry'),
             ('c0baf4391defd68bf678f0a5ca2b69f828177ddf', ''),
@@ -17,7 +17,7 @@ testdata = [
         rule_files=[]
     ),
     DictionaryTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('c0b51c46e4dcde6189e48ec9695fe55efc0ea703', 'strawberry'),
             ('c0baf4391defd68bf678f0a5ca2b69f828177ddf', 'str@wberry'),
@@ -29,7 +29,7 @@ testdata = [
         rule_files=['leetspeak.rule']
     ),
     DictionaryTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('c0b51c46e4dcde6189e48ec9695fe55efc0ea703', 'strawberry'),
             ('c0baf4391defd68bf678f0a5ca2b69f828177ddf', ''),
@@ -41,7 +41,7 @@ testdata = [
         rule_files=['toggles1.rule']
     ),
     DictionaryTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('c0b51c46e4dcde6189e48ec9695fe55efc0ea703', 'strawberry'),
             ('c0baf4391defd68bf678f0a5ca2b69f828177ddf', ''),
@@ -53,7 +53,7 @@ testdata = [
         rule_files=[]
     ),
     DictionaryTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('c0b51c46e4dcde6189e48ec9695fe55efc0ea703', 'strawberry'),
             ('c0baf4391defd68bf678f0a5ca2b69f828177ddf', 'str@wberry'),
@@ -65,7 +65,7 @@ testdata = [
         rule_files=['leetspeak.rule']
     ),
     DictionaryTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('c0b51c46e4dcde6189e48ec9695fe55efc0ea703', 'strawberry'),
             ('c0baf4391defd68bf678f0a5ca2b69f828177ddf', ''),
@@ -5,7 +5,7 @@ from .test_hybrid import HybridTestInput, HybridMode
 
 testdata = [
     HybridTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('06a3f6380a7f9a76462e2edbdaefe718eb9ea033', 'jurgen420'),
             ('0085411372df2865c07d45c20345caedbfdae958', ''),
@@ -19,7 +19,7 @@ testdata = [
         mask='?d?d?d'
     ),
     HybridTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('06a3f6380a7f9a76462e2edbdaefe718eb9ea033', ''),
             ('0085411372df2865c07d45c20345caedbfdae958', ''),
@@ -33,7 +33,7 @@ testdata = [
         mask='?l?l?l'
     ),
     HybridTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('06a3f6380a7f9a76462e2edbdaefe718eb9ea033', ''),
             ('0085411372df2865c07d45c20345caedbfdae958', ''),
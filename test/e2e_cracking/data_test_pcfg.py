@@ -5,7 +5,7 @@ from .test_pcfg import PCFGTestInput
 
 testdata = [
     PCFGTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('5254792d5579984f98c41d1858e1722b2dbcc6b3', 'eminem'),
             ('cfbdc287325676c27264f4208a9cddbbf99f8603', ''),
@@ -18,7 +18,7 @@ testdata = [
         keyspace_limit=None
     ),
     PCFGTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('5254792d5579984f98c41d1858e1722b2dbcc6b3', ''),
             ('cfbdc287325676c27264f4208a9cddbbf99f8603', ''),
@@ -31,7 +31,7 @@ testdata = [
         keyspace_limit=None
     ),
     PCFGTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('5254792d5579984f98c41d1858e1722b2dbcc6b3', ''),
             ('cfbdc287325676c27264f4208a9cddbbf99f8603', ''),
@@ -45,7 +45,7 @@ testdata = [
         wait_time=3600
     ),
     PCFGTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('5254792d5579984f98c41d1858e1722b2dbcc6b3', 'eminem'),
             ('cfbdc287325676c27264f4208a9cddbbf99f8603', ''),
@@ -58,7 +58,7 @@ testdata = [
         keyspace_limit=None
     ),
     PCFGTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('5254792d5579984f98c41d1858e1722b2dbcc6b3', ''),
             ('cfbdc287325676c27264f4208a9cddbbf99f8603', ''),
@@ -71,7 +71,7 @@ testdata = [
         keyspace_limit=None
     ),
     PCFGTestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('5254792d5579984f98c41d1858e1722b2dbcc6b3', ''),
             ('cfbdc287325676c27264f4208a9cddbbf99f8603', ''),
@@ -4,7 +4,7 @@ from .test_prince import PRINCETestInput
 
 testdata = [
     PRINCETestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('22fa6121da96f43a106e413e65d4f9089c53824c', ''),
             ('a51dda7c7ff50b61eaea0444371f4a6a9301e501', 'john'),
@@ -26,7 +26,7 @@ testdata = [
         random_rule_count=0
     ),
     PRINCETestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('f5f6a8e1a321eb4c46e14159a6120952f302e828', 'SunSun'),
             ('0832bccfc73b4d805820820933a3c92db4652a5a', 'Sunjohn')
@@ -43,7 +43,7 @@ testdata = [
         random_rule_count=0
     ),
     PRINCETestInput(
-        hash_type='sha1',
+        hash_mode='100', # SHA1
         hashes=[
             ('a6aea12209b10b7a778aa6f04147f95381777f76', 'testAbc'),
             ('99efaa0e32d2ce548b466cfe9ae3d0b46c7e5262', ''),
@@ -1,10 +1,11 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 from pathlib import Path
 
 import pytest
 
 from page_object.common.helper import predicate_in_list
+from download_comparison import assert_download_matches
 
 if TYPE_CHECKING:
     from page_object.side_bar import SideBar
@@ -16,25 +17,24 @@ TEST_FILES = [
     pytest.param(Path('./test/e2e_library/charsets/fc_auto_test_charset_correct.hcchr'),id='file_ext_hcchr')
 ]
 
-@pytest.mark.parametrize('test_file_path',TEST_FILES,indirect=True)
+@pytest.mark.parametrize('test_file_path',TEST_FILES,indirect=True,scope='class')
 class TestCharsetProperUpload:
     @pytest.fixture(autouse=True)
-    def charset_management(self, test_file_path:Path, side_bar:SideBar) -> CharsetManagement:
+    def charset_management(self, test_file_path:Path, side_bar:SideBar, library_asset:Callable[...,None]) -> CharsetManagement:
         charset_management = side_bar.goto_charset_library()
-        charset_management.upload_charset(test_file_path)
+        library_asset(test_file_path,lambda: charset_management.upload_charset(test_file_path))
         return charset_management
     
     def test_upload_did_not_fail(self):
         assert True
 
     def test_charset_appears_in_list(self,test_file_path:Path,charset_management:CharsetManagement):
-        assert predicate_in_list(lambda x: x.name == test_file_path.stem, charset_management.get_available_charset_files())
+        with charset_management.find_row_by_name(test_file_path.stem) as row:
+            assert row.name == test_file_path.stem
     
-    def test_download_gives_same_file(self,test_file_path:Path,test_file_text_content:str,charset_management:CharsetManagement):
-        uploaded_charset = predicate_in_list(lambda x: x.name == test_file_path.stem, charset_management.get_available_charset_files())
-        downloaded_file = uploaded_charset.download()
-
-        assert test_file_text_content == downloaded_file
+    def test_download_gives_same_file(self,test_file_path:Path,charset_management:CharsetManagement):
+        with charset_management.find_row_by_name(test_file_path.stem) as uploaded_charset:
+            assert_download_matches(uploaded_charset,test_file_path)
     
     def test_charset_appears_in_attack_settings(self,test_file_path:Path,side_bar:SideBar):
         add_job_page = side_bar.goto_add_job()
@@ -42,8 +42,9 @@ class TestCharsetProperUpload:
         brute_force_attack_settings = attack_settings.choose_brute_force_mode()
         assert predicate_in_list(lambda x: x.name == test_file_path.stem, brute_force_attack_settings.get_available_charsets())
 
+    @pytest.mark.destroys_library_asset
     def test_delete(self,test_file_path:Path,charset_management:CharsetManagement):
-        uploaded_charset = predicate_in_list(lambda x: x.name == test_file_path.stem, charset_management.get_available_charset_files())
-        uploaded_charset.delete()
-        with pytest.raises(ValueError):
-            predicate_in_list(lambda x: x.name == test_file_path.stem, charset_management.get_available_charset_files())
+        with charset_management.find_row_by_name(test_file_path.stem) as uploaded_charset:
+            uploaded_charset.delete()
+        with pytest.raises(ValueError), charset_management.find_row_by_name(test_file_path.stem):
+            pass
@@ -1,10 +1,11 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 from pathlib import Path
 
 import pytest
 
 from page_object.common.helper import predicate_in_list
+from download_comparison import assert_download_matches, digest_file
 
 if TYPE_CHECKING:
     from page_object.side_bar import SideBar
@@ -15,34 +16,41 @@ TEST_FILES = [
     Path('./test/e2e_library/dictionary/fc_auto_test_dictionary_correct.txt')
 ]
 
-@pytest.mark.parametrize('test_file_path',TEST_FILES, indirect=True)
+@pytest.mark.parametrize('test_file_path',TEST_FILES, indirect=True,scope='class')
 class TestDictionaryProperUpload:
     @pytest.fixture(autouse=True)
-    def dictionary_management(self, test_file_path:Path,side_bar:SideBar) -> DictionaryManagement:
+    def dictionary_management(self, test_file_path:Path,side_bar:SideBar, library_asset:Callable[...,None]) -> DictionaryManagement:
         dictionary_management = side_bar.goto_dictionary_library()
-        dictionary_management.upload_dictionary(test_file_path)
+        library_asset(test_file_path,lambda: dictionary_management.upload_dictionary(test_file_path))
         return dictionary_management
     
     def test_upload_did_not_fail(self):
         assert True
 
     def test_dict_appears_in_list(self,test_file_path:Path,dictionary_management:DictionaryManagement):
-        assert predicate_in_list(lambda x: x.name == test_file_path.name, dictionary_management.get_available_dictionaries())
+        with dictionary_management.find_row_by_name(test_file_path.name) as row:
+            assert row.name == test_file_path.name
     
-    def test_download_gives_same_file(self,test_file_path:Path,test_file_text_content:str,dictionary_management:DictionaryManagement):
-        uploaded_dictionary = predicate_in_list(lambda x: x.name == test_file_path.name, dictionary_management.get_available_dictionaries())
-        downloaded_file = uploaded_dictionary.download()
+    def test_download_gives_same_file(self,test_file_path:Path,dictionary_management:DictionaryManagement):
+        with dictionary_management.find_row_by_name(test_file_path.name) as uploaded_dictionary:
+            assert_download_matches(uploaded_dictionary,test_file_path)
+
+    def test_download_to_path_gives_same_file(self,test_file_path:Path,dictionary_management:DictionaryManagement,tmp_path:Path):
+        downloaded_path = tmp_path / test_file_path.name
+        with dictionary_management.find_row_by_name(test_file_path.name) as uploaded_dictionary:
+            written = uploaded_dictionary.download_to(downloaded_path)
+        assert written == downloaded_path.stat().st_size
+        assert digest_file(downloaded_path) == digest_file(test_file_path)
 
-        assert test_file_text_content == downloaded_file
-    
     def test_dictionary_appears_in_attack_settings(self,test_file_path:Path,side_bar:SideBar):
         add_job_page = side_bar.goto_add_job()
         attack_settings = add_job_page.open_attack_settings()
         dictionary_attack_settings = attack_settings.choose_dictionary_mode()
         assert predicate_in_list(lambda x: x.name == test_file_path.name, dictionary_attack_settings.get_available_dictionaries())
 
+    @pytest.mark.destroys_library_asset
     def test_delete(self,test_file_path:Path,dictionary_management:DictionaryManagement):
-        uploaded_dictionary = predicate_in_list(lambda x: x.name == test_file_path.name, dictionary_management.get_available_dictionaries())
-        uploaded_dictionary.delete()
-        with pytest.raises(ValueError):
-            predicate_in_list(lambda x: x.name == test_file_path.name, dictionary_management.get_available_dictionaries())
+        with dictionary_management.find_row_by_name(test_file_path.name) as uploaded_dictionary:
+            uploaded_dictionary.delete()
+        with pytest.raises(ValueError), dictionary_management.find_row_by_name(test_file_path.name):
+            pass
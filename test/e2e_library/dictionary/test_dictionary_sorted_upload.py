@@ -1,10 +1,11 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 from pathlib import Path
 
 import pytest
 
 from page_object.common.helper import predicate_in_list
+from download_comparison import assert_download_matches
 
 if TYPE_CHECKING:
     from page_object.side_bar import SideBar
@@ -13,31 +14,26 @@ if TYPE_CHECKING:
 TEST_FILES = [
     Path('./test/e2e_library/dictionary/fc_auto_test_dictionary_unsorted.txt')
 ]
+SORTED_FILE = Path('./test/e2e_library/dictionary/fc_auto_test_dictionary_sorted.txt')
 
-@pytest.mark.parametrize('test_file_path',TEST_FILES,indirect=True)
+@pytest.mark.parametrize('test_file_path',TEST_FILES,indirect=True,scope='class')
 class TestDictionarySortedUpload:
     @pytest.fixture(autouse=True)
-    def dictionary_management(self, test_file_path:Path, side_bar:SideBar) -> DictionaryManagement:
+    def dictionary_management(self, test_file_path:Path, side_bar:SideBar, library_asset:Callable[...,None]) -> DictionaryManagement:
         dictionary_management = side_bar.goto_dictionary_library()
-        dictionary_management.upload_dictionary(test_file_path,sort_on_upload=True)
+        library_asset(test_file_path,lambda: dictionary_management.upload_dictionary(test_file_path,sort_on_upload=True))
         return dictionary_management
     
-    @pytest.fixture()
-    def sorted_file_content(self) -> str:
-        with open('./test/e2e_library/dictionary/fc_auto_test_dictionary_sorted.txt','r') as file:
-            return file.read()
-
     def test_upload_did_not_fail(self):
         assert True
 
     def test_dict_appears_in_list(self,test_file_path:Path,dictionary_management:DictionaryManagement):
-        assert predicate_in_list(lambda x: x.name == test_file_path.name, dictionary_management.get_available_dictionaries())
+        with dictionary_management.find_row_by_name(test_file_path.name) as row:
+            assert row.name == test_file_path.name
     
-    def test_download_gives_sorted_file(self,test_file_path:Path,sorted_file_content:str,dictionary_management:DictionaryManagement):
-        uploaded_dictionary = predicate_in_list(lambda x: x.name == test_file_path.name, dictionary_management.get_available_dictionaries())
-        downloaded_file = uploaded_dictionary.download()
-
-        assert sorted_file_content == downloaded_file
+    def test_download_gives_sorted_file(self,test_file_path:Path,dictionary_management:DictionaryManagement):
+        with dictionary_management.find_row_by_name(test_file_path.name) as uploaded_dictionary:
+            assert_download_matches(uploaded_dictionary,SORTED_FILE)
     
     def test_dictionary_appears_in_attack_settings(self,test_file_path:Path,side_bar:SideBar):
         add_job_page = side_bar.goto_add_job()
@@ -45,8 +41,9 @@ class TestDictionarySortedUpload:
         dictionary_attack_settings = attack_settings.choose_dictionary_mode()
         assert predicate_in_list(lambda x: x.name == test_file_path.name, dictionary_attack_settings.get_available_dictionaries())
 
+    @pytest.mark.destroys_library_asset
     def test_delete(self,test_file_path:Path,dictionary_management:DictionaryManagement):
-        uploaded_dictionary = predicate_in_list(lambda x: x.name == test_file_path.name, dictionary_management.get_available_dictionaries())
-        uploaded_dictionary.delete()
-        with pytest.raises(ValueError):
-            predicate_in_list(lambda x: x.name == test_file_path.name, dictionary_management.get_available_dictionaries())
+        with dictionary_management.find_row_by_name(test_file_path.name) as uploaded_dictionary:
+            uploaded_dictionary.delete()
+        with pytest.raises(ValueError), dictionary_management.find_row_by_name(test_file_path.name):
+            pass
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 from pathlib import Path
 
 import pytest
@@ -14,21 +14,22 @@ TEST_FILES = [
     pytest.param(Path('./test/e2e_library/dictionary/fc_auto_test_dictionary_correct.txt'))
 ]
 
-@pytest.mark.parametrize('test_file_path',TEST_FILES,indirect=True)
+@pytest.mark.parametrize('test_file_path',TEST_FILES,indirect=True,scope='class')
 class TestMarkovFromDictionary:
     @pytest.fixture(autouse=True)
-    def markov_file_management(self, test_file_path:Path, side_bar:SideBar) -> MarkovFileManagement:
-        dictionary_management = side_bar.goto_dictionary_library()
-        dictionary_management.upload_dictionary(test_file_path)
-        markov_file_management = side_bar.goto_markov_file_library()
-        markov_file_management.make_markov_file_from_dictionary(test_file_path.name)
-        return markov_file_management
+    def markov_file_management(self, test_file_path:Path, side_bar:SideBar, library_asset:Callable[...,None]) -> MarkovFileManagement:
+        def upload_dictionary_and_make_markov_file():
+            side_bar.goto_dictionary_library().upload_dictionary(test_file_path)
+            side_bar.goto_markov_file_library().make_markov_file_from_dictionary(test_file_path.name)
+        library_asset(test_file_path,upload_dictionary_and_make_markov_file)
+        return side_bar.goto_markov_file_library()
 
     def test_creation_did_not_fail(self):
         assert True
 
     def test_appears_in_list(self,test_file_path:Path,markov_file_management:MarkovFileManagement):
-        assert predicate_in_list(lambda x: x.name == test_file_path.with_suffix('.hcstat2').name, markov_file_management.get_available_markov_files())
+        with markov_file_management.find_row_by_name(test_file_path.with_suffix('.hcstat2').name) as row:
+            assert row.name == test_file_path.with_suffix('.hcstat2').name
     
     def test_appears_in_attack_settings(self,test_file_path:Path,side_bar:SideBar):
         add_job_page = side_bar.goto_add_job()
@@ -36,8 +37,9 @@ class TestMarkovFromDictionary:
         brute_force_attack_settings = attack_settings.choose_brute_force_mode()
         predicate_in_list(lambda x: x.name == test_file_path.with_suffix('.hcstat2').name, brute_force_attack_settings.get_available_markov_files())
 
+    @pytest.mark.destroys_library_asset
     def test_delete(self,test_file_path:Path,markov_file_management:MarkovFileManagement):
-        uploaded_markov_file = predicate_in_list(lambda x: x.name == test_file_path.with_suffix('.hcstat2').name, markov_file_management.get_available_markov_files())
-        uploaded_markov_file.delete()
-        with pytest.raises(ValueError):
-            predicate_in_list(lambda x: x.name == test_file_path.with_suffix('.hcstat2').name, markov_file_management.get_available_markov_files())
+        with markov_file_management.find_row_by_name(test_file_path.with_suffix('.hcstat2').name) as uploaded_markov_file:
+            uploaded_markov_file.delete()
+        with pytest.raises(ValueError), markov_file_management.find_row_by_name(test_file_path.with_suffix('.hcstat2').name):
+            pass
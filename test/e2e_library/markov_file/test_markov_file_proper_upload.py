@@ -1,10 +1,11 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 from pathlib import Path
 
 import pytest
 
 from page_object.common.helper import predicate_in_list
+from download_comparison import assert_download_matches
 
 if TYPE_CHECKING:
     from page_object.side_bar import SideBar
@@ -14,25 +15,24 @@ TEST_FILES = [
     pytest.param(Path('./test/e2e_library/markov_file/fc_auto_test_markov_file_correct.hcstat2'))
 ]
 
-@pytest.mark.parametrize('test_file_path',TEST_FILES,indirect=True)
+@pytest.mark.parametrize('test_file_path',TEST_FILES,indirect=True,scope='class')
 class TestMarkovFileProperUpload:
     @pytest.fixture(autouse=True)
-    def markov_file_management(self, test_file_path:Path, side_bar:SideBar) -> MarkovFileManagement:
+    def markov_file_management(self, test_file_path:Path, side_bar:SideBar, library_asset:Callable[...,None]) -> MarkovFileManagement:
         markov_file_management = side_bar.goto_markov_file_library()
-        markov_file_management.upload_markov_file(test_file_path)
+        library_asset(test_file_path,lambda: markov_file_management.upload_markov_file(test_file_path))
         return markov_file_management
 
     def test_upload_did_not_fail(self):
         assert True
 
     def test_appears_in_list(self,test_file_path:Path,markov_file_management:MarkovFileManagement):
-        assert predicate_in_list(lambda x: x.name == test_file_path.name, markov_file_management.get_available_markov_files())
+        with markov_file_management.find_row_by_name(test_file_path.name) as row:
+            assert row.name == test_file_path.name
     
-    def test_download_gives_same_file(self,test_file_path:Path,test_file_binary_content:bytes,markov_file_management:MarkovFileManagement):
-        uploaded_markov_file = predicate_in_list(lambda x: x.name == test_file_path.name, markov_file_management.get_available_markov_files())
-        downloaded_file = uploaded_markov_file.download(as_binary=True)
-
-        assert test_file_binary_content == downloaded_file
+    def test_download_gives_same_file(self,test_file_path:Path,markov_file_management:MarkovFileManagement):
+        with markov_file_management.find_row_by_name(test_file_path.name) as uploaded_markov_file:
+            assert_download_matches(uploaded_markov_file,test_file_path,as_binary=True)
     
     def test_appears_in_attack_settings(self,test_file_path:Path,side_bar:SideBar):
         add_job_page = side_bar.goto_add_job()
@@ -40,8 +40,9 @@ class TestMarkovFileProperUpload:
         brute_force_attack_settings = attack_settings.choose_brute_force_mode()
         predicate_in_list(lambda x: x.name == test_file_path.name, brute_force_attack_settings.get_available_markov_files())
 
+    @pytest.mark.destroys_library_asset
     def test_delete(self,test_file_path:Path,markov_file_management:MarkovFileManagement):
-        uploaded_markov_file = predicate_in_list(lambda x: x.name == test_file_path.name, markov_file_management.get_available_markov_files())
-        uploaded_markov_file.delete()
-        with pytest.raises(ValueError):
-            predicate_in_list(lambda x: x.name == test_file_path.name, markov_file_management.get_available_markov_files())
+        with markov_file_management.find_row_by_name(test_file_path.name) as uploaded_markov_file:
+            uploaded_markov_file.delete()
+        with pytest.raises(ValueError), markov_file_management.find_row_by_name(test_file_path.name):
+            pass
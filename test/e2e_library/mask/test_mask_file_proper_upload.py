@@ -1,10 +1,11 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 from pathlib import Path
 
 import pytest
 
-from page_object.common.helper import predicate_in_list
+from download_comparison import assert_download_matches
+
 
 if TYPE_CHECKING:
     from page_object.side_bar import SideBar
@@ -29,25 +30,24 @@ TEST_MASKS = [
     '' #Empty string at the end because WebAdmin appends an empty mask after the loaded ones.
 ]
 
-@pytest.mark.parametrize('test_file_path',TEST_FILES,indirect=True)
+@pytest.mark.parametrize('test_file_path',TEST_FILES,indirect=True,scope='class')
 class TestMaskProperUpload:
     @pytest.fixture(autouse=True)
-    def mask_management(self, test_file_path:Path, side_bar:SideBar) -> MaskManagement:
+    def mask_management(self, test_file_path:Path, side_bar:SideBar, library_asset:Callable[...,None]) -> MaskManagement:
         mask_management = side_bar.goto_mask_library()
-        mask_management.upload_mask_file(test_file_path)
+        library_asset(test_file_path,lambda: mask_management.upload_mask_file(test_file_path))
         return mask_management
 
     def test_upload_did_not_fail(self):
         assert True
 
     def test_appears_in_list(self,test_file_path:Path,mask_management:MaskManagement):
-        assert predicate_in_list(lambda x: x.name == test_file_path.name, mask_management.get_available_mask_files())
+        with mask_management.find_row_by_name(test_file_path.name) as row:
+            assert row.name == test_file_path.name
     
-    def test_download_gives_same_file(self,test_file_path:Path,test_file_text_content:str,mask_management:MaskManagement):
-        uploaded_mask_file = predicate_in_list(lambda x: x.name == test_file_path.name, mask_management.get_available_mask_files())
-        downloaded_file = uploaded_mask_file.download()
-
-        assert test_file_text_content == downloaded_file
+    def test_download_gives_same_file(self,test_file_path:Path,mask_management:MaskManagement):
+        with mask_management.find_row_by_name(test_file_path.name) as uploaded_mask_file:
+            assert_download_matches(uploaded_mask_file,test_file_path)
     
     def test_appears_in_attack_settings(self,test_file_path:Path,side_bar:SideBar):
         add_job_page = side_bar.goto_add_job()
@@ -62,8 +62,9 @@ class TestMaskProperUpload:
         brute_force_attack_settings.load_mask_file(test_file_path.name)
         assert brute_force_attack_settings.get_all_input_masks() == TEST_MASKS
 
+    @pytest.mark.destroys_library_asset
     def test_delete(self,test_file_path:Path,mask_management:MaskManagement):
-        uploaded_mask_file = predicate_in_list(lambda x: x.name == test_file_path.name,mask_management.get_available_mask_files())
-        uploaded_mask_file.delete()
-        with pytest.raises(ValueError):
-            predicate_in_list(lambda x: x.name == test_file_path.stem, mask_management.get_available_mask_files())
+        with mask_management.find_row_by_name(test_file_path.name) as uploaded_mask_file:
+            uploaded_mask_file.delete()
+        with pytest.raises(ValueError), mask_management.find_row_by_name(test_file_path.name):
+            pass
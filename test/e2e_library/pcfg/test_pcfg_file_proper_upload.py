@@ -1,10 +1,11 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 from pathlib import Path
 
 import pytest
 
 from page_object.common.helper import predicate_in_list
+from download_comparison import assert_download_matches
 
 if TYPE_CHECKING:
     from page_object.side_bar import SideBar
@@ -14,25 +15,24 @@ TEST_FILES = [
     pytest.param(Path('./test/e2e_library/pcfg/fc_auto_test_pcfg_correct.zip'))
 ]
 
-@pytest.mark.parametrize('test_file_path',TEST_FILES,indirect=True)
+@pytest.mark.parametrize('test_file_path',TEST_FILES,indirect=True,scope='class')
 class TestPCFGProperUpload:
     @pytest.fixture(autouse=True)
-    def pcfg_management(self, test_file_path:Path, side_bar:SideBar) -> PCFGManagement:
+    def pcfg_management(self, test_file_path:Path, side_bar:SideBar, library_asset:Callable[...,None]) -> PCFGManagement:
         pcfg_management = side_bar.goto_pcfg_library()
-        pcfg_management.upload_pcfg(test_file_path)
+        library_asset(test_file_path,lambda: pcfg_management.upload_pcfg(test_file_path))
         return pcfg_management
 
     def test_upload_did_not_fail(self):
         assert True
 
     def test_appears_in_list(self,test_file_path:Path,pcfg_management:PCFGManagement):
-        assert predicate_in_list(lambda x: x.name == test_file_path.stem, pcfg_management.get_available_pcfgs())
+        with pcfg_management.find_row_by_name(test_file_path.stem) as row:
+            assert row.name == test_file_path.stem
     
-    def test_download_gives_same_file(self,test_file_path:Path,test_file_binary_content:bytes,pcfg_management:PCFGManagement):
-        uploaded_pcfg = predicate_in_list(lambda x: x.name == test_file_path.stem, pcfg_management.get_available_pcfgs())
-        downloaded_file = uploaded_pcfg.download(as_binary=True)
-
-        assert test_file_binary_content == downloaded_file
+    def test_download_gives_same_file(self,test_file_path:Path,pcfg_management:PCFGManagement):
+        with pcfg_management.find_row_by_name(test_file_path.stem) as uploaded_pcfg:
+            assert_download_matches(uploaded_pcfg,test_file_path,as_binary=True)
     
     def test_appears_in_attack_settings(self,test_file_path:Path,side_bar:SideBar):
         add_job_page = side_bar.goto_add_job()
@@ -40,8 +40,9 @@ class TestPCFGProperUpload:
         pcfg_attack_settings = attack_settings.choose_pcfg_mode()
         predicate_in_list(lambda x: x.name == test_file_path.stem, pcfg_attack_settings.get_available_pcfgs())
 
+    @pytest.mark.destroys_library_asset
     def test_delete(self,test_file_path:Path,pcfg_management:PCFGManagement):
-        uploaded_pcfg = predicate_in_list(lambda x: x.name == test_file_path.stem, pcfg_management.get_available_pcfgs())
-        uploaded_pcfg.delete()
-        with pytest.raises(ValueError):
-            predicate_in_list(lambda x: x.name == test_file_path.stem, pcfg_management.get_available_pcfgs())
+        with pcfg_management.find_row_by_name(test_file_path.stem) as uploaded_pcfg:
+            uploaded_pcfg.delete()
+        with pytest.raises(ValueError), pcfg_management.find_row_by_name(test_file_path.stem):
+            pass
@@ -1,10 +1,10 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 from pathlib import Path
 
 import pytest
 
-from  page_object.common.helper import predicate_in_list
+from download_comparison import assert_download_matches
 
 if TYPE_CHECKING:
     from page_object.side_bar import SideBar
@@ -15,25 +15,24 @@ TEST_FILES = [
     pytest.param(Path('./test/e2e_library/rule_files/fc_auto_test_rule_file_correct.rule'),id='file_ext_rule')
 ]
 
-@pytest.mark.parametrize('test_file_path',TEST_FILES,indirect=True)
+@pytest.mark.parametrize('test_file_path',TEST_FILES,indirect=True,scope='class')
 class TestRuleFileProperUpload:
     @pytest.fixture(autouse=True)
-    def rule_file_management(self, test_file_path:Path, side_bar:SideBar) -> RuleFileManagement:
+    def rule_file_management(self, test_file_path:Path, side_bar:SideBar, library_asset:Callable[...,None]) -> RuleFileManagement:
         rule_file_management = side_bar.goto_rule_file_library()
-        rule_file_management.upload_rule_file(test_file_path)
+        library_asset(test_file_path,lambda: rule_file_management.upload_rule_file(test_file_path))
         return rule_file_management
     
     def test_upload_did_not_fail(self):
         assert True
 
     def test_rule_appears_in_list(self,test_file_path:Path,rule_file_management:RuleFileManagement):
-        assert predicate_in_list(lambda x: x.name == test_file_path.name, rule_file_management.get_available_rule_files())
+        with rule_file_management.find_row_by_name(test_file_path.name) as row:
+            assert row.name == test_file_path.name
     
-    def test_download_gives_same_file(self,test_file_path:Path,test_file_text_content:str,rule_file_management:RuleFileManagement):
-        uploaded_rule_file = predicate_in_list(lambda x: x.name == test_file_path.name, rule_file_management.get_available_rule_files())
-        downloaded_file = uploaded_rule_file.download()
-
-        assert test_file_text_content == downloaded_file
+    def test_download_gives_same_file(self,test_file_path:Path,rule_file_management:RuleFileManagement):
+        with rule_file_management.find_row_by_name(test_file_path.name) as uploaded_rule_file:
+            assert_download_matches(uploaded_rule_file,test_file_path)
     
     def test_rule_file_appears_in_attack_settings(self,test_file_path:Path,side_bar:SideBar):
         add_job_page = side_bar.goto_add_job()
@@ -41,8 +40,9 @@ class TestRuleFileProperUpload:
         dictionary_attack_settings = attack_settings.choose_dictionary_mode()
         assert dictionary_attack_settings.rule_file_with_name_exists(test_file_path.name)
 
+    @pytest.mark.destroys_library_asset
     def test_delete(self,test_file_path:Path,rule_file_management:RuleFileManagement):
-        uploaded_rule_file = predicate_in_list(lambda x: x.name == test_file_path.name, rule_file_management.get_available_rule_files())
-        uploaded_rule_file.delete()
-        with pytest.raises(ValueError):
-            predicate_in_list(lambda x: x.name == test_file_path.name, rule_file_management.get_available_rule_files())
+        with rule_file_management.find_row_by_name(test_file_path.name) as uploaded_rule_file:
+            uploaded_rule_file.delete()
+        with pytest.raises(ValueError), rule_file_management.find_row_by_name(test_file_path.name):
+            pass
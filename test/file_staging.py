@@ -0,0 +1,111 @@
+"""Staging of test files under unique names without copying them.
+
+FileStaging --
+gives tests uniquely named files with the content of the test files
+
+Webadmin does not accept a file whose name is already taken, so every test uploads its test file
+under a unique name. Instead of copying the test file for every test, the content of each test
+file is copied only once into a content-addressed cache (the files are named by the SHA-256 of
+their content), and each staged file is a hardlink to (or, where hardlinks are not supported,
+a reflink of) the cached file. Only where neither is possible is the cached file copied.
+"""
+
+from __future__ import annotations
+from pathlib import Path
+from typing import Dict, Tuple
+import errno
+import hashlib
+import os
+import shutil
+
+try:
+    import fcntl
+except ImportError: # not on Linux
+    fcntl = None
+
+
+_FICLONE = 0x40049409
+"""The Linux ioctl request for cloning a file (making a reflink), see ioctl_ficlone(2)."""
+
+_LINK_NOT_SUPPORTED_ERRNOS = {errno.EXDEV, errno.EPERM, errno.ENOTSUP, errno.EMLINK}
+"""Errors of `os.link` meaning that the file cannot be hardlinked (but may be reflinked or copied)."""
+
+_CHUNK_SIZE = 1024*1024
+"""The number of bytes read at once when hashing a file."""
+
+REPOSITORY_ROOT = Path(__file__).parent.parent
+"""Relative test-file paths (like `./test/e2e_library/...`) are relative to this directory."""
+
+
+class FileStaging:
+    """Stages test files into a directory for the duration of the test session.
+    All the staged files are removed at once with `cleanup`.
+    """
+
+    def __init__(self,directory:Path):
+        self.directory = directory
+        self._cache_directory = directory / 'cache'
+        self._staged_directory = directory / 'staged'
+        self._cache_directory.mkdir(parents=True,exist_ok=True)
+        self._staged_directory.mkdir(parents=True,exist_ok=True)
+        self._cached_files : Dict[Tuple[Path,int,int],Path] = {}
+        """Cached files by the test file path, its size and its modification time."""
+
+    def stage(self,source:Path,name:str) -> Path:
+        """Returns the absolute path of a new file called `name` with the content of the test file
+        `source`. A relative `source` is taken relative to the repository root (see `REPOSITORY_ROOT`).
+        The staged file must not be modified, as it may share its content with other staged files.
+        Raises FileExistsError if a file called `name` has already been staged.
+        """
+        cached_file = self._cache(source if source.is_absolute() else REPOSITORY_ROOT / source)
+        staged_file = self._staged_directory / name
+        try:
+            os.link(cached_file,staged_file)
+        except OSError as error:
+            if error.errno not in _LINK_NOT_SUPPORTED_ERRNOS:
+                raise
+            if not _reflink(cached_file,staged_file):
+                with open(cached_file,'rb') as source_file, open(staged_file,'xb') as staged_copy:
+                    shutil.copyfileobj(source_file,staged_copy)
+        return staged_file.absolute()
+
+    def cleanup(self) -> None:
+        """Removes all the staged files and the cache."""
+        shutil.rmtree(self.directory,ignore_errors=True)
+
+    def _cache(self,source:Path) -> Path:
+        stat = source.stat()
+        key = (source.resolve(),stat.st_size,stat.st_mtime_ns)
+        if key not in self._cached_files:
+            cached_file = self._cache_directory / (_file_sha256(source) + source.suffix)
+            if not cached_file.exists():
+                partial_file = cached_file.with_name(cached_file.name + '.partial')
+                shutil.copyfile(source,partial_file)
+                os.replace(partial_file,cached_file)
+            self._cached_files[key] = cached_file
+        return self._cached_files[key]
+
+
+def _file_sha256(path:Path) -> str:
+    hash = hashlib.sha256()
+    with open(path,'rb') as file:
+        for chunk in iter(lambda: file.read(_CHUNK_SIZE),b''):
+            hash.update(chunk)
+    return hash.hexdigest()
+
+
+def _reflink(source:Path,destination:Path) -> bool:
+    """Makes `destination` a reflink (a copy-on-write clone) of `source`.
+    Returns whether it succeeded; it fails on systems and filesystems that do not support it.
+    Raises FileExistsError if `destination` exists, so an existing file is never written through.
+    """
+    if fcntl is None:
+        return False
+    with open(source,'rb') as source_file, open(destination,'xb') as destination_file:
+        try:
+            fcntl.ioctl(destination_file.fileno(),_FICLONE,source_file.fileno())
+            return True
+        except OSError:
+            pass
+    destination.unlink()
+    return False
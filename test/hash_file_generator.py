@@ -0,0 +1,102 @@
+"""Generator of large hash files for tests.
+
+GeneratedHashFile --
+a generated hash file and the index of its plaintexts
+
+generate_hash_file --
+writes a hash file of a given size
+
+The checked-in hash files are tiny; production hash lists have up to millions of hashes.
+The generated files are written straight to disk in chunks, so their size is not limited by
+memory. The plaintexts are not kept at all: the plaintext of the n-th hash is derived from n
+(see `GeneratedHashFile.plaintext`), and the only thing kept in memory is a sorted index of
+32-bit hash prefixes and line numbers (8 bytes per hash) for looking up the plaintext of a hash.
+The index is sorted chunk by chunk as the file is written and the sorted chunks are then merged,
+so building it takes about 16 bytes per hash (besides the chunk being written).
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from array import array
+from pathlib import Path
+from typing import Iterator, List, Optional
+import bisect
+import hashlib
+import heapq
+
+
+HASH_TYPES = {
+    'md5': '0',
+    'sha1': '100',
+    'sha256': '1400',
+    'sha512': '1700',
+}
+"""Supported hash algorithms (as named by hashlib) and their Hashcat hash-type codes."""
+
+_CHUNK_SIZE = 10000
+"""The number of lines written to the file at once."""
+
+
+@dataclass
+class GeneratedHashFile:
+    """A hash file written by `generate_hash_file`. The n-th line (counting from 0) is the hash
+    of `plaintext(n)` made with `algorithm`.
+    """
+    path : Path
+    count : int
+    algorithm : str
+    prefix : str
+    _index : array = field(repr=False,default_factory=lambda: array('Q'))
+    """Sorted entries `hash prefix << 32 | line number`, where `hash prefix` are the first
+    32 bits of the hash."""
+
+    @property
+    def hash_type(self) -> str:
+        """The Hashcat hash-type code of the hashes (e.g. '100' for SHA1)."""
+        return HASH_TYPES[self.algorithm]
+
+    def plaintext(self,index:int) -> str:
+        """The plaintext of the hash on line `index`."""
+        return f'{self.prefix}{index}'
+
+    def hash(self,index:int) -> str:
+        """The hash on line `index`."""
+        return hashlib.new(self.algorithm,self.plaintext(index).encode()).hexdigest()
+
+    def hashes(self) -> Iterator[str]:
+        """Yields the hashes of the file in order, reading them from the file."""
+        with open(self.path) as file:
+            for line in file:
+                yield line.rstrip('\n')
+
+    def plaintext_of(self,hash:str) -> Optional[str]:
+        """Returns the plaintext of a hash of the file, or None if the hash is not in the file."""
+        prefix = int(hash[:8],16)
+        position = bisect.bisect_left(self._index,prefix << 32)
+        while position < len(self._index) and self._index[position] >> 32 == prefix:
+            index = self._index[position] & 0xFFFFFFFF
+            if self.hash(index) == hash:
+                return self.plaintext(index)
+            position += 1
+        return None
+
+    def is_cracked_correctly(self,hash:str,plaintext:str) -> bool:
+        """Whether `plaintext` is the plaintext of `hash` and `hash` is in the file."""
+        return self.plaintext_of(hash) == plaintext
+
+
+def generate_hash_file(path:Path,count:int,algorithm:str='sha1',prefix:str='fc-auto-test-') -> GeneratedHashFile:
+    """Writes `count` hashes (one per line) of the plaintexts `prefix0`, `prefix1`, ...
+    made with `algorithm` (see `HASH_TYPES`) to `path` and returns the GeneratedHashFile.
+    """
+    if algorithm not in HASH_TYPES:
+        raise ValueError(f'Unsupported hash algorithm: {algorithm}')
+    hash_file = GeneratedHashFile(path,count,algorithm,prefix)
+    sorted_chunks : List[array] = []
+    with open(path,'w') as file:
+        for chunk_start in range(0,count,_CHUNK_SIZE):
+            chunk = [hash_file.hash(index) for index in range(chunk_start,min(chunk_start+_CHUNK_SIZE,count))]
+            file.write('\n'.join(chunk) + '\n')
+            sorted_chunks.append(array('Q',sorted(int(hash[:8],16) << 32 | index for index, hash in enumerate(chunk,chunk_start))))
+    hash_file._index = array('Q',heapq.merge(*sorted_chunks))
+    return hash_file
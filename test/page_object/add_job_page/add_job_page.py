@@ -11,6 +11,7 @@ from selenium.common.exceptions import JavascriptException, NoSuchElementExcepti
 from selenium.webdriver.support.relative_locator import locate_with
 
 from page_object.common.page_object import PageObject
+from page_object.common.locator_cache import cached_locator
 from page_object.add_job_page.input_settings import InputSettings
 from page_object.add_job_page.attack_settings import AttackSettings
 from page_object.job_detail_page import JobDetailPage
@@ -31,6 +32,7 @@ class AddJobPage(PageObject):
         WebDriverWait(self.driver,30,ignored_exceptions={JavascriptException, NoSuchElementException}).until(lambda _: self.__name_field and self.__attack_settings_button)
 
     @property
+    @cached_locator
     def __name_field(self) -> WebElement:
         return self.driver.find_element(
             locate_with(By.TAG_NAME,'input').near({By.XPATH:'//label[text()="Name"]'})  # type: ignore
@@ -53,6 +55,7 @@ class AddJobPage(PageObject):
         return self.driver.find_element(By.ID,'job-step-4')
 
     @property
+    @cached_locator
     def __create_button(self) -> WebElement:
         return self.driver.find_element(
             locate_with(By.TAG_NAME,'button').near({By.XPATH:'//span[text()[contains(.,"Create")]]'})   # type: ignore
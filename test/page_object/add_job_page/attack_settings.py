@@ -8,9 +8,10 @@ from typing import TYPE_CHECKING
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver import ActionChains
 
 from page_object.common.page_object import PageObject
+from page_object.common.helper import wait_for_animations_to_finish
+from page_object.add_job_page.attack_settings_panel import ATTACK_SETTINGS_STEP_XPATH
 from page_object.add_job_page.dictionary_attack_settings import DictionaryAttackSettings
 from page_object.add_job_page.hybrid_attack_settings import HybridAttackSettings
 from page_object.add_job_page.brute_force_attack_settings import BruteForceAttackSettings
@@ -27,8 +28,7 @@ class AttackSettings(PageObject):
 
     def ensure_loaded(self):
         WebDriverWait(self.driver,30).until(lambda _: self.__dictionary_mode_button.is_displayed)
-        ActionChains(self.driver).pause(2).perform()
-        #Wait for 2 seconds to make sure vuejs animation is over
+        wait_for_animations_to_finish(self.driver,self.driver.find_element(By.XPATH,ATTACK_SETTINGS_STEP_XPATH))
 
     @property
     def __dictionary_mode_button(self) -> WebElement:
@@ -0,0 +1,34 @@
+"""Base class of the page objects representing the attack-mode panels in the attack settings
+on the Add Job page. Exports single class--AttackSettingsPanel.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from selenium.webdriver.common.by import By
+
+from page_object.common.page_object import PageObject
+from page_object.common.helper import wait_for_animations_to_finish
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webelement import WebElement
+
+
+ATTACK_SETTINGS_STEP_XPATH = '//*[@id="attack-mode-dictionary"]/ancestor::div[contains(@class,"v-stepper__content")][1]'
+"""Locates the content of the attack-settings step (step 2) of the Add Job page, which holds
+the attack-mode buttons and the panel of the chosen attack mode."""
+
+
+class AttackSettingsPanel(PageObject):
+    """Base class of the attack-mode panels (e.g. the dictionary-attack settings)."""
+
+    def ensure_loaded(self) -> None:
+        """Waits until the library files shown in the panel are fetched from Webadmin, then waits
+        for vuejs to settle and finish all animations in the attack-settings step.
+        """
+        self.wait_for_network_idle()
+        wait_for_animations_to_finish(self.driver,self._attack_settings_step)
+
+    @property
+    def _attack_settings_step(self) -> WebElement:
+        return self.driver.find_element(By.XPATH,ATTACK_SETTINGS_STEP_XPATH)
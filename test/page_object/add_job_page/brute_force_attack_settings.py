@@ -12,11 +12,10 @@ import itertools
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.relative_locator import locate_with
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver import ActionChains
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from selenium.common.exceptions import NoSuchElementException
 
-from page_object.common.page_object import PageObject
+from page_object.add_job_page.attack_settings_panel import AttackSettingsPanel
+from page_object.common.locator_cache import cached_locator
 from page_object.table.charset_selection import CharsetSelection
 from page_object.table.markov_file_selection import MarkovFileSelection
 from page_object.table.mask_file_selection_row import MaskFileSelection
@@ -40,19 +39,9 @@ class MarkovMode(Enum):
     MARKOV_3D = 'markov-3d'
 
 
-class BruteForceAttackSettings(PageObject):
+class BruteForceAttackSettings(AttackSettingsPanel):
     """This class represents the brute-force-attack settings in the Create Job page."""
 
-    def ensure_loaded(self):
-        """Waits until charsets and markov files are loaded, then waits for five more seconds
-        for vuejs to settle and finish all animations and DOM manipulation.
-        """
-        try:
-            WebDriverWait(self.driver,30).until(lambda _: len(self.get_available_charsets()) != 0 and len(self.get_available_markov_files()) != 0)
-            ActionChains(self.driver).pause(5).perform()
-        except TimeoutException:
-            pass
-
     def __get_mask_input_field(self,index:int) -> WebElement:
         return self.driver.find_element(By.ID,f'mask-{index}-mask-input')
 
@@ -72,24 +61,28 @@ class BruteForceAttackSettings(PageObject):
         return self.driver.find_element(By.XPATH,'//span[text()[contains(.,"Markov file")]]/ancestor::div[contains(@class, "col")][1]//table')
 
     @property
+    @cached_locator
     def __markov_threshold_input(self) -> WebElement:
         return self.driver.find_element(
             locate_with(By.TAG_NAME,'input').near({By.XPATH:'//label[text()="Markov threshold"]'})  # type: ignore
         )
 
     @property
+    @cached_locator
     def __markov_disabled_radio_button(self) -> WebElement:
         return self.driver.find_element(
             locate_with(By.TAG_NAME,'input').to_left_of({By.XPATH:'//label[text()="Markov disabled"]'})  # type: ignore
         )
 
     @property
+    @cached_locator
     def __2D_markov_radio_button(self) -> WebElement:
         return self.driver.find_element(
             locate_with(By.TAG_NAME,'input').to_left_of({By.XPATH:'//label[text()="2D Markov"]'})  # type: ignore
         )
 
     @property
+    @cached_locator
     def __3D_markov_radio_button(self) -> WebElement:
         return self.driver.find_element(
             locate_with(By.TAG_NAME,'input').to_left_of({By.XPATH:'//label[text()="3D Markov"]'})  # type: ignore
@@ -126,7 +119,7 @@ class BruteForceAttackSettings(PageObject):
     def get_available_mask_files(self) -> List[str]:
         """Returns the names (strings) of all mask files that can be loaded."""
         self.__load_mask_button.click()
-        ActionChains(self.driver).pause(4).perform() # Wait for animation to finish
+        self._wait_until_dialog_opens()
         show_as_many_rows_per_table_page_as_possible(self.driver,self.__mask_dialog_table)
         mask_files = build_table_row_objects_from_table(self.driver,self.__mask_dialog_table,MaskFileSelection)
         mask_names = [mask_file.name for mask_file in mask_files]
@@ -136,7 +129,7 @@ class BruteForceAttackSettings(PageObject):
     def load_mask_file(self,mask_file_name:str) -> None:
         """Loads the mask file with the given name."""
         self.__load_mask_button.click()
-        ActionChains(self.driver).pause(4).perform() # Wait for animation to finish
+        self._wait_until_dialog_opens()
         show_as_many_rows_per_table_page_as_possible(self.driver,self.__mask_dialog_table)
         mask_files = build_table_row_objects_from_table(self.driver,self.__mask_dialog_table,MaskFileSelection)
         activate_elements_from_table_by_list_lookup(mask_files,lambda x: x.name,[mask_file_name])
@@ -7,11 +7,9 @@ from typing import TYPE_CHECKING, List
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.relative_locator import locate_with
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver import ActionChains
-from selenium.common.exceptions import TimeoutException
 
-from page_object.common.page_object import PageObject
+from page_object.add_job_page.attack_settings_panel import AttackSettingsPanel
+from page_object.common.locator_cache import cached_locator
 from page_object.table.dictionary_selection import DictionarySelection
 from page_object.table.table_manipulation import build_table_row_objects_from_table, activate_elements_from_table_by_list_lookup, show_as_many_rows_per_table_page_as_possible
 from page_object.common.helper import clear_workaround, click_away
@@ -20,41 +18,32 @@ if TYPE_CHECKING:
     from selenium.webdriver.remote.webelement import WebElement
 
 
-class CombinationAttackSettings(PageObject):
+class CombinationAttackSettings(AttackSettingsPanel):
     """This class represents the combination-attack settings in the Add Job page."""
 
-    def ensure_loaded(self):
-        """Waits until some dictionaries are available in the dictionary selections until a timeout.
-        If at least one dictionary selector is still blank after the timeout, we assume that that
-        is correct, and that there are indeed no dictionaries and proceed.
-        Even if it succeeds and sees that dictionaries are loaded, we wait for five second
-        to ensure that vuejs actually properly displays the elements.
-        """
-        try:
-            WebDriverWait(self.driver,30).until(lambda _: len(self.get_available_left_dictionaries()) != 0 and len(self.get_available_right_dictionaries()) != 0)
-            ActionChains(self.driver).pause(5).perform()
-        except TimeoutException:
-            pass
-
     @property
+    @cached_locator
     def __left_dictionary_selection_table(self) -> WebElement:
         return self.driver.find_element(
             locate_with(By.TAG_NAME,'table').below({By.XPATH:'//span[text()[contains(.,"Select left dictionary")]]'})  # type: ignore
         )
 
     @property
+    @cached_locator
     def __right_dictionary_selection_table(self) -> WebElement:
         return self.driver.find_element(
             locate_with(By.TAG_NAME,'table').below({By.XPATH:'//span[text()[contains(.,"Select right dictionary")]]'})  # type: ignore
         )
 
     @property
+    @cached_locator
     def __left_rule_input(self) -> WebElement:
         return self.driver.find_element(
             locate_with(By.TAG_NAME,'input').below({By.XPATH:'//span[text()[contains(.,"Type left rule")]]'})  # type: ignore
         )
 
     @property
+    @cached_locator
     def __right_rule_input(self) -> WebElement:
         return self.driver.find_element(
             locate_with(By.TAG_NAME,'input').below({By.XPATH:'//span[text()[contains(.,"Type right rule")]]'})  # type: ignore
@@ -6,12 +6,10 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, List
 
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver import ActionChains
 from selenium.webdriver.support.relative_locator import locate_with
-from selenium.common.exceptions import TimeoutException
 
-from page_object.common.page_object import PageObject
+from page_object.add_job_page.attack_settings_panel import AttackSettingsPanel
+from page_object.common.locator_cache import cached_locator
 from page_object.common.helper import click_away
 from page_object.table.dictionary_selection import DictionarySelection
 from page_object.table.rule_file_selection import RuleFileSelection
@@ -21,29 +19,18 @@ if TYPE_CHECKING:
     from selenium.webdriver.remote.webelement import WebElement
 
 
-class DictionaryAttackSettings(PageObject):
+class DictionaryAttackSettings(AttackSettingsPanel):
     """This class represents the dictionary-attack settings in the Add Job page."""
 
-    def ensure_loaded(self):
-        """Waits until some dictionaries are available in the dictionary selection until a timeout.
-        If the dictionary selector is still blank after the timeout,
-        we assume that that is correct, and that there are indeed no dictionaries and proceed.
-        Even if it succeeds and sees that dictionaries are loaded, we wait for five seconds to
-        ensure that vuejs actually properly displays the elements.
-        """
-        try:
-            WebDriverWait(self.driver,30).until(lambda _: len(self.get_available_dictionaries()) != 0)
-            ActionChains(self.driver).pause(5).perform()
-        except TimeoutException:
-            pass
-
     @property
+    @cached_locator
     def __dictionary_selection_table(self) -> WebElement:
         return self.driver.find_element(
             locate_with(By.TAG_NAME,'table').below({By.XPATH:'//span[text()[contains(.,"Select dictionary")]]'})  # type: ignore
         )
 
     @property
+    @cached_locator
     def __rule_file_selection_table(self) -> WebElement:
         return self.driver.find_element(
             locate_with(By.TAG_NAME,'table').below({By.XPATH:'//span[text()[contains(.,"Select rule file")]]'})  # type: ignore
@@ -0,0 +1,90 @@
+"""Catalog of the hash types offered by the hash-type selection on the Add Job page.
+Exports single class--HashTypeCatalog.
+
+Picking a hash type by typing a part of its name into the selection and clicking the first
+option is slow and picks the wrong option whenever the typed text matches several hash types
+(e.g. 'SHA1' matches 'SHA1', 'HMAC-SHA1 (key = $pass)' and dozens more). With the catalog,
+the exact name of the option is known from the Hashcat mode, so the option can be picked directly
+(see `InputSettings.select_hash_type_by_mode`).
+
+The catalog is fetched from the Webadmin API once per Webadmin version and kept in memory for
+the rest of the test session and, if `HashTypeCatalog.cache_directory` is set (the root
+conftest.py sets it to a directory in the pytest cache), on disk for later test sessions.
+The version is known only from the Webadmin frontend, while the hash types come from Hashcat on
+the backend, so a catalog read from disk may be stale (e.g. after Hashcat is upgraded). It is
+trusted only until a lookup in it fails; the catalog is then fetched again
+(see `InputSettings.select_hash_type_by_mode`).
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, ClassVar, Dict, Optional, Union
+from pathlib import Path
+import hashlib
+import json
+import os
+
+from webadmin_api.client import WebadminApiClient
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+
+_VERSION_SCRIPT = '''
+return [window.serverAddress, ...Array.from(document.scripts, script => script.src)].join(' ');
+'''
+"""Returns what identifies the version of Webadmin running in the browser: the address of its API
+and the URLs of its scripts (the file names of a Webadmin build contain hashes of their content)."""
+
+
+class HashTypeCatalog:
+    """Maps Hashcat modes (hash-type codes) to the names of hash types Webadmin offers."""
+
+    cache_directory : ClassVar[Optional[Path]] = None
+    """Directory where the catalogs are cached between test sessions; not cached on disk if None."""
+
+    _catalogs : ClassVar[Dict[str,HashTypeCatalog]] = {}
+    """Catalogs loaded during the test session, by Webadmin version (see `_VERSION_SCRIPT`)."""
+
+    def __init__(self,names:Dict[str,str],fetched:bool):
+        """`names` maps the Hashcat modes (as strings, e.g. '1400') to the hash-type names."""
+        self.names = names
+        self.fetched = fetched
+        """Whether the catalog was fetched from the Webadmin API during this test session
+        (if not, it was read from the disk cache and may be stale)."""
+
+    @classmethod
+    def for_driver(cls,driver:WebDriver,refetch:bool=False) -> HashTypeCatalog:
+        """Returns the catalog of the Webadmin open in the browser, fetching it from the Webadmin
+        API only if it is neither loaded nor cached on disk for this version of Webadmin yet,
+        or if `refetch=True`.
+        """
+        version = hashlib.sha256(driver.execute_script(_VERSION_SCRIPT).encode()).hexdigest()
+        catalog = cls._catalogs.get(version)
+        if catalog is not None and (catalog.fetched or not refetch):
+            return catalog
+        cache_file = cls.cache_directory / f'{version}.json' if cls.cache_directory is not None else None
+        if cache_file is not None and cache_file.exists() and not refetch:
+            catalog = cls(json.loads(cache_file.read_text()),fetched=False)
+        else:
+            client = WebadminApiClient.from_driver(driver)
+            try:
+                catalog = cls({str(hash_type['code']): hash_type['name'] for hash_type in client.get_hash_types()},fetched=True)
+            finally:
+                client.close()
+            if cache_file is not None:
+                # Written under a name of its own and then renamed, so that other pytest-xdist
+                # workers never read a half-written file.
+                partial_file = cache_file.with_name(f'{cache_file.name}.{os.getpid()}.partial')
+                partial_file.write_text(json.dumps(catalog.names))
+                os.replace(partial_file,cache_file)
+        cls._catalogs[version] = catalog
+        return catalog
+
+    def name_of(self,mode:Union[int,str]) -> str:
+        """Returns the name of the hash type with the given Hashcat mode (e.g. 1400 or '1400').
+        ValueError is raised if Webadmin does not offer such a hash type.
+        """
+        try:
+            return self.names[str(mode)]
+        except KeyError:
+            raise ValueError(f'Webadmin offers no hash type with Hashcat mode {mode}.')
@@ -8,11 +8,9 @@ from typing import TYPE_CHECKING, List
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.relative_locator import locate_with
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver import ActionChains
-from selenium.common.exceptions import TimeoutException
 
-from page_object.common.page_object import PageObject
+from page_object.add_job_page.attack_settings_panel import AttackSettingsPanel
+from page_object.common.locator_cache import cached_locator
 from page_object.common.helper import click_away
 from page_object.table.dictionary_selection import DictionarySelection
 from page_object.table.table_manipulation import activate_elements_from_table_by_list_lookup, build_table_row_objects_from_table, show_as_many_rows_per_table_page_as_possible
@@ -22,26 +20,14 @@ if TYPE_CHECKING:
     from selenium.webdriver.remote.webelement import WebElement
 
 
-class HybridAttackSettings(PageObject):
+class HybridAttackSettings(AttackSettingsPanel):
     """This class represents the hybrid-attack settings in the Add Job page.
     This class is used for both types of hybrid attacks (mask first and wordlist first),
     and it's used in exactly the same way regardless of which kind of hybrid attack is used.    
     """
 
-    def ensure_loaded(self) -> None:
-        """Waits until some dictionaries are available in the dictionary selection until a timeout.
-        If the dictionary selector is still blank after the timeout,
-        we assume that that is correct, and that there are indeed no dictionaries and proceed.
-        Even if it succeeds and sees that dictionaries are loaded, we wait for five seconds to
-        ensure that vuejs actually properly displays the elements.
-        """
-        try:
-            WebDriverWait(self.driver,30).until(lambda _: len(self.get_available_dictionaries()) != 0)
-            ActionChains(self.driver).pause(5).perform()
-        except TimeoutException:
-            pass
-
     @property
+    @cached_locator
     def __dictionary_selection_table(self) -> WebElement:
         return self.driver.find_element(
             locate_with(By.TAG_NAME,'table').below({By.XPATH:'//span[text()[contains(.,"Select dictionary")]]'})  # type: ignore
@@ -52,6 +38,7 @@ class HybridAttackSettings(PageObject):
         return self.driver.find_element(By.CSS_SELECTOR,'[placeholder="Rule"]')
 
     @property
+    @cached_locator
     def __mask_input(self) -> WebElement:
         return self.driver.find_element(
             locate_with(By.TAG_NAME,'input').below({By.XPATH:'//span[text()[contains(.,"Type mask")]]'})  # type: ignore
@@ -7,18 +7,51 @@ from typing import TYPE_CHECKING, List, Union
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
-from selenium.common.exceptions import JavascriptException, NoSuchElementException
-from selenium.webdriver import ActionChains
+from selenium.common.exceptions import JavascriptException, NoSuchElementException, TimeoutException
 from selenium.webdriver.support.relative_locator import locate_with
 
 from page_object.common.page_object import PageObject
-from page_object.common.helper import clear_workaround, click_away
+from page_object.common.locator_cache import cached_locator
+from page_object.common.helper import clear_workaround, click_away, wait_for_animations_to_finish
+from page_object.common.exception import InvalidStateError
+from page_object.add_job_page.hash_type_catalog import HashTypeCatalog
 
 if TYPE_CHECKING:
     from selenium.webdriver.remote.webelement import WebElement
     from pathlib import Path
 
 
+_BULK_INPUT_SCRIPT = '''
+const [field, text] = arguments;
+field.focus();
+field.value = text;
+field.dispatchEvent(new Event('input', {bubbles: true}));
+'''
+
+_HASH_TYPE_OPTION_SCRIPT = '''
+const [list, name] = arguments;
+return Array.from(list.querySelectorAll('.v-list-item')).find(
+    item => item.querySelector('.v-list-item__title')?.textContent.trim() === name
+) || null;
+'''
+
+_INPUT_MODEL_SIZE_SCRIPT = '''
+// The value of the input as Vue sees it: the model of the closest Vue component of the input
+// that has a text model (Vuetify inputs keep it in lazyValue).
+for (let node = arguments[0]; node !== null; node = node.parentElement) {
+    const component = node.__vue__;
+    if (component === undefined) {
+        continue;
+    }
+    const value = typeof component.lazyValue === 'string' ? component.lazyValue : component.value;
+    if (typeof value === 'string') {
+        return [value.length, value.split('\\n').length];
+    }
+}
+return null;
+'''
+
+
 class InputSettings(PageObject):
     """Represents the Input Settings (step 1) on the Add Job page in Webadmin."""
 
@@ -47,12 +80,14 @@ class InputSettings(PageObject):
         )
 
     @property
+    @cached_locator
     def __hash_file_input(self) -> WebElement:
         label = self.driver.find_element(By.XPATH,'//label[text()="Select a file to read"]')
         input_id = label.get_attribute('for')
         return self.driver.find_element(By.ID,input_id)
 
     @property
+    @cached_locator
     def __encrypted_file_input(self) -> WebElement:
         label = self.driver.find_element(By.XPATH,'//label[text()="Select files"]')
         input_id = label.get_attribute('for')
@@ -65,26 +100,77 @@ class InputSettings(PageObject):
     def select_hash_type_exactly(self,hashtype:str) -> None:
         """Selects the hashtype that best matches the given `hashtype` string.
         Works by inputing the string into the hashtype-selection input and picking the first
-        found option in the dropdown.
+        found option in the dropdown. When the Hashcat mode is known,
+        use `select_hash_type_by_mode`, which is faster and picks the right option even when
+        the string matches several hash types.
         """
         self.__hash_type_selection_input.click()
         clear_workaround(self.__hash_type_selection_input)
         self.__hash_type_selection_input.send_keys(hashtype)
         WebDriverWait(self.driver,30,ignored_exceptions={JavascriptException, NoSuchElementException}).until(lambda _: self.__hash_type_selection_list.is_displayed)
-        ActionChains(self.driver).pause(2).perform() # Wait for 2 seconds to make sure vuejs animation is over
+        wait_for_animations_to_finish(self.driver,self.driver.find_element(By.CSS_SELECTOR,'.menuable__content__active'))
         self.__hash_type_selection_list.find_element(By.CSS_SELECTOR,'div:nth-child(1)').click()
         click_away(self.driver)
 
+    def select_hash_type_by_mode(self,mode:Union[int,str]) -> None:
+        """Selects the hash type with the given Hashcat mode (e.g. 1400 for SHA2-256).
+        The name of the hash type is looked up in the HashTypeCatalog, set as the search text of
+        the hashtype-selection input at once, and the option with exactly that name is clicked.
+        If the catalog was read from the disk cache and the lookup or the selection fails,
+        the catalog is fetched again from Webadmin and the selection is retried.
+        ValueError is raised if Webadmin does not offer the hash type.
+        """
+        catalog = HashTypeCatalog.for_driver(self.driver)
+        try:
+            self.__select_hash_type_named(catalog.name_of(mode))
+        except (ValueError, TimeoutException):
+            if catalog.fetched:
+                raise
+            self.__select_hash_type_named(HashTypeCatalog.for_driver(self.driver,refetch=True).name_of(mode))
+
+    def __select_hash_type_named(self,name:str) -> None:
+        self.__hash_type_selection_input.click()
+        self.driver.execute_script(_BULK_INPUT_SCRIPT,self.__hash_type_selection_input,name)
+        option : WebElement = WebDriverWait(self.driver,30,ignored_exceptions={JavascriptException, NoSuchElementException}).until(
+            lambda driver: driver.execute_script(_HASH_TYPE_OPTION_SCRIPT,self.__hash_type_selection_list,name)
+        )
+        option.click()
+        click_away(self.driver)
+
     def get_selected_hash_type(self) -> str:
         """Return the hash type that has been selected, as shown in the hash-type selector."""
         return self.__hash_type_selection_input.get_attribute('value')
 
     def input_hashes_manually(self,hashes:List[str]):
-        """Given a list of hashes, sets these as the attack input. Clears already input hashes."""
+        """Given a list of hashes, sets these as the attack input. Clears already input hashes.
+        The hashes are typed in key by key, like a user would; for long lists of hashes,
+        use `input_hashes_in_bulk`.
+        """
         self.__manual_entry_button.click()
         clear_workaround(self.__hash_input_field)
         self.__hash_input_field.send_keys('\n'.join(hashes))
 
+    def input_hashes_in_bulk(self,hashes:List[str]):
+        """Works like `input_hashes_manually`, but sets the whole input with a single script call
+        and a single `input` event instead of typing it in key by key (which takes minutes with
+        tens of thousands of hashes, as Webadmin processes every keystroke).
+        Afterwards verifies that Webadmin has taken in all the hashes, i.e. that the model of the
+        input's Vue component (not just the DOM value, which the script sets itself) holds them;
+        raises InvalidStateError if it does not.
+        """
+        self.__manual_entry_button.click()
+        text = '\n'.join(hashes)
+        hash_input_field = self.__hash_input_field
+        self.driver.execute_script(_BULK_INPUT_SCRIPT,hash_input_field,text)
+        expected = [len(text),text.count('\n')+1]
+        try:
+            WebDriverWait(self.driver,10).until(lambda driver: driver.execute_script(_INPUT_MODEL_SIZE_SCRIPT,hash_input_field) == expected)
+        except TimeoutException:
+            raise InvalidStateError(
+                f'Webadmin did not take in the {len(hashes)} hashes that were input in bulk (expected length '
+                f'and line count of the input model {expected}, got {self.driver.execute_script(_INPUT_MODEL_SIZE_SCRIPT,hash_input_field)}).'
+            )
+
     def get_input_hashes(self) -> List[str]:
         input_hashes_raw = self.__hash_input_field.get_attribute('value')
         return input_hashes_raw.splitlines()
@@ -7,11 +7,9 @@ from typing import TYPE_CHECKING, List
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.relative_locator import locate_with
-from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver import ActionChains
 
-from page_object.common.page_object import PageObject
+from page_object.add_job_page.attack_settings_panel import AttackSettingsPanel
+from page_object.common.locator_cache import cached_locator
 from page_object.table.rule_file_selection import RuleFileSelection
 from page_object.table.pcfg_grammar_selection import PCFGGrammarSelection
 from page_object.table.table_manipulation import build_table_row_objects_from_table, activate_elements_from_table_by_list_lookup, show_as_many_rows_per_table_page_as_possible
@@ -21,32 +19,25 @@ if TYPE_CHECKING:
     from selenium.webdriver.remote.webelement import WebElement
 
 
-class PCFGAttackSettings(PageObject):
+class PCFGAttackSettings(AttackSettingsPanel):
     """This class represents the PCFG-attack settings in the Add Job page."""
 
-    def ensure_loaded(self) -> None:
-        """Waits until PCFG-grammar and ruleset files are loaded, then waits for five more seconds
-        for vuejs to settle and finish all animations and DOM manipulation.
-        """
-        try:
-            WebDriverWait(self.driver,30).until(lambda _: len(self.get_available_pcfgs()) != 0 and len(self.get_available_rule_files()) != 0)
-            ActionChains(self.driver).pause(5).perform()
-        except TimeoutException:
-            pass
-
     @property
+    @cached_locator
     def __pcfg_grammar_selection_table(self) -> WebElement:
         return self.driver.find_element(
             locate_with(By.TAG_NAME,'table').below({By.XPATH:'//span[text()[contains(.,"Select PCFG grammar")]]'})  # type: ignore
         )
 
     @property
+    @cached_locator
     def __rulefile_selection_table(self) -> WebElement:
         return self.driver.find_element(
             locate_with(By.TAG_NAME,'table').below({By.XPATH:'//span[text()[contains(.,"Select rule file")]]'})  # type: ignore
         )
 
     @property
+    @cached_locator
     def __keyspace_limit_input(self) -> WebElement:
         return self.driver.find_element(
             locate_with(By.TAG_NAME,'input').below({By.XPATH:'//span[text()[contains(.,"Edit keyspace limit")]]'})  # type: ignore
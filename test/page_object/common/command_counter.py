@@ -0,0 +1,117 @@
+"""This module provides counting of the commands sent to the WebDriver.
+
+CommandStatistics --
+number and total time of WebDriver commands
+
+CommandCounter --
+counts the commands of the WebDriver instances it is installed into
+
+command_budget --
+decorator for page-object methods that may send at most a given number of commands
+
+Every WebDriver command (locating an element, reading its text, running a script, ...) is an HTTP
+round trip to the WebDriver, and round trips are what makes the tests slow. A page-object method
+that sends a command for every row of a table works fine with a short table, so regressions like
+that are easy to miss; a budget on the method catches them as soon as the method is run.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass, field
+from collections import defaultdict
+from typing import TYPE_CHECKING, Callable, Dict, Optional, TypeVar, Any
+import functools
+import sys
+import time
+
+from page_object.common.exception import CommandBudgetExceededError
+from page_object.common.page_object import PageObject
+
+if TYPE_CHECKING:
+    from types import FrameType
+    from selenium.webdriver.remote.webdriver import WebDriver
+    F = TypeVar('F',bound=Callable[...,Any])
+
+
+@dataclass
+class CommandStatistics:
+    """Number of commands and the total time (in seconds) they took."""
+    count : int = 0
+    time : float = 0.0
+
+    def add(self,duration:float) -> None:
+        self.count += 1
+        self.time += duration
+
+
+@dataclass
+class CommandCounter:
+    """Counts and times the commands sent by the WebDriver instances it is installed into (see
+    `install`), in total, by command name (like 'findElement' or 'executeScript') and by the
+    page-object method that sent them.
+
+    The method a command is attributed to is the innermost public method of a page object in the
+    call stack (e.g. 'JobDetailPage.get_hashes'); commands sent from elsewhere (tests, fixtures)
+    are attributed to None.
+    """
+    total : CommandStatistics = field(default_factory=CommandStatistics)
+    by_command : Dict[str,CommandStatistics] = field(default_factory=lambda: defaultdict(CommandStatistics))
+    by_method : Dict[Optional[str],CommandStatistics] = field(default_factory=lambda: defaultdict(CommandStatistics))
+
+    def install(self,driver:WebDriver) -> None:
+        """Makes the counter count the commands of `driver`. Installing it twice does nothing."""
+        executor = driver.command_executor
+        if getattr(executor,'_command_counter',None) is self:
+            return
+        execute = executor.execute
+        @functools.wraps(execute)
+        def counted_execute(command:str,params:Optional[dict]=None) -> Any:
+            start = time.perf_counter()
+            try:
+                return execute(command,params)
+            finally:
+                self.record(command,time.perf_counter()-start,_calling_page_object_method(sys._getframe(1)))
+        executor.execute = counted_execute # type: ignore
+        executor._command_counter = self # type: ignore
+
+    def record(self,command:str,duration:float,method:Optional[str]) -> None:
+        self.total.add(duration)
+        self.by_command[command].add(duration)
+        self.by_method[method].add(duration)
+
+
+COMMAND_COUNTER = CommandCounter()
+"""Counter of the commands of all the WebDriver instances of the test session."""
+
+
+def _calling_page_object_method(frame:Optional[FrameType]) -> Optional[str]:
+    """Returns the qualified name of the innermost public page-object method in the call stack
+    starting with `frame`."""
+    while frame is not None:
+        if isinstance(frame.f_locals.get('self'),PageObject) and not frame.f_code.co_name.startswith('_'):
+            return frame.f_code.co_qualname
+        frame = frame.f_back
+    return None
+
+
+def command_budget(max_commands:int) -> Callable[[F],F]:
+    """Decorator for page-object methods that makes them raise CommandBudgetExceededError if
+    a call sends more than `max_commands` WebDriver commands (counted by `COMMAND_COUNTER`,
+    including the commands of the methods it calls):
+
+    ```
+    @command_budget(3)
+    def get_hashes(self) -> List[tuple[str,str]]:
+        ...
+    ```
+    """
+    def decorator(method:F) -> F:
+        @functools.wraps(method)
+        def wrapper(*args,**kwargs):
+            count_before = COMMAND_COUNTER.total.count
+            result = method(*args,**kwargs)
+            used = COMMAND_COUNTER.total.count - count_before
+            if used > max_commands:
+                raise CommandBudgetExceededError(f'{method.__qualname__} sent {used} WebDriver commands; its budget is {max_commands}.')
+            return result
+        return wrapper # type: ignore
+    return decorator
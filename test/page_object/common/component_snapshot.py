@@ -0,0 +1,86 @@
+"""This module provides snapshots of page components that are read in a single WebDriver call.
+
+ComponentQuery --
+describes a single value (the text or an attribute of a sub-element) read from a component
+
+ComponentSnapshot --
+an immutable record of the values of a set of queries, as read at the time of the snapshot
+
+take_component_snapshots --
+reads the values of a set of queries for many components at once using a single script call
+
+Reading a value through a WebElement costs one HTTP round trip to the WebDriver for locating
+the sub-element and another one for reading its text. This adds up quickly with tables that
+have many rows, hence the snapshots.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, NamedTuple, Optional, Tuple, Union, List, Iterable
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+    from selenium.webdriver.remote.webelement import WebElement
+
+
+class ComponentQuery(NamedTuple):
+    """Describes a value to be read from a page component.
+    `css_selector` locates the sub-element within the component (just like
+    `element.find_element(By.CSS_SELECTOR,css_selector)` would) and `attribute` is the name of
+    the attribute to be read. If `attribute` is None, the text of the sub-element is read.
+    """
+    css_selector : str
+    attribute : Optional[str] = None
+
+
+@dataclass(frozen=True)
+class ComponentSnapshot:
+    """Immutable record of the values of a page component as they were at the time the snapshot
+    was taken. `queries` and `values` are aligned; the `queries` tuple is usually shared by all the
+    snapshots taken at once, so that the snapshot of a table row costs only its values.
+
+    A value is `False` if the sub-element of the query did not exist at the time of the snapshot.
+    """
+    queries : Tuple[ComponentQuery,...]
+    values : Tuple[Union[str,None,bool],...]
+
+    def __contains__(self,query:ComponentQuery) -> bool:
+        return query in self.queries
+
+    def __getitem__(self,query:ComponentQuery) -> Union[str,None,bool]:
+        return self.values[self.queries.index(query)]
+
+
+_SNAPSHOT_SCRIPT = '''
+const [root, selector, queries] = arguments;
+return Array.from(root.querySelectorAll(selector), component => [
+    component,
+    queries.map(([querySelector, attribute]) => {
+        const element = component.querySelector(querySelector);
+        if (element === null) {
+            return false;
+        }
+        if (attribute === null) {
+            return element.innerText.trim();
+        }
+        // Mimics WebElement.get_attribute, which prefers properties (e.g. the absolute URL of href).
+        const property = element[attribute];
+        return typeof property === 'string' ? property : element.getAttribute(attribute);
+    })
+]);
+'''
+
+
+def take_component_snapshots(driver:WebDriver,root:WebElement,selector:str,queries:Iterable[ComponentQuery]) -> List[Tuple[WebElement,ComponentSnapshot]]:
+    """Finds all elements matching the CSS `selector` within `root` and reads the values of
+    `queries` for each of them. Returns a list of tuples, where the first element is the found
+    WebElement and the second element is its snapshot.
+
+    Everything is done with a single `execute_script` call no matter how many elements
+    and queries there are.
+    """
+    queries = tuple(queries)
+    return [
+        (element, ComponentSnapshot(queries,tuple(values)))
+        for element, values in driver.execute_script(_SNAPSHOT_SCRIPT,root,selector,[list(query) for query in queries])
+    ]
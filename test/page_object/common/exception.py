@@ -9,3 +9,8 @@ class WebadminError(Exception):
     """Indicates that the action resulted in an error shown to the user by Webadmin.
     The body of the exception contains the error message.
     """
+
+class CommandBudgetExceededError(Exception):
+    """Indicates that a page-object method or a test sent more WebDriver commands than its budget
+    allows (see the `command_counter` module).
+    """
@@ -9,14 +9,29 @@ querying checkedness state of Webadmin checkboxes since the usual way does not w
 clear_workaround --
 the usual `element.clear()` method does not work for Webadmin <input>s for some reason;
 this should be used instead
+
+wait_for_animations_to_finish --
+waiting until Vuetify transitions and animations are over, instead of sleeping for a fixed time
+
+get_webadmin_auth --
+getting the headers and cookies needed for making requests to the Webadmin API ourselves
+
+stream_file_webadmin --
+downloading a (possibly huge) file from Webadmin to disk or another sink chunk by chunk
+
+normalise_line_endings --
+normalising line endings of a stream of chunks of bytes to `\n`
 """
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Union, overload, Callable, TypeVar, List
+from typing import TYPE_CHECKING, Union, overload, Callable, TypeVar, Iterable, Iterator, Optional, Tuple, Dict, BinaryIO
+from pathlib import Path
+import contextlib
 
 from selenium.webdriver import ActionChains
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
 import requests
 
 from page_object.common.exception import InvalidStateError
@@ -111,6 +126,56 @@ def scroll_into_view_workaround(element:WebElement) -> None:
     _ = element.screenshot_as_base64
     
 
+_WAIT_FOR_ANIMATIONS_SCRIPT = '''
+const [root, timeout, done] = [arguments[0] || document.documentElement, arguments[1], arguments[arguments.length - 1]];
+const deadline = performance.now() + timeout;
+// Animations that never end (e.g. loading spinners) are not waited for.
+const running = () => root.getAnimations({subtree: true}).filter(animation =>
+    animation.playState !== 'finished' && animation.playState !== 'idle'
+    && animation.effect !== null && animation.effect.getComputedTiming().endTime !== Infinity
+);
+// Vue starts transitions in the frame after the DOM change, so there is a two-frame grace period
+// before checking; the same goes for transitions started once the previous ones have ended.
+const settle = () => requestAnimationFrame(() => requestAnimationFrame(() => {
+    const animations = running();
+    if (animations.length === 0) {
+        done(true);
+    } else if (performance.now() > deadline) {
+        done(false);
+    } else {
+        Promise.race([
+            Promise.all(animations.map(animation => animation.finished.catch(() => null))),
+            new Promise(resolve => setTimeout(resolve, deadline - performance.now()))
+        ]).then(settle);
+    }
+}));
+settle();
+'''
+
+def wait_for_animations_to_finish(driver:WebDriver,element:Optional[WebElement]=None,timeout:float=10) -> None:
+    """Waits until all CSS transitions and animations (like the ones Vuetify uses when opening
+    dialogs, menus and expanding panels) in the subtree of `element` are over. If `element` is not
+    given, the whole document is watched. Animations that run forever (e.g. loading spinners)
+    are ignored.
+
+    Use this instead of sleeping for a fixed amount of time after an action that triggers an
+    animation; this returns as soon as the animations end. Raises TimeoutException if the
+    animations do not end within `timeout` seconds.
+    """
+    if not driver.execute_async_script(_WAIT_FOR_ANIMATIONS_SCRIPT,element,timeout*1000):
+        raise TimeoutException(f'Animations did not finish within {timeout} seconds.')
+
+
+def get_webadmin_auth(driver:WebDriver) -> Tuple[Dict[str,str],Dict[str,str]]:
+    """Returns the HTTP headers and cookies that authenticate requests to the Webadmin API
+    as the user logged into Webadmin in the browser; i.e. the `Authorization` header with the
+    `jwt` token from localStorage and the cookies of the browser.
+    """
+    jwt = driver.execute_script('return localStorage.getItem("jwt");')
+    cookies = {x['name']:x['value'] for x in driver.get_cookies()}
+    return {'Authorization': f'Bearer {jwt}'}, cookies
+
+
 @overload
 def download_file_webadmin(driver:WebDriver, link:str, as_binary:bool=False) -> str: ...
 @overload
@@ -125,18 +190,74 @@ def download_file_webadmin(driver:WebDriver, link:str, as_binary:bool=False) ->
     
     Selenium does not support file downloads, so we need to do downloads ourselves.
     """
-    jwt = driver.execute_script('return localStorage.getItem("jwt");')
-    cookies = {x['name']:x['value'] for x in driver.get_cookies()}
-    response = requests.get(link,cookies=cookies,headers={'Authorization': f'Bearer {jwt}'})
+    headers, cookies = get_webadmin_auth(driver)
+    response = _get_download_session().get(link,cookies=cookies,headers=headers)
     if as_binary:
         return response.content
     else:
         return response.text.replace('\r\n', '\n').replace('\r', '\n')
 
 
-def predicate_in_list(predicate:Callable[[X],bool],list:List[X]) -> X:
+def stream_file_webadmin(driver:WebDriver, link:str, destination:Union[str,Path,BinaryIO], as_binary:bool=False, chunk_size:int=1024*1024) -> int:
+    """Downloads a file given a link to it, like `download_file_webadmin`, but never holds more
+    than a chunk of it in memory, so it works with files of any size (e.g. multi-GB dictionaries).
+    `destination` is either a path of the file to write the download to or a binary sink
+    (any object with a `write(bytes)` method, like an open file or a hash object wrapper).
+    Returns the number of bytes written.
+
+    Line endings are normalised to `\n` as the chunks arrive, unless `as_binary=True`.
+    The normalisation works on bytes, so it assumes an ASCII-compatible encoding (like UTF-8),
+    which is what Webadmin serves.
+
+    Raises `requests.HTTPError` if Webadmin responds with an error.
+    """
+    headers, cookies = get_webadmin_auth(driver)
+    with contextlib.ExitStack() as stack:
+        response = stack.enter_context(_get_download_session().get(link,cookies=cookies,headers=headers,stream=True))
+        response.raise_for_status()
+        sink : BinaryIO = stack.enter_context(open(destination,'wb')) if isinstance(destination,(str,Path)) else destination
+        chunks : Iterable[bytes] = response.iter_content(chunk_size)
+        if not as_binary:
+            chunks = normalise_line_endings(chunks)
+        written = 0
+        for chunk in chunks:
+            sink.write(chunk)
+            written += len(chunk)
+        return written
+
+
+def normalise_line_endings(chunks:Iterable[bytes]) -> Iterator[bytes]:
+    """Yields the chunks of bytes with `\r\n` and `\r` line endings replaced by `\n`.
+    A `\r` at the end of a chunk is held back until the next chunk shows whether it is a part of `\r\n`.
+    """
+    pending_carriage_return = False
+    for chunk in chunks:
+        if pending_carriage_return:
+            chunk = b'\r' + chunk
+        pending_carriage_return = chunk.endswith(b'\r')
+        if pending_carriage_return:
+            chunk = chunk[:-1]
+        yield chunk.replace(b'\r\n',b'\n').replace(b'\r',b'\n')
+    if pending_carriage_return:
+        yield b'\n'
+
+
+_download_session : Optional[requests.Session] = None
+
+
+def _get_download_session() -> requests.Session:
+    """Returns the session shared by all downloads, so that they reuse connections to Webadmin."""
+    global _download_session
+    if _download_session is None:
+        _download_session = requests.Session()
+    return _download_session
+
+
+def predicate_in_list(predicate:Callable[[X],bool],list:Iterable[X]) -> X:
     """Returns the first instance in an iterable that satisfies the predicate.
     ValueError is raised if no element is found.
+    The iterable is consumed only up to the found instance, so lazy iterables
+    (like `iterate_table_elements`) stop early.
     """
     try:
         return next((x for x in list if predicate(x)))
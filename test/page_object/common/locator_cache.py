@@ -0,0 +1,61 @@
+"""This module provides caching of located elements for page objects.
+
+cached_locator --
+decorator for page-object locator methods/properties whose result should be cached
+
+LocatorCacheStatistics --
+hit and miss counters of the cache
+
+Page objects locate their elements anew every time a locator property is accessed.
+This is simple and robust, but some locators are expensive. A relative locator
+(`locate_with(...).near(...)` and the like) sends a large script to the browser on every call
+and a label lookup (find the label, read its `for` attribute, find the element by ID) takes
+three round trips. The decorated locators instead return the same WebElement until it goes
+stale (e.g. because Vue re-rendered that part of the page); it is then located again.
+
+Checking whether an element is stale costs a single cheap round trip, so decorating locators
+that consist of a single `find_element` call by ID or a simple CSS selector is pointless.
+Do not decorate locators of elements that can be hidden and later reused for something else
+without being removed from the page (like the contents of dialogs), as such elements never go
+stale.
+"""
+
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable, TypeVar
+import functools
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webelement import WebElement
+    from page_object.common.page_object import PageObject
+    T_PageObject = TypeVar('T_PageObject',bound=PageObject)
+
+
+@dataclass
+class LocatorCacheStatistics:
+    """Counts how many times a cached locator returned a cached element (hit)
+    and how many times the element had to be located (miss).
+    """
+    hits : int = 0
+    misses : int = 0
+
+
+LOCATOR_CACHE_STATISTICS = LocatorCacheStatistics()
+"""Statistics of all the locator caches of all page objects of the test session."""
+
+
+def cached_locator(locator:Callable[[T_PageObject],WebElement]) -> Callable[[T_PageObject],WebElement]:
+    """Decorator that makes a page-object locator cache its element.
+    Use it below `@property`:
+
+    ```
+    @property
+    @cached_locator
+    def __name_field(self) -> WebElement:
+        return self.driver.find_element(locate_with(...).near(...))
+    ```
+    """
+    @functools.wraps(locator)
+    def wrapper(self:T_PageObject) -> WebElement:
+        return self._locate_cached(locator.__qualname__,lambda: locator(self))
+    return wrapper
@@ -0,0 +1,88 @@
+"""This module provides monitoring of the requests Webadmin sends to its API.
+
+install_network_monitor --
+injecting a script that counts in-flight XHR and fetch requests into the page
+
+is_network_idle --
+checking whether there have been no requests in flight for a while
+
+Webadmin loads all its data (job lists, library tables, ...) through XHR requests to the
+Webadmin API, so once no request has been in flight for a short while, the shown data is loaded.
+Checking this is a single cheap script call, unlike scraping the shown data.
+
+The monitor lives in the JavaScript context of the page, so it is lost when the browser loads a
+new page (e.g. with `driver.get`). Webadmin is a single-page application, so navigating through
+the UI keeps the monitor intact; the monitor only needs to be installed again after `driver.get`.
+Requests that were started before the monitor was installed are not counted.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+
+_INSTALL_SCRIPT = '''
+if (!window.__fitcrackNetworkMonitor) {
+    const monitor = window.__fitcrackNetworkMonitor = {inFlight: 0, lastActivity: performance.now()};
+    const started = () => { monitor.inFlight++; monitor.lastActivity = performance.now(); };
+    const ended = () => { monitor.inFlight--; monitor.lastActivity = performance.now(); };
+
+    const send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function (...args) {
+        started();
+        try {
+            this.addEventListener('loadend', ended, {once: true});
+            return send.apply(this, args);
+        } catch (error) {
+            ended();
+            throw error;
+        }
+    };
+
+    const fetch = window.fetch;
+    window.fetch = function (...args) {
+        started();
+        try {
+            return fetch.apply(this, args).finally(ended);
+        } catch (error) {
+            ended();
+            throw error;
+        }
+    };
+}
+return performance.now();
+'''
+
+_IS_IDLE_SCRIPT = '''
+const [since, idleTime] = arguments;
+const monitor = window.__fitcrackNetworkMonitor;
+if (!monitor) {
+    return null;
+}
+return monitor.inFlight === 0 && performance.now() - Math.max(monitor.lastActivity, since) >= idleTime;
+'''
+
+
+def install_network_monitor(driver:WebDriver) -> float:
+    """Installs the network monitor into the current page, unless it is already installed.
+    Returns the current time of the page (`performance.now()`), which can be passed to
+    `is_network_idle` as `since`.
+    """
+    return driver.execute_script(_INSTALL_SCRIPT)
+
+
+def is_network_idle(driver:WebDriver,since:float,idle_time:float) -> bool:
+    """Returns whether no request has been in flight for `idle_time` seconds, counting only
+    the time after `since` (page time, as returned by `install_network_monitor`).
+    The waiting period after `since` gives the UI time to start sending requests after an action.
+
+    If the monitor is not installed (e.g. because a new page was loaded), it is installed and
+    False is returned.
+    """
+    idle = driver.execute_script(_IS_IDLE_SCRIPT,since,idle_time*1000)
+    if idle is None:
+        install_network_monitor(driver)
+        return False
+    return idle
@@ -1,19 +1,24 @@
 """Module containing the base page-object class."""
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, TypeVar, Optional, Tuple, Callable, Dict
 
 from selenium.webdriver.support.wait import WebDriverWait
-from selenium.common.exceptions import NoSuchElementException
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
 from selenium.webdriver.support.expected_conditions import invisibility_of_element, visibility_of
 from selenium.webdriver.common.by import By
 
 from page_object.common.webadmin_snackbar_notifcation import WebadminSnackbarNotification, WebadminSnackbarNotificationType
 from page_object.common.exception import InvalidStateError, WebadminError
+from page_object.common.component_snapshot import ComponentQuery
+from page_object.common.locator_cache import LocatorCacheStatistics, LOCATOR_CACHE_STATISTICS
+from page_object.common.network_monitor import install_network_monitor, is_network_idle
+from page_object.common.helper import wait_for_animations_to_finish
 
 if TYPE_CHECKING:
     from selenium.webdriver.remote.webdriver import WebDriver
     from selenium.webdriver.remote.webelement import WebElement
+    from page_object.common.component_snapshot import ComponentSnapshot
     T_PageComponentObject = TypeVar('T_PageComponentObject',bound=PageComponentObject) #type: ignore
 
 class PageObject:
@@ -31,10 +36,16 @@ class PageObject:
     specifying using the parameter `no_ensure_loaded=True` when creating a page object.
     This is necessary when creating the first object in a script, as the web browser starts on
     blank page.
+
+    Locators that are expensive can be decorated with `cached_locator` (see the `locator_cache`
+    module) to make them return the same element until it goes stale. Each page object has its own
+    cache; `locator_cache_statistics` shows how many lookups the cache saved.
     """
 
     def __init__(self,driver:WebDriver,no_ensure_loaded=False):
         self.driver = driver
+        self._locator_cache : Dict[str,WebElement] = {}
+        self.locator_cache_statistics = LocatorCacheStatistics()
         if not no_ensure_loaded:
             self.ensure_loaded()
 
@@ -47,6 +58,35 @@ class PageObject:
         and it should raise an exception if the UI isn't ready within a time limit.
         """
 
+    def wait_for_network_idle(self,timeout:float=30,idle_time:float=0.5) -> None:
+        """Waits until Webadmin has had no API request in flight for `idle_time` seconds
+        (see the `network_monitor` module), counting from the moment this method is called.
+        This means that the data Webadmin fetched (e.g. the rows of a table) have arrived.
+        Raises TimeoutException if the network does not become idle within `timeout` seconds.
+        """
+        since = install_network_monitor(self.driver)
+        WebDriverWait(self.driver,timeout).until(lambda driver: is_network_idle(driver,since,idle_time))
+
+    def _locate_cached(self,key:str,locate:Callable[[],WebElement]) -> WebElement:
+        """Returns the element cached under `key` if it is not stale;
+        otherwise locates the element using `locate` and caches it.
+        You probably want to use the `cached_locator` decorator instead of calling this directly.
+        """
+        element = self._locator_cache.get(key)
+        if element is not None:
+            try:
+                element.is_enabled() # Cheap call that raises an exception if the element is stale.
+                self.locator_cache_statistics.hits += 1
+                LOCATOR_CACHE_STATISTICS.hits += 1
+                return element
+            except StaleElementReferenceException:
+                del self._locator_cache[key]
+        element = locate()
+        self._locator_cache[key] = element
+        self.locator_cache_statistics.misses += 1
+        LOCATOR_CACHE_STATISTICS.misses += 1
+        return element
+
     @property
     def _snackbar_notification_text(self) -> WebElement:
         return self.driver.find_element(By.CSS_SELECTOR,'.errorSnackbar .v-alert__content')
@@ -61,6 +101,12 @@ class PageObject:
         except NoSuchElementException:
             pass
 
+    def _wait_until_dialog_opens(self,timeout:float=10) -> WebElement:
+        """Waits until a dialog is shown and its opening animation is over. Returns the dialog."""
+        dialog = WebDriverWait(self.driver,timeout,ignored_exceptions={NoSuchElementException}).until(lambda _: self._dialog_window)
+        wait_for_animations_to_finish(self.driver,dialog,timeout)
+        return dialog
+
     def _wait_until_dialog_closes(self,timeout:float=10) -> None:
         try:
             WebDriverWait(self.driver,timeout).until(invisibility_of_element(self._dialog_window))
@@ -100,7 +146,48 @@ class PageComponentObject(PageObject):
     `self._element.find_element(By.CSS_SELECTOR,'td:nth-child(1)')`
     for the first column (first <td>) element. This allows us to not use clunky
     global locators that search through the entire document's DOM tree.
+
+    Values that are read from the component should be declared as `ComponentQuery` class
+    attributes and read using the `_query` method. This allows the component to be created from a
+    `ComponentSnapshot` (see `take_component_snapshots`), in which case the values are taken from
+    the snapshot instead of being read one by one through the WebDriver. The `_element` property
+    is still a live WebElement, so it can be used for clicking and such. Once the component
+    is interacted with, the snapshot should be dropped with `_invalidate_snapshot`, as the values
+    in it may no longer be up to date.
     """
-    def __init__(self,driver:WebDriver,element:WebElement):
+    def __init__(self,driver:WebDriver,element:WebElement,snapshot:Optional[ComponentSnapshot]=None):
         super().__init__(driver)
-        self._element = element
\ No newline at end of file
+        self._element = element
+        self._snapshot = snapshot
+
+    @classmethod
+    def snapshot_queries(cls) -> Tuple[ComponentQuery,...]:
+        """Returns all the `ComponentQuery` class attributes of the class (including inherited
+        ones, with overriding respected). These are the queries a snapshot of the component should
+        contain.
+        """
+        names = dict.fromkeys(
+            name
+            for klass in reversed(cls.__mro__)
+            for name, value in vars(klass).items()
+            if isinstance(value,ComponentQuery)
+        )
+        return tuple(dict.fromkeys(getattr(cls,name) for name in names))
+
+    def _query(self,query:ComponentQuery) -> str:
+        """Returns the value described by `query`, taking it from the snapshot if possible.
+        Raises NoSuchElementException if the queried sub-element does not exist.
+        """
+        if self._snapshot is not None and query in self._snapshot:
+            value = self._snapshot[query]
+            if value is False:
+                raise NoSuchElementException(f'No element matching "{query.css_selector}" in snapshot of component.')
+            return value #type: ignore
+        element = self._element.find_element(By.CSS_SELECTOR,query.css_selector)
+        if query.attribute is None:
+            return element.text
+        return element.get_attribute(query.attribute)
+
+    def _invalidate_snapshot(self) -> None:
+        """Drops the snapshot of the component; values are read from the live element from then on."""
+        self._snapshot = None
\ No newline at end of file
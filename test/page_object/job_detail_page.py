@@ -7,31 +7,47 @@ WorkunitEntry -- a page-component object representing a row in the workunits tab
 """
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
+from urllib.parse import urlparse
 
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support.relative_locator import locate_with
-from selenium.webdriver import ActionChains
 
 from page_object.common.page_object import PageObject, PageComponentObject
+from page_object.common.locator_cache import cached_locator
+from page_object.common.command_counter import command_budget
 from page_object.common.helper import click_away
 from page_object.common.exception import InvalidStateError
+from page_object.common.network_monitor import install_network_monitor
+from page_object.common.component_snapshot import ComponentQuery
 from page_object.table.host_selection import HostSelection
-from page_object.table.table_manipulation import build_table_row_objects_from_table, activate_elements_from_table_by_list_lookup, load_table_elements
+from page_object.table.table_manipulation import build_table_row_objects_from_table, activate_elements_from_table_by_list_lookup, load_table_elements, snapshot_table_rows
+from webadmin_api.job_watcher import watch_job_until_finished
 
 if TYPE_CHECKING:
     from selenium.webdriver.remote.webelement import WebElement
+    from webadmin_api.client import WebadminApiClient
+    from webadmin_api.job_watcher import JobStateTransition
 
 
 class JobDetailPage(PageObject):
     """Represents the page showing the details of specific job."""
 
+    URL_PATH = '/jobs/{job_id}'
+
     def ensure_loaded(self):
         """Waits until the state of the job appears on the page."""
         WebDriverWait(self.driver,30).until(lambda _: self.get_job_state() != '')
 
+    def navigate(self,prefix:str,job_id:int) -> None:
+        """Navigates to the details page of the job with the given ID. `prefix` is the base URL
+        where Webadmin runs. So for example https://www.fitcrack.com (no forward slash).
+        """
+        self.driver.get(prefix+self.URL_PATH.format(job_id=job_id))
+        install_network_monitor(self.driver)
+
     @property
     def __start_button(self) -> WebElement:
         return self.driver.find_element(By.XPATH,'//span[text()[contains(.,"start")]]')
@@ -61,6 +77,7 @@ class JobDetailPage(PageObject):
         return self._dialog_window.find_element(By.ID,'host-mapper-assign')
 
     @property
+    @cached_locator
     def __active_hosts_table(self) -> WebElement:
         return self.driver.find_element(
             locate_with(By.TAG_NAME,'table').above(self.__assign_hosts_button) #type: ignore
@@ -70,15 +87,15 @@ class JobDetailPage(PageObject):
     def __workunit_table(self) -> WebElement:
         return self.driver.find_element(By.XPATH,'//b[text()[contains(.,"Workunits")]]/ancestor::div[contains(@class, "wu-container")][1]//table')   
 
+    @command_budget(3)
     def get_hashes(self) -> List[tuple[str,str]]:
         """Return a list of tuples, where the first element is an input hash of the cracking job
         and the second element is the recovered password. If the password is not cracked, then
         the second element is an empty string."""
+        hash_field, password_field = ComponentQuery('td:nth-child(1)'), ComponentQuery('td:nth-child(2)')
         return [
-            (
-                tableRow.find_element(By.CSS_SELECTOR,'td:nth-child(1)').text,
-                tableRow.find_element(By.CSS_SELECTOR,'td:nth-child(2)').text
-            ) for tableRow in self.__hash_table.find_elements(By.CSS_SELECTOR,'tbody tr')
+            (row_snapshot[hash_field], row_snapshot[password_field]) #type: ignore
+            for _, row_snapshot in snapshot_table_rows(self.driver,self.__hash_table,(hash_field,password_field))
         ]
 
     def start_job(self) -> None:
@@ -102,7 +119,7 @@ class JobDetailPage(PageObject):
 
     def select_hosts_for_job(self,desired_hosts:List[str]) -> None:
         self.__assign_hosts_button.click()
-        ActionChains(self.driver).pause(4).perform() #Wait for animation to finish
+        self._wait_until_dialog_opens()
         hosts = build_table_row_objects_from_table(self.driver,self.__assign_hosts_table,HostSelection)
         activate_elements_from_table_by_list_lookup(hosts,lambda x: x.name, desired_hosts)
         self.__assign_hosts_confirm_button.click()
@@ -113,43 +130,55 @@ class JobDetailPage(PageObject):
     def get_active_hosts(self) -> List[ActiveHostEntry]:
         return load_table_elements(self.driver,self.__active_hosts_table,ActiveHostEntry,no_element_text='None assigned',no_ensure_most=True)
 
+    def get_job_id(self) -> int:
+        """Returns the ID of the job (taken from the URL of the page)."""
+        return int(urlparse(self.driver.current_url).path.rstrip('/').rsplit('/',1)[-1])
+
     def check_if_job_finished(self) -> bool:
         return self.get_job_state() in ['Finished','Exhausted','Timeout']
     
-    def wait_until_job_finished(self,timeout:float) -> None:
-        WebDriverWait(self.driver,timeout).until(lambda _: self.check_if_job_finished())
+    def wait_until_job_finished(self,timeout:float,webadmin_api:Optional[WebadminApiClient]=None) -> List[JobStateTransition]:
+        """Waits until the job finishes; raises TimeoutException if it does not finish within
+        `timeout` seconds.
+
+        If `webadmin_api` is given, the state of the job is polled through the API (see
+        `watch_job_until_finished`) and the page is only checked once the API reports the job as
+        finished, giving the page a moment to show the new state. The states the job went through
+        are returned. Without `webadmin_api`, the state shown on the page is polled and an empty
+        list is returned.
+        """
+        if webadmin_api is None:
+            WebDriverWait(self.driver,timeout).until(lambda _: self.check_if_job_finished())
+            return []
+        transitions = watch_job_until_finished(webadmin_api,self.get_job_id(),timeout)
+        WebDriverWait(self.driver,30).until(lambda _: self.check_if_job_finished())
+        return transitions
 
     def get_workunits(self) -> List[WorkunitEntry]:
         return load_table_elements(self.driver,self.__workunit_table,WorkunitEntry)
 
 
 class ActiveHostEntry(PageComponentObject):
-    @property
-    def __name_field(self) -> WebElement:
-        return self._element.find_element(By.CSS_SELECTOR,'td:nth-child(1) a')
-
-    @property
-    def __ip_address_field(self) -> WebElement:
-        return self._element.find_element(By.CSS_SELECTOR,'td:nth-child(2)')
+    __name_field = ComponentQuery('td:nth-child(1) a')
+    __name_link = ComponentQuery('td:nth-child(1) a','href')
+    __ip_address_field = ComponentQuery('td:nth-child(2)')
+    __online_field = ComponentQuery('td:nth-child(3)')
+    __online_icon = ComponentQuery('td:nth-child(3) .mdi-power','class')
 
-    @property
-    def __online_field(self) -> WebElement:
-        return self._element.find_element(By.CSS_SELECTOR,'td:nth-child(3)')
-    
     @property
     def name(self) -> str:
         """The name of the host."""
-        return self.__name_field.text
+        return self._query(self.__name_field)
 
     @property
     def host_id(self) -> int:
         """The internal host ID used by Fitcrack Webadmin."""
-        return int(self.__name_field.get_attribute('href').split('/')[-1])
+        return int(self._query(self.__name_link).split('/')[-1])
     
     @property
     def ip_address(self) -> str:
         """The IP address of the host."""
-        return self.__ip_address_field.text
+        return self._query(self.__ip_address_field)
     
     @property
     def online_status(self) -> str:
@@ -157,93 +186,68 @@ class ActiveHostEntry(PageComponentObject):
         otherwise it should contain "N days ago" or some such, as shown in Webadmin.
         """
         try:
-            self.__online_field.find_element(By.CLASS_NAME,'mdi-power')
+            self._query(self.__online_icon)
             return 'online'
         except NoSuchElementException:
-            return self.__online_field.text
+            return self._query(self.__online_field)
 
 
 class WorkunitEntry(PageComponentObject):
-    @property
-    def __host_field(self) -> WebElement:
-        return self._element.find_element(By.CSS_SELECTOR, 'td:nth-child(1) a span')
-    
-    @property
-    def __progress_field(self) -> WebElement:
-        return self._element.find_element(By.CSS_SELECTOR, 'td:nth-child(2) div span')
-    
-    @property
-    def __speed_field(self) -> WebElement:
-        return self._element.find_element(By.CSS_SELECTOR, 'td:nth-child(3) span')
-    
-    @property
-    def __cracking_time_field(self) -> WebElement:
-        return self._element.find_element(By.CSS_SELECTOR, 'td:nth-child(4)')
-    
-    @property
-    def __generated_time_field(self) -> WebElement:
-        return self._element.find_element(By.CSS_SELECTOR, 'td:nth-child(5)')
-    
-    @property
-    def __start_index_field(self) -> WebElement:
-        return self._element.find_element(By.CSS_SELECTOR, 'td:nth-child(6)')
-    
-    @property
-    def __keyspace_field(self) -> WebElement:
-        return self._element.find_element(By.CSS_SELECTOR, 'td:nth-child(7)')
-    
-    @property
-    def __retry_field(self) -> WebElement:
-        return self._element.find_element(By.CSS_SELECTOR, 'td:nth-child(8) span span')
-    
-    @property
-    def __finished_field(self) -> WebElement:
-        return self._element.find_element(By.CSS_SELECTOR, 'td:nth-child(9) span span')
-    
+    __host_field = ComponentQuery('td:nth-child(1) a span')
+    __host_link = ComponentQuery('td:nth-child(1) a span','href')
+    __progress_field = ComponentQuery('td:nth-child(2) div span')
+    __speed_field = ComponentQuery('td:nth-child(3) span')
+    __cracking_time_field = ComponentQuery('td:nth-child(4)')
+    __generated_time_field = ComponentQuery('td:nth-child(5)')
+    __start_index_field = ComponentQuery('td:nth-child(6)')
+    __keyspace_field = ComponentQuery('td:nth-child(7)')
+    __retry_field = ComponentQuery('td:nth-child(8) span span')
+    __finished_field = ComponentQuery('td:nth-child(9) span span')
+
     @property
     def host(self) -> str:
         """The name of the host this workunit is assigned to."""
-        return self.__host_field.text
+        return self._query(self.__host_field)
     
     @property
     def host_id(self) -> int:
         """The internal host ID used by Fitcrack Webadmin."""
-        return int(self.__host_field.get_attribute('href').split('/')[-1])
+        return int(self._query(self.__host_link).split('/')[-1])
 
     @property
     def progress(self) -> int:
         """The progress of workunit in percent."""
-        return int(self.__progress_field.text[0:-2])
+        return int(self._query(self.__progress_field)[0:-2])
     
     @property
     def speed(self) -> str:
         """The cracking speed of the workunit, as shown in Webadmin."""
-        return self.__speed_field.text
+        return self._query(self.__speed_field)
     
     @property
     def cracking_time(self) -> str:
         """The cracking time spent on this workunit, as shown in Webadmin."""
-        return self.__cracking_time_field.text
+        return self._query(self.__cracking_time_field)
     
     @property
     def generated_time(self) -> str:
         """The time and date on which this workunit was generated, as shown in Webadmin."""
-        return self.__generated_time_field.text
+        return self._query(self.__generated_time_field)
     
     @property
     def start_index(self) -> int:
         """The start index of this workunit."""
-        return int(self.__start_index_field.text)
+        return int(self._query(self.__start_index_field))
     
     @property
     def keyspace(self) -> int:
         """The keyspace processed by this workunit."""
-        return int(self.__keyspace_field.text.replace(',',''))
+        return int(self._query(self.__keyspace_field).replace(',',''))
     
     @property
     def retried(self) -> bool:
         """Whether this workunit encountered a failure and is being retried."""
-        match self.__retry_field.text:
+        match self._query(self.__retry_field):
             case 'No':
                 return False
             case 'Yes':
@@ -254,7 +258,7 @@ class WorkunitEntry(PageComponentObject):
     @property
     def finished(self) -> bool:
         """Whether this workunit is finished and its results have been sent back."""
-        match self.__finished_field.text:
+        match self._query(self.__finished_field):
             case 'No':
                 return False
             case 'Yes':
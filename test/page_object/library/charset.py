@@ -1,15 +1,14 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, List, Union
+from typing import TYPE_CHECKING, ContextManager, Iterator, List, Union
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support.relative_locator import locate_with
-from selenium.common.exceptions import NoSuchElementException, ElementClickInterceptedException
 
 from page_object.common.page_object import PageObject
-from page_object.common.exception import InvalidStateError
+from page_object.common.locator_cache import cached_locator
 from page_object.table.charset_management_row import CharsetManagementRow
-from page_object.table.table_manipulation import load_table_elements
+from page_object.table.table_manipulation import load_table_elements, iterate_table_elements, find_table_row_by_name
 
 if TYPE_CHECKING:
     from selenium.webdriver.remote.webelement import WebElement
@@ -18,17 +17,18 @@ if TYPE_CHECKING:
 
 class CharsetManagement(PageObject):
     def ensure_loaded(self):
-        WebDriverWait(self.driver,30,ignored_exceptions={InvalidStateError,NoSuchElementException}).until(
-            lambda driver: 
-                driver.find_element(By.XPATH,'//*[contains(@class, "v-card__title") and text()[contains(.,"Charsets")]]')
-                and len(self.get_available_charset_files()) != 0
+        """Waits until the title of the page appears and the charsets are fetched from Webadmin."""
+        WebDriverWait(self.driver,30).until(
+            lambda driver: driver.find_element(By.XPATH,'//*[contains(@class, "v-card__title") and text()[contains(.,"Charsets")]]')
         )
+        self.wait_for_network_idle()
 
     @property
     def __charset_file_table(self) -> WebElement:
         return self.driver.find_element(By.TAG_NAME,'table')
     
     @property
+    @cached_locator
     def __upload_form(self) -> WebElement:
         return self.driver.find_element(
             locate_with(By.TAG_NAME,'form').below(self.__charset_file_table) #type: ignore
@@ -45,6 +45,16 @@ class CharsetManagement(PageObject):
     def get_available_charset_files(self) -> List[CharsetManagementRow]:
         return load_table_elements(self.driver,self.__charset_file_table,CharsetManagementRow)
 
+    def iterate_charset_files(self) -> Iterator[CharsetManagementRow]:
+        """Lazily yields the charset files from all pages of the table (see `iterate_table_elements`)."""
+        return iterate_table_elements(self.driver,self.__charset_file_table,CharsetManagementRow)
+
+    def find_row_by_name(self,name:str) -> ContextManager[CharsetManagementRow]:
+        """Context manager giving the charset with the given name, looked up through the search field
+        (see `find_table_row_by_name`). Raises ValueError if there is no such charset.
+        """
+        return find_table_row_by_name(self.driver,self.__charset_file_table,CharsetManagementRow,name)
+
     def upload_charset(self,filename:Union[str,Path]) -> None:
         self.__file_input.send_keys(str(filename))
         self.__upload_button.click()
@@ -1,17 +1,18 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, List, Union
+from typing import TYPE_CHECKING, ContextManager, Iterator, List, Union
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support.relative_locator import locate_with
-from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, ElementClickInterceptedException
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.support.expected_conditions import invisibility_of_element
 
 from page_object.common.page_object import PageObject
+from page_object.common.locator_cache import cached_locator
 from page_object.common.helper import get_checkbox_state, obstructed_click_workaround, click_away
 from page_object.common.exception import InvalidStateError
 from page_object.table.dictionary_management_row import DictionaryManagementRow
-from page_object.table.table_manipulation import build_table_row_objects_from_table, show_as_many_rows_per_table_page_as_possible
+from page_object.table.table_manipulation import build_table_row_objects_from_table, show_as_many_rows_per_table_page_as_possible, iterate_table_elements, find_table_row_by_name
 
 if TYPE_CHECKING:
     from selenium.webdriver.remote.webelement import WebElement
@@ -20,11 +21,11 @@ if TYPE_CHECKING:
 
 class DictionaryManagement(PageObject):
     def ensure_loaded(self):
-        WebDriverWait(self.driver,30,ignored_exceptions={InvalidStateError,NoSuchElementException,ElementClickInterceptedException}).until(
-            lambda driver:
-                driver.find_element(By.XPATH,'//*[contains(@class, "v-card__title") and text()[contains(.,"Dictionaries")]]')
-                and len(self.get_available_dictionaries()) != 0
+        """Waits until the title of the page appears and the dictionaries are fetched from Webadmin."""
+        WebDriverWait(self.driver,30).until(
+            lambda driver: driver.find_element(By.XPATH,'//*[contains(@class, "v-card__title") and text()[contains(.,"Dictionaries")]]')
         )
+        self.wait_for_network_idle()
 
     @property
     def __dictionary_table(self) -> WebElement:
@@ -39,12 +40,14 @@ class DictionaryManagement(PageObject):
         return self.driver.find_element(By.XPATH,'//span[text()[contains(.,"Upload new")]]')
 
     @property
+    @cached_locator
     def __sort_on_upload_checkbox(self) -> WebElement:
         label = self.driver.find_element(By.XPATH,'//label[text()="Sort on upload"]')
         input_id = label.get_attribute('for')
         return self.driver.find_element(By.ID,input_id)
 
     @property
+    @cached_locator
     def __hex_dictionary_checkbox(self) -> WebElement:
         label = self.driver.find_element(By.XPATH,'//label[text()="HEX dictionary"]')
         input_id = label.get_attribute('for')
@@ -78,6 +81,16 @@ class DictionaryManagement(PageObject):
 
         return build_table_row_objects_from_table(self.driver,self.__dictionary_table,DictionaryManagementRow)
 
+    def iterate_dictionaries(self) -> Iterator[DictionaryManagementRow]:
+        """Lazily yields the dictionaries from all pages of the table (see `iterate_table_elements`)."""
+        return iterate_table_elements(self.driver,self.__dictionary_table,DictionaryManagementRow)
+
+    def find_row_by_name(self,name:str) -> ContextManager[DictionaryManagementRow]:
+        """Context manager giving the dictionary with the given name, looked up through the search field
+        (see `find_table_row_by_name`). Raises ValueError if there is no such dictionary.
+        """
+        return find_table_row_by_name(self.driver,self.__dictionary_table,DictionaryManagementRow,name)
+
     def upload_dictionary(self,filename:Union[str,Path],sort_on_upload=False,hex_dictionary=False) -> None:
         if sort_on_upload != get_checkbox_state(self.__sort_on_upload_checkbox):
             obstructed_click_workaround(self.driver,self.__sort_on_upload_checkbox)
@@ -1,18 +1,15 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, List, Union
+from typing import TYPE_CHECKING, ContextManager, Iterator, List, Union
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support.relative_locator import locate_with
-from selenium.common.exceptions import NoSuchElementException
-from selenium.webdriver import ActionChains
 
 from page_object.common.page_object import PageObject
 from page_object.common.helper import click_away, predicate_in_list
-from page_object.common.exception import InvalidStateError
 from page_object.table.markov_file_management_row import MarkovFileManagementRow
 from page_object.table.dictionary_selection import DictionarySelection
-from page_object.table.table_manipulation import load_table_elements
+from page_object.table.table_manipulation import load_table_elements, iterate_table_elements, find_table_row_by_name
 
 if TYPE_CHECKING:
     from selenium.webdriver.remote.webelement import WebElement
@@ -21,11 +18,11 @@ if TYPE_CHECKING:
 
 class MarkovFileManagement(PageObject):
     def ensure_loaded(self):
-        WebDriverWait(self.driver,30,ignored_exceptions={InvalidStateError,NoSuchElementException}).until(
-            lambda driver: 
-            driver.find_element(By.XPATH,'//*[contains(@class, "v-card__title") and text()[contains(.,"Markov chains")]]')
-            and len(self.get_available_markov_files()) != 0
+        """Waits until the title of the page appears and the Markov files are fetched from Webadmin."""
+        WebDriverWait(self.driver,30).until(
+            lambda driver: driver.find_element(By.XPATH,'//*[contains(@class, "v-card__title") and text()[contains(.,"Markov chains")]]')
         )
+        self.wait_for_network_idle()
 
     @property
     def __markov_file_table(self) -> WebElement:
@@ -66,16 +63,25 @@ class MarkovFileManagement(PageObject):
     def get_available_markov_files(self) -> List[MarkovFileManagementRow]:
         return load_table_elements(self.driver,self.__markov_file_table,MarkovFileManagementRow)
 
+    def iterate_markov_files(self) -> Iterator[MarkovFileManagementRow]:
+        """Lazily yields the Markov files from all pages of the table (see `iterate_table_elements`)."""
+        return iterate_table_elements(self.driver,self.__markov_file_table,MarkovFileManagementRow)
+
+    def find_row_by_name(self,name:str) -> ContextManager[MarkovFileManagementRow]:
+        """Context manager giving the Markov file with the given name, looked up through the search field
+        (see `find_table_row_by_name`). Raises ValueError if there is no such Markov file.
+        """
+        return find_table_row_by_name(self.driver,self.__markov_file_table,MarkovFileManagementRow,name)
+
     def upload_markov_file(self,filename:Union[str,Path]) -> None:
         self.__add_new_button.click()
-        ActionChains(self.driver).pause(4).perform() #Wait for animation to finish
+        self._wait_until_dialog_opens()
         self.__upload_dialog_upload_file_mode_selector.click()
         self.__upload_dialog_file_input.send_keys(str(filename))
         self.__upload_dialog_upload_button.click()
         self.get_snackbar_notification(raise_exception_on_error=True)
         self._wait_until_snackbar_notification_disappears()
 
-
     def get_available_dictionaries(self) -> List[str]:
         self.__add_new_button.click()
         self.__upload_dialog_from_dictionary_mode_selector.click()
@@ -86,7 +92,7 @@ class MarkovFileManagement(PageObject):
     
     def make_markov_file_from_dictionary(self,dictionary_name:str):
         self.__add_new_button.click()
-        ActionChains(self.driver).pause(4).perform() #Wait for animation to finish
+        self._wait_until_dialog_opens()
         self.__upload_dialog_from_dictionary_mode_selector.click()
         dictionaries = load_table_elements(self.driver,self.__upload_dialog_from_dictionary_table,DictionarySelection,in_dialog=True)
         wanted_dictionary = predicate_in_list(lambda x: x.name == dictionary_name,dictionaries)
@@ -1,15 +1,14 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, List, Union
+from typing import TYPE_CHECKING, ContextManager, Iterator, List, Union
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support.relative_locator import locate_with
-from selenium.common.exceptions import NoSuchElementException
 
 from page_object.common.page_object import PageObject
-from page_object.common.exception import InvalidStateError
+from page_object.common.locator_cache import cached_locator
 from page_object.table.mask_management_row import MaskManagementRow
-from page_object.table.table_manipulation import load_table_elements
+from page_object.table.table_manipulation import load_table_elements, iterate_table_elements, find_table_row_by_name
 
 if TYPE_CHECKING:
     from selenium.webdriver.remote.webelement import WebElement
@@ -18,17 +17,18 @@ if TYPE_CHECKING:
 
 class MaskManagement(PageObject):
     def ensure_loaded(self):
-        WebDriverWait(self.driver,30,ignored_exceptions={InvalidStateError,NoSuchElementException}).until(
-            lambda driver: 
-                driver.find_element(By.XPATH,'//*[contains(@class, "v-card__title") and text()[contains(.,"Mask sets")]]')
-                and len(self.get_available_mask_files()) != 0
+        """Waits until the title of the page appears and the mask files are fetched from Webadmin."""
+        WebDriverWait(self.driver,30).until(
+            lambda driver: driver.find_element(By.XPATH,'//*[contains(@class, "v-card__title") and text()[contains(.,"Mask sets")]]')
         )
+        self.wait_for_network_idle()
 
     @property
     def __mask_file_table(self) -> WebElement:
         return self.driver.find_element(By.TAG_NAME,'table')
     
     @property
+    @cached_locator
     def __upload_form(self) -> WebElement:
         return self.driver.find_element(
             locate_with(By.TAG_NAME,'form').below(self.__mask_file_table) #type: ignore
@@ -45,6 +45,16 @@ class MaskManagement(PageObject):
     def get_available_mask_files(self) -> List[MaskManagementRow]:
         return load_table_elements(self.driver,self.__mask_file_table,MaskManagementRow)
 
+    def iterate_mask_files(self) -> Iterator[MaskManagementRow]:
+        """Lazily yields the mask files from all pages of the table (see `iterate_table_elements`)."""
+        return iterate_table_elements(self.driver,self.__mask_file_table,MaskManagementRow)
+
+    def find_row_by_name(self,name:str) -> ContextManager[MaskManagementRow]:
+        """Context manager giving the mask file with the given name, looked up through the search field
+        (see `find_table_row_by_name`). Raises ValueError if there is no such mask file.
+        """
+        return find_table_row_by_name(self.driver,self.__mask_file_table,MaskManagementRow,name)
+
     def upload_mask_file(self,filename:Union[str,Path]) -> None:
         self.__file_input.send_keys(str(filename))
         self.__upload_button.click()
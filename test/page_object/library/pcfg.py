@@ -1,18 +1,15 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, List, Union
+from typing import TYPE_CHECKING, ContextManager, Iterator, List, Union
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support.relative_locator import locate_with
-from selenium.common.exceptions import NoSuchElementException
-from selenium.webdriver import ActionChains
 
 from page_object.common.page_object import PageObject
 from page_object.common.helper import click_away, predicate_in_list
-from page_object.common.exception import InvalidStateError
 from page_object.table.pcfg_management_row import PCFGManagementRow
 from page_object.table.dictionary_selection import DictionarySelection
-from page_object.table.table_manipulation import load_table_elements
+from page_object.table.table_manipulation import load_table_elements, iterate_table_elements, find_table_row_by_name
 
 if TYPE_CHECKING:
     from selenium.webdriver.remote.webelement import WebElement
@@ -21,11 +18,11 @@ if TYPE_CHECKING:
 
 class PCFGManagement(PageObject):
     def ensure_loaded(self):
-        WebDriverWait(self.driver,30,ignored_exceptions={InvalidStateError,NoSuchElementException}).until(
-            lambda driver: 
-                driver.find_element(By.XPATH,'//*[contains(@class, "v-card__title") and text()[contains(.,"PCFGs")]]')
-                and len(self.get_available_pcfgs()) != 0
+        """Waits until the title of the page appears and the PCFG grammars are fetched from Webadmin."""
+        WebDriverWait(self.driver,30).until(
+            lambda driver: driver.find_element(By.XPATH,'//*[contains(@class, "v-card__title") and text()[contains(.,"PCFGs")]]')
         )
+        self.wait_for_network_idle()
 
     @property
     def __pcfg_file_table(self) -> WebElement:
@@ -66,9 +63,19 @@ class PCFGManagement(PageObject):
     def get_available_pcfgs(self) -> List[PCFGManagementRow]:
         return load_table_elements(self.driver,self.__pcfg_file_table,PCFGManagementRow)
 
+    def iterate_pcfgs(self) -> Iterator[PCFGManagementRow]:
+        """Lazily yields the PCFG grammars from all pages of the table (see `iterate_table_elements`)."""
+        return iterate_table_elements(self.driver,self.__pcfg_file_table,PCFGManagementRow)
+
+    def find_row_by_name(self,name:str) -> ContextManager[PCFGManagementRow]:
+        """Context manager giving the PCFG grammar with the given name, looked up through the search field
+        (see `find_table_row_by_name`). Raises ValueError if there is no such PCFG grammar.
+        """
+        return find_table_row_by_name(self.driver,self.__pcfg_file_table,PCFGManagementRow,name)
+
     def upload_pcfg(self,filename:Union[str,Path]) -> None:
         self.__add_new_button.click()
-        ActionChains(self.driver).pause(4).perform() #Wait for animation to finish
+        self._wait_until_dialog_opens()
         self.__upload_dialog_upload_file_mode_selector.click()
         self.__upload_dialog_file_input.send_keys(str(filename))
         self.__upload_dialog_upload_button.click()
@@ -85,7 +92,7 @@ class PCFGManagement(PageObject):
     
     def make_pcfg_from_dictionary(self,dictionary_name:str):
         self.__add_new_button.click()
-        ActionChains(self.driver).pause(4).perform() #Wait for animation to finish
+        self._wait_until_dialog_opens()
         self.__upload_dialog_from_dictionary_mode_selector.click()
         dictionaries = load_table_elements(self.driver,self.__upload_dialog_from_dictionary_table,DictionarySelection,in_dialog=True)
         wanted_dictionary = predicate_in_list(lambda x: x.name == dictionary_name,dictionaries)
@@ -1,16 +1,17 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, List, Union
+from typing import TYPE_CHECKING, ContextManager, Iterator, List, Union
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support.relative_locator import locate_with
-from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException, ElementClickInterceptedException
+from selenium.common.exceptions import StaleElementReferenceException
 
 from page_object.common.page_object import PageObject
+from page_object.common.locator_cache import cached_locator
 from page_object.common.helper import click_away
 from page_object.common.exception import InvalidStateError
 from page_object.table.rule_file_management_row import RuleFileManagementRow
-from page_object.table.table_manipulation import build_table_row_objects_from_table, show_as_many_rows_per_table_page_as_possible
+from page_object.table.table_manipulation import build_table_row_objects_from_table, show_as_many_rows_per_table_page_as_possible, iterate_table_elements, find_table_row_by_name
 
 if TYPE_CHECKING:
     from selenium.webdriver.remote.webelement import WebElement
@@ -19,17 +20,18 @@ if TYPE_CHECKING:
 
 class RuleFileManagement(PageObject):
     def ensure_loaded(self):
-        WebDriverWait(self.driver,30,ignored_exceptions={InvalidStateError,NoSuchElementException,ElementClickInterceptedException}).until(
-            lambda driver: 
-                driver.find_element(By.XPATH,'//*[contains(@class, "v-card__title") and text()[contains(.,"Rules")]]')
-                and len(self.get_available_rule_files()) != 0
+        """Waits until the title of the page appears and the rule files are fetched from Webadmin."""
+        WebDriverWait(self.driver,30).until(
+            lambda driver: driver.find_element(By.XPATH,'//*[contains(@class, "v-card__title") and text()[contains(.,"Rules")]]')
         )
+        self.wait_for_network_idle()
 
     @property
     def __rule_file_table(self) -> WebElement:
         return self.driver.find_element(By.TAG_NAME,'table')
     
     @property
+    @cached_locator
     def __upload_form(self) -> WebElement:
         return self.driver.find_element(
             locate_with(By.TAG_NAME,'form').below(self.__rule_file_table) #type: ignore
@@ -59,6 +61,16 @@ class RuleFileManagement(PageObject):
 
         return build_table_row_objects_from_table(self.driver,self.__rule_file_table,RuleFileManagementRow)
 
+    def iterate_rule_files(self) -> Iterator[RuleFileManagementRow]:
+        """Lazily yields the rule files from all pages of the table (see `iterate_table_elements`)."""
+        return iterate_table_elements(self.driver,self.__rule_file_table,RuleFileManagementRow)
+
+    def find_row_by_name(self,name:str) -> ContextManager[RuleFileManagementRow]:
+        """Context manager giving the rule file with the given name, looked up through the search field
+        (see `find_table_row_by_name`). Raises ValueError if there is no such rule file.
+        """
+        return find_table_row_by_name(self.driver,self.__rule_file_table,RuleFileManagementRow,name)
+
     def upload_rule_file(self,filename:Union[str,Path]) -> None:
         self.__file_input.send_keys(str(filename))
         self.__upload_button.click()
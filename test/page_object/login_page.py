@@ -1,21 +1,35 @@
 """Page object representing the login page.
-Exports single class--the aforementioned page object.
+
+LoginPage --
+the aforementioned page object
+
+LoginSession --
+the authenticated state of a browser (the contents of localStorage and the cookies)
+
+capture_login_session --
+reading the authenticated state from a logged-in browser
+
+restore_login_session --
+making a browser logged in by restoring a captured state, without going through the login form
 """
 
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple, Dict, List, Tuple, Any
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
-from selenium.common.exceptions import JavascriptException, NoSuchElementException
+from selenium.common.exceptions import JavascriptException, NoSuchElementException, TimeoutException
 from selenium.webdriver.support.relative_locator import locate_with
 
 from page_object.common.page_object import PageObject
 from page_object.dashboard import Dashboard
 from page_object.side_bar import SideBar
 from page_object.common.helper import clear_workaround
+from page_object.common.network_monitor import install_network_monitor
+from page_object.common.exception import InvalidStateError
 
 if TYPE_CHECKING:
+    from selenium.webdriver.remote.webdriver import WebDriver
     from selenium.webdriver.remote.webelement import WebElement
 
 
@@ -45,6 +59,7 @@ class LoginPage(PageObject):
         So for example https://www.fitcrack.com (no forward slash).
         """
         self.driver.get(prefix+self.URL_PATH)
+        install_network_monitor(self.driver)
 
     def login(self,username:str,password:str) -> tuple[SideBar,Dashboard]:
         """Logs into Fitcrack Webadmin with the given username and password.
@@ -58,3 +73,63 @@ class LoginPage(PageObject):
         
         self.__submit_button.click()
         return SideBar(self.driver), Dashboard(self.driver)
+
+
+class LoginSession(NamedTuple):
+    """The authenticated state of a browser logged into Webadmin.
+    `local_storage` holds the contents of localStorage (which includes the `jwt` token Webadmin
+    authenticates its API requests with) and `cookies` holds the cookies as returned by
+    `driver.get_cookies()`.
+    """
+    local_storage : Dict[str,str]
+    cookies : List[Dict[str,Any]]
+
+
+def capture_login_session(driver:WebDriver) -> LoginSession:
+    """Reads the authenticated state of a browser that is logged into Webadmin."""
+    local_storage = driver.execute_script('return Object.assign({}, localStorage);')
+    return LoginSession(local_storage,driver.get_cookies())
+
+
+_RESTORE_SCRIPT = '''
+const [localStorageItems, cookies] = arguments;
+for (const [key, value] of Object.entries(localStorageItems)) {
+    localStorage.setItem(key, value);
+}
+for (const cookie of cookies) {
+    document.cookie = `${cookie.name}=${cookie.value}; path=${cookie.path || '/'}`;
+}
+'''
+
+
+def restore_login_session(driver:WebDriver,base_url:str,session:LoginSession,path:str='/') -> Tuple[SideBar,Dashboard]:
+    """Makes the browser logged into Webadmin by restoring a state captured with
+    `capture_login_session` (possibly in another browser), and navigates to `path`.
+    `base_url` is the base URL where Webadmin runs (no trailing forward slash).
+    Returns a SideBar object and a Dashboard object; the Dashboard object is useable only if
+    `path` leads to the dashboard.
+
+    This is much faster than logging in through the login page: loading the login page, filling in
+    the form and waiting for the dashboard is replaced by loading a page that does not start
+    Webadmin, a single script call and loading the target page.
+
+    Raises InvalidStateError if Webadmin does not accept the restored state (e.g. because the
+    token expired) and shows the login page instead, or if it shows neither in time.
+    """
+    # The state can only be restored on a page of the Webadmin origin, but it need not be a page of
+    # Webadmin itself; even an error page will do.
+    driver.get(base_url+'/favicon.ico')
+    http_only_cookies = [cookie for cookie in session.cookies if cookie.get('httpOnly')]
+    driver.execute_script(_RESTORE_SCRIPT,session.local_storage,[cookie for cookie in session.cookies if not cookie.get('httpOnly')])
+    for cookie in http_only_cookies: # Scripts cannot set HttpOnly cookies.
+        driver.add_cookie(cookie)
+
+    driver.get(base_url+path)
+    install_network_monitor(driver)
+    try:
+        WebDriverWait(driver,30).until(lambda driver: driver.find_elements(By.ID,'nav-jobs-tab') or driver.find_elements(By.CSS_SELECTOR,'input[type="password"]'))
+    except TimeoutException:
+        raise InvalidStateError('Webadmin showed neither the side bar nor the login page after the login session was restored.')
+    if not driver.find_elements(By.ID,'nav-jobs-tab'):
+        raise InvalidStateError('Webadmin did not accept the restored login session.')
+    return SideBar(driver), Dashboard(driver)
@@ -1,27 +1,17 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
-
-from selenium.webdriver.common.by import By
 
+from page_object.common.component_snapshot import ComponentQuery
 from page_object.table.generic_library_table_row import GenericLibraryTableRow
 
-if TYPE_CHECKING:
-    from selenium.webdriver.remote.webelement import WebElement
-
 
 class DictionaryManagementRow(GenericLibraryTableRow):
-    @property
-    def __keyspace_field(self) -> WebElement:
-        return self._element.find_element(By.CSS_SELECTOR,'td:nth-child(2)')
-
-    @property
-    def __time_field(self) -> WebElement:
-        return self._element.find_element(By.CSS_SELECTOR,'td:nth-child(3)')
+    __keyspace_field = ComponentQuery('td:nth-child(2)')
+    __time_field = ComponentQuery('td:nth-child(3)')
 
     @property
     def keyspace(self) -> str:
-        return self.__keyspace_field.text
+        return self._query(self.__keyspace_field)
     
     @property
     def time(self) -> str:
-        return self.__time_field.text
+        return self._query(self.__time_field)
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 from selenium.webdriver.common.by import By
 
 from page_object.common.page_object import PageComponentObject
+from page_object.common.component_snapshot import ComponentQuery
 from page_object.common.helper import obstructed_click_workaround
 from page_object.common.exception import InvalidStateError
 
@@ -28,6 +29,8 @@ class GenericEnableableTableRow(PageComponentObject):
     E.g. see the DictionarySelection class for a non-generic page object.
     """
 
+    __selection_checkbox_classes = ComponentQuery('td:nth-child(1) i','class')
+
     @property
     def __selection_checkbox(self) -> WebElement:
         return self._element.find_element(By.CSS_SELECTOR, 'td:nth-child(1) i')
@@ -42,7 +45,7 @@ class GenericEnableableTableRow(PageComponentObject):
         
         Raises an InvalidStateError if the enabled state cannot be determined."""
         
-        checkbox_classes = self.__selection_checkbox.get_attribute('class')
+        checkbox_classes = self._query(self.__selection_checkbox_classes)
         if 'mdi-checkbox-blank-outline' in checkbox_classes and not 'mdi-checkbox-marked' in checkbox_classes:
             return False
         elif 'mdi-checkbox-marked' in checkbox_classes and not 'mdi-checkbox-blank-outline' in checkbox_classes:
@@ -58,3 +61,4 @@ class GenericEnableableTableRow(PageComponentObject):
         if new_state == self.enabled:
             return
         obstructed_click_workaround(self.driver,self.__selection_checkbox)
+        self._invalidate_snapshot()
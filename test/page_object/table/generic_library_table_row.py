@@ -1,35 +1,32 @@
 """Module containing the base GenericEnableableTableRow class for dealing with Webadmin tables."""
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Union, overload
+from typing import TYPE_CHECKING, Union, BinaryIO, overload
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver import ActionChains
 from selenium.webdriver.common.keys import Keys
 
 from page_object.common.page_object import PageComponentObject
-from page_object.common.helper import download_file_webadmin
+from page_object.common.component_snapshot import ComponentQuery
+from page_object.common.helper import download_file_webadmin, stream_file_webadmin
 
 if TYPE_CHECKING:
     from selenium.webdriver.remote.webelement import WebElement
+    from pathlib import Path
 
 
 class GenericLibraryTableRow(PageComponentObject):
-    @property
-    def __download_button(self) -> WebElement:
-        return self._element.find_element(By.CSS_SELECTOR,'td:last-child a')
-    
+    __download_link = ComponentQuery('td:last-child a','href')
+    _name_field = ComponentQuery('td:first-child a')
+
     @property
     def __delete_button(self) -> WebElement:
         return self._element.find_element(By.CSS_SELECTOR,'td:last-child>button')
-    
-    @property
-    def _name_element(self) -> WebElement:
-        return self._element.find_element(By.CSS_SELECTOR,'td:first-child a')
 
     @property
     def name(self) -> str:
-        return self._name_element.text
+        return self._query(self._name_field)
 
     def delete(self) -> None:
         self.__delete_button.click()
@@ -42,4 +39,10 @@ class GenericLibraryTableRow(PageComponentObject):
     @overload
     def download(self,as_binary:bool=True) -> bytes: ...
     def download(self,as_binary:bool=False) -> Union[bytes,str]:
-        return download_file_webadmin(self.driver,self.__download_button.get_attribute('href'),as_binary=as_binary)
+        return download_file_webadmin(self.driver,self._query(self.__download_link),as_binary=as_binary)
+
+    def download_to(self,destination:Union[str,Path,BinaryIO],as_binary:bool=False) -> int:
+        """Like `download`, but streams the file to `destination` (a path or a binary sink)
+        chunk by chunk instead of holding it in memory. Returns the number of bytes written.
+        """
+        return stream_file_webadmin(self.driver,self._query(self.__download_link),destination,as_binary=as_binary)
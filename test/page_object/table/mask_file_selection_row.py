@@ -3,33 +3,23 @@ Exports single class--the aforementioned page object.
 """
 
 from __future__ import annotations
-from typing import TYPE_CHECKING
-
-from selenium.webdriver.common.by import By
 
+from page_object.common.component_snapshot import ComponentQuery
 from page_object.table.generic_enableable_table_row import GenericEnableableTableRow
 
-if TYPE_CHECKING:
-    from selenium.webdriver.remote.webelement import WebElement
-
 
 class MaskFileSelection(GenericEnableableTableRow):
     """This class represents a row from the mask-file-selection table on the brute-force
     attack settings on the Add Job page."""
-    @property
-    def __name_field(self) -> WebElement:
-        return self._element.find_element(By.CSS_SELECTOR,'td:nth-child(2) a')
-
-    @property
-    def __added_date(self) -> WebElement:
-        return self._element.find_element(By.CSS_SELECTOR,'td:nth-child(3)')
+    __name_field = ComponentQuery('td:nth-child(2) a')
+    __added_date = ComponentQuery('td:nth-child(3)')
 
     @property
     def name(self) -> str:
         """The file name of the mask file."""
-        return self.__name_field.text
+        return self._query(self.__name_field)
 
     @property
     def added_date(self) -> str:
         """The date this file was added to Fitcrack."""
-        return self.__added_date.text
+        return self._query(self.__added_date)
@@ -3,34 +3,24 @@ Exports single class--the aforementioned page object.
 """
 
 from __future__ import annotations
-from typing import TYPE_CHECKING
-
-from selenium.webdriver.common.by import By
 
+from page_object.common.component_snapshot import ComponentQuery
 from page_object.table.generic_enableable_table_row import GenericEnableableTableRow
 
-if TYPE_CHECKING:
-    from selenium.webdriver.remote.webelement import WebElement
-
 
 class RuleFileSelection(GenericEnableableTableRow):
     """This class represents a row from the rulefile-selection tables on the Add Job page."""
 
-    @property
-    def __name_field(self) -> WebElement:
-        return self._element.find_element(By.CSS_SELECTOR,'td:nth-child(2) a')
-
-    @property
-    def __rule_count_field(self) -> WebElement:
-        return self._element.find_element(By.CSS_SELECTOR,'td:nth-child(3)')
+    __name_field = ComponentQuery('td:nth-child(2) a')
+    __rule_count_field = ComponentQuery('td:nth-child(3)')
 
     #TODO: Dunno if I want to use properties for this nonsense.
     @property
     def name(self) -> str:
         """The file name of the rule file."""
-        return self.__name_field.text
+        return self._query(self.__name_field)
 
     @property
     def rule_count(self) -> str:
         """The number of rules contained in the rule file."""
-        return self.__rule_count_field.text
+        return self._query(self.__rule_count_field)
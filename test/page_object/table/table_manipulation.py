@@ -3,31 +3,61 @@
 build_table_selection_objects_from_table --
 constructing page objects representing rows from a table
 
+snapshot_table_rows --
+reading values from all rows of a table in a single WebDriver call
+
 activate_elements_from_table_by_list_lookup --
 activating specific table rows
+
+iterate_table_elements --
+lazily walking the rows of a paginated table, page by page
+
+find_table_row_by_name --
+looking up a row through the search field of a table, without reading the whole table
+(the search field is cleared afterwards)
 """
 
 from __future__ import annotations
-from typing import TYPE_CHECKING, Callable, List, TypeVar, Type
+from typing import TYPE_CHECKING, Callable, Dict, List, TypeVar, Type, Iterable, Iterator, Optional, Tuple
+import re
+from contextlib import contextmanager
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.relative_locator import locate_with
 from selenium.webdriver import ActionChains
-from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.support.wait import WebDriverWait
+from selenium.common.exceptions import StaleElementReferenceException, NoSuchElementException
 
-from page_object.common.helper import click_away, click_away_dialog, near_locator_distance_workaround, scroll_into_view_workaround
+from page_object.common.helper import click_away, click_away_dialog, clear_workaround, near_locator_distance_workaround, predicate_in_list, scroll_into_view_workaround, wait_for_animations_to_finish
 from page_object.common.exception import InvalidStateError
+from page_object.common.component_snapshot import take_component_snapshots
 
 if TYPE_CHECKING:
     from selenium.webdriver.remote.webdriver import WebDriver
     from selenium.webdriver.remote.webelement import WebElement
     from page_object.table.generic_enableable_table_row import GenericEnableableTableRow
     from page_object.common.page_object import T_PageComponentObject
+    from page_object.common.component_snapshot import ComponentQuery, ComponentSnapshot
     X = TypeVar('X')
     T_GenericTableSelection = TypeVar('T_GenericTableSelection',bound=GenericEnableableTableRow)
 
 
-def build_table_row_objects_from_table(driver:WebDriver, table:WebElement,constructor:Type[T_PageComponentObject]) -> List[T_PageComponentObject]:
+_PAGINATION_TEXT_SCRIPT = '''
+const dataTable = arguments[0].closest('.v-data-table');
+const pagination = dataTable && dataTable.querySelector(':scope>.v-data-footer .v-data-footer__pagination');
+return pagination ? pagination.textContent : null;
+'''
+
+
+def snapshot_table_rows(driver:WebDriver,table:WebElement,queries:Iterable[ComponentQuery]) -> List[Tuple[WebElement,ComponentSnapshot]]:
+    """Reads the values described by `queries` from every row (every <tr> element) of a table
+    using a single WebDriver call. Returns a list of tuples, where the first element is the
+    <tr> element and the second element is the snapshot of the row.
+    """
+    return take_component_snapshots(driver,table,'tbody tr',queries)
+
+
+def build_table_row_objects_from_table(driver:WebDriver, table:WebElement,constructor:Type[T_PageComponentObject],snapshot:bool=True) -> List[T_PageComponentObject]:
     """Given a table in Webadmin, constructs PageComponentObject for each row (each <tr> element)
     using the supplied constructor and returns a list of these objects.
 
@@ -38,13 +68,24 @@ def build_table_row_objects_from_table(driver:WebDriver, table:WebElement,constr
     The usage example for that is:
     `build_table_selection_objects_from_table(driver,table_element,DictionarySelection)`.
 
+    By default, the values of all rows are read at once with a single WebDriver call
+    (see `snapshot_table_rows`), so reading e.g. the names of the rows afterwards costs no further
+    round trips. The values are thus as they were when this function was called; a row drops its
+    snapshot once it is interacted with (e.g. clicked). Set `snapshot` to False to construct rows
+    that read all values from the live table instead.
+
     You might also want to take a look at `load_table_elements`, which provides
     additional robustness checks.
     """
-    return [constructor(driver,tableRow) for tableRow in table.find_elements(By.CSS_SELECTOR,'tbody tr')]
+    if not snapshot:
+        return [constructor(driver,tableRow) for tableRow in table.find_elements(By.CSS_SELECTOR,'tbody tr')]
+    return [
+        constructor(driver,tableRow,row_snapshot)
+        for tableRow, row_snapshot in snapshot_table_rows(driver,table,constructor.snapshot_queries())
+    ]
 
 
-def activate_elements_from_table_by_list_lookup(table_rows:List[T_GenericTableSelection],lookup_value_getter:Callable[[T_GenericTableSelection],X],lookup_values:List[X]):
+def activate_elements_from_table_by_list_lookup(table_rows:List[T_GenericTableSelection],lookup_value_getter:Callable[[T_GenericTableSelection],X],lookup_values:Iterable[X]):
     """Given a list of table-row objects, selects a subset of those to be active.
     Which rows are activated depends on `lookup_values` and `lookup_value_getter`.
     `lookup_value_getter` is a function that takes a row and produces some value (usually a string).
@@ -60,22 +101,33 @@ def activate_elements_from_table_by_list_lookup(table_rows:List[T_GenericTableSe
     And `lookup_values` is a list of the names I want. So the call is:
     `activate_elements_from_table_by_list_lookup(row_objects,lambda x:x.name,['foo','bar'])`
 
-    Raises InvalidStateError if not all requested table rows could be activated.
+    The rows are first indexed by their lookup values, and only the rows whose state has to
+    change are clicked. With rows built from a snapshot (see `build_table_row_objects_from_table`),
+    the lookup values and states come from the snapshot, so the clicks are the only
+    WebDriver commands sent.
+
+    Raises InvalidStateError listing the lookup values no row has; no row is clicked then.
     """
-    found_elements = 0
+    wanted_values = set(lookup_values)
+    rows_by_value : Dict[X,List[T_GenericTableSelection]] = {}
     for row in table_rows:
-        if lookup_value_getter(row) in lookup_values:
-            row.enabled = True
-            found_elements += 1
-        else:
-            row.enabled = False
-    if found_elements != len(lookup_values):
+        rows_by_value.setdefault(lookup_value_getter(row),[]).append(row)
+    missing_values = wanted_values - rows_by_value.keys()
+    if missing_values:
         raise InvalidStateError(
-            f'Asked to activate {len(lookup_values)} elements, but only {found_elements} were found'
+            f'Asked to activate {len(wanted_values)} elements, but {len(missing_values)} of them were not found: '
+            + ', '.join(sorted(map(repr,missing_values)))
         )
+    for value, rows in rows_by_value.items():
+        wanted_state = value in wanted_values
+        for row in rows:
+            if row.enabled != wanted_state:
+                row.enabled = wanted_state
 
 
 def show_as_many_rows_per_table_page_as_possible(driver:WebDriver,table:WebElement) -> None:
+    if _table_shows_all_rows(driver,table):
+        return
     rows_per_page_dropdown_button = driver.find_element(
         locate_with(By.CLASS_NAME,'v-select__slot').below(table) #type: ignore
     )
@@ -89,20 +141,19 @@ def show_as_many_rows_per_table_page_as_possible(driver:WebDriver,table:WebEleme
     near_locator_distance_workaround(locator,rows_per_page_dropdown_button)
     rows_per_page_dropdown_largest_choice = driver.find_element(locator) #type: ignore
 
-    ActionChains(driver).pause(2).perform() # Wait for animation to end
+    wait_for_animations_to_finish(driver,driver.find_element(By.CSS_SELECTOR,'.menuable__content__active'))
     rows_per_page_dropdown_largest_choice.click()
 
 
-def load_table_elements(driver:WebDriver,table:WebElement,constructor:Type[T_PageComponentObject],no_element_text:str='No data available',no_ensure_most:bool=False,in_dialog:bool=False) -> List[T_PageComponentObject]:
+def load_table_elements(driver:WebDriver,table:WebElement,constructor:Type[T_PageComponentObject],no_element_text:str='No data available',no_ensure_most:bool=False,in_dialog:bool=False,snapshot:bool=True) -> List[T_PageComponentObject]:
     """Works like `build_table_row_objects_from_table`, but provides more checks:
     
     Ensures that the table shows as many rows as possible by using the "rows per page" selection.
     This means the table could show all elements (e.g. the dictionary table in the Add Job page),
     or it could mean the table could show a big but limited number
     (e.g. the dictionary table in the Library->Dictionary page can show at most 50 rows).
-    For testing, this should not be an issue since no test expects such a large number of rows
-    to be present, and implementing support for interacting with pagination would add needless
-    complexity.
+    Only the first page is read; use `iterate_table_elements` for tables that can have more rows
+    than fit on a page.
 
     Correctly handles the case that no rows are present and returns an empty list then.
 
@@ -120,6 +171,9 @@ def load_table_elements(driver:WebDriver,table:WebElement,constructor:Type[T_Pag
     (e.g. when the table doesn't have an option for changing the number of elements shown).
     
     Set `in_dialog` to True if you use this function for tables in dialog boxes.
+
+    Set `snapshot` to False to get rows that read their values from the live table
+    (see `build_table_row_objects_from_table`).
     """
     #Any previous call to show_as_many_rows_per_table_page_as_possible may have left an open selection box; we need to close it.
     if in_dialog:
@@ -128,6 +182,11 @@ def load_table_elements(driver:WebDriver,table:WebElement,constructor:Type[T_Pag
         click_away(driver)
     if not no_ensure_most:
         show_as_many_rows_per_table_page_as_possible(driver,table)
+    return _load_table_page(driver,table,constructor,no_element_text,snapshot)
+
+
+def _load_table_page(driver:WebDriver,table:WebElement,constructor:Type[T_PageComponentObject],no_element_text:str,snapshot:bool) -> List[T_PageComponentObject]:
+    """Constructs the row objects of the rows the table currently shows; see `load_table_elements`."""
     for _ in range(10):
         try:
             td_elements_in_table = table.find_elements(By.TAG_NAME,'td')
@@ -136,11 +195,112 @@ def load_table_elements(driver:WebDriver,table:WebElement,constructor:Type[T_Pag
                     return []
                 if td_elements_in_table[0].text == 'Loading items...':
                     raise InvalidStateError('Table elements have not loaded yet.')
-            return build_table_row_objects_from_table(driver,table,constructor)
+            return build_table_row_objects_from_table(driver,table,constructor,snapshot=snapshot)
         except StaleElementReferenceException:
             ActionChains(driver).pause(2).perform()
     raise InvalidStateError(
         'Failed to load table elements. '
         'Retried ten times but keep getting StaleElementReferenceExceptions. '
         'Page objects or Webadmin may be broken.'
-    )
\ No newline at end of file
+    )
+
+
+def _table_footer(table:WebElement) -> Optional[WebElement]:
+    """Returns the footer (with the pagination) of a Vuetify data table, or None if it has none."""
+    try:
+        return table.find_element(By.XPATH,'./ancestor::div[contains(@class,"v-data-table")][1]/div[contains(@class,"v-data-footer")]')
+    except NoSuchElementException:
+        return None
+
+
+def _table_shows_all_rows(driver:WebDriver,table:WebElement) -> bool:
+    """Whether the pagination of the table says that all its rows are on the shown page
+    (e.g. '1-7 of 7'), in which case there is no need to change the number of rows per page.
+    Reads the pagination with a single WebDriver call.
+    """
+    pagination = driver.execute_script(_PAGINATION_TEXT_SCRIPT,table)
+    if pagination is None:
+        return False
+    match = re.fullmatch(r'\s*(\d+)\s*[-\u2013]\s*(\d+)\s+of\s+(\d+)\s*',pagination)
+    return match is not None and int(match[1]) <= 1 and match[2] == match[3]
+
+
+def iterate_table_elements(driver:WebDriver,table:WebElement,constructor:Type[T_PageComponentObject],no_element_text:str='No data available',no_ensure_most:bool=False,in_dialog:bool=False) -> Iterator[T_PageComponentObject]:
+    """Works like `load_table_elements`, but also walks the pages of tables whose rows do not
+    fit on a single page (e.g. the library tables show at most 50 rows per page).
+
+    The walk is lazy: the rows of a page are read (with a single WebDriver call) when the first of
+    them is requested, and the next page is opened only once all rows of the current page have been
+    consumed. So a lookup like
+    `predicate_in_list(lambda x: x.name == 'foo',iterate_table_elements(driver,table,DictionaryManagementRow))`
+    stops at the page where 'foo' is and the rest of the table is never read.
+
+    Opening the next page replaces the rows of the current page, so a row object is useable only
+    until the next row is requested from a later page. The walk starts at the page the table
+    currently shows, which is the first page unless the table has been paged through before.
+
+    The parameters are the same as those of `load_table_elements`.
+    """
+    if in_dialog:
+        click_away_dialog(driver)
+    else:
+        click_away(driver)
+    if not no_ensure_most:
+        show_as_many_rows_per_table_page_as_possible(driver,table)
+    while True:
+        yield from _load_table_page(driver,table,constructor,no_element_text,snapshot=True)
+        footer = _table_footer(table)
+        if footer is None:
+            return
+        next_page_button = footer.find_element(By.CSS_SELECTOR,'.v-data-footer__icons-after button')
+        if not next_page_button.is_enabled():
+            return
+        pagination = footer.find_element(By.CLASS_NAME,'v-data-footer__pagination')
+        shown_rows = pagination.text
+        next_page_button.click()
+        WebDriverWait(driver,10).until(lambda _: pagination.text != shown_rows)
+
+
+_SEARCH_FIELD_XPATH = './ancestor::*[.//label[text()="Search"]][1]//label[text()="Search"]/following-sibling::input'
+"""Locates the search field of a table (relative to the table): the input labelled "Search" in the
+closest ancestor of the table that has one."""
+
+
+@contextmanager
+def find_table_row_by_name(driver:WebDriver,table:WebElement,constructor:Type[T_PageComponentObject],name:str,no_match_text:str='No matching records found') -> Iterator[T_PageComponentObject]:
+    """Context manager giving the row of a table whose `name` (a property of the row object) is
+    `name`, looked up by typing the name into the search field of the table, e.g.
+    `with find_table_row_by_name(driver,table,DictionaryManagementRow,'foo') as row: row.delete()`.
+
+    Webadmin filters the table as the search field is typed into, so only the rows whose name
+    contains the searched name are shown and read; the cost of the lookup does not depend on the
+    number of rows of the table. The search field is cleared when the `with` block ends, so later
+    reads of the table see all of its rows again.
+
+    Set `no_match_text` to the text the table shows when no row matches the search.
+
+    Raises ValueError if there is no row with the name.
+    """
+    search_field = table.find_element(By.XPATH,_SEARCH_FIELD_XPATH)
+    clear_workaround(search_field)
+    search_field.send_keys(name)
+    try:
+        searched = name.lower()
+        def is_filtered(_) -> bool:
+            rows = _load_table_page(driver,table,constructor,no_match_text,snapshot=True)
+            return all(searched in row.name.lower() for row in rows) #type: ignore
+        WebDriverWait(driver,10,ignored_exceptions={InvalidStateError}).until(is_filtered)
+        yield predicate_in_list(
+            lambda row: row.name == name, #type: ignore
+            iterate_table_elements(driver,table,constructor,no_element_text=no_match_text,no_ensure_most=True)
+        )
+    finally:
+        _clear_table_search(table)
+
+
+def _clear_table_search(table:WebElement) -> None:
+    """Clears the search field of the table, unless the table is no longer shown."""
+    try:
+        clear_workaround(table.find_element(By.XPATH,_SEARCH_FIELD_XPATH))
+    except (StaleElementReferenceException, NoSuchElementException):
+        pass
@@ -0,0 +1,2 @@
+"""Stand-in Webadmin: a local HTTP server imitating the pages and the API of Webadmin,
+used for benchmarking page objects without a Fitcrack deployment."""
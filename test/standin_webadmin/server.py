@@ -0,0 +1,291 @@
+"""Local HTTP server imitating Webadmin.
+
+Exports single class--StandInWebadmin.
+
+The page objects can only be run against a live Fitcrack deployment, which makes measuring their
+performance slow and noisy (the cluster is busy, the network adds latency, the data change).
+The stand-in serves a small single-page application whose DOM has the same shape as the parts of
+Webadmin the page objects touch (Vuetify class names, element IDs, table layouts, the rows-per-page
+menu, ...) and a JSON API with generated data, so that page objects can be run against it in
+a headless browser with no network.
+
+The stand-in covers:
+the login page (any credentials are accepted),
+the side bar and the dashboard,
+the library pages (dictionaries, rules, charsets, masks, PCFGs and Markov chains; listing,
+searching, downloading and deleting files; like in Webadmin, their tables show at most 50 rows per page),
+the Add Job page (job name, input settings with manual hash entry, hash files and hash-type selection,
+attack settings with the dictionary attack; creating a job),
+the job detail page (state, hashes, active hosts, host assignment and workunits).
+
+Everything else (uploads, the other attack modes, ...) is not imitated.
+
+The number of rows of the library tables, the hashes and the workunits of jobs is set with `rows`
+(e.g. 10 to 10,000 for benchmarks). The data is generated deterministically, so runs with the
+same settings see the same data.
+"""
+
+from __future__ import annotations
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+import hashlib
+import json
+import re
+import threading
+import time
+
+
+_STATIC_DIRECTORY = Path(__file__).parent / 'static'
+
+LIBRARY_KINDS = ('dictionary','rule','charset','masks','pcfg','markovChains')
+"""Library kinds as they appear in the paths of the API."""
+
+HASH_TYPES = [
+    ('0','MD5'),
+    ('100','SHA1'),
+    ('1000','NTLM'),
+    ('1400','SHA2-256'),
+    ('1700','SHA2-512'),
+    ('3200','bcrypt $2*$, Blowfish (Unix)'),
+    ('11600','7-Zip'),
+    ('13000','RAR5'),
+]
+"""Hash types offered by the hash-type selection of the stand-in, as (Hashcat code, name) pairs."""
+
+
+class StandInWebadmin:
+    """The stand-in server. Use it as a context manager, or call `start` and `stop`:
+
+    ```
+    with StandInWebadmin(rows=1000) as webadmin:
+        driver.get(webadmin.url + '/login')
+    ```
+
+    `rows` is the number of rows of the generated tables, `hosts` the number of hosts and
+    `api_delay` the time (in seconds) every API response is delayed by, to imitate a slower
+    backend. `port` 0 picks a free port.
+    """
+
+    def __init__(self,rows:int=100,hosts:int=4,api_delay:float=0,host:str='127.0.0.1',port:int=0):
+        self.rows = rows
+        self.hosts = hosts
+        self.api_delay = api_delay
+        self._address = (host,port)
+        self._server : Optional[ThreadingHTTPServer] = None
+        self._thread : Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._library : Dict[str,List[Dict[str,Any]]] = {kind: self._generate_library(kind) for kind in LIBRARY_KINDS}
+        self._jobs : Dict[int,Dict[str,Any]] = {}
+
+    @property
+    def url(self) -> str:
+        """The base URL of the running stand-in (no trailing forward slash)."""
+        if self._server is None:
+            raise RuntimeError('The stand-in Webadmin is not running.')
+        host, port = self._server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def start(self) -> None:
+        """Starts serving in a background thread."""
+        handler = type('Handler',(_Handler,),{'webadmin': self})
+        self._server = ThreadingHTTPServer(self._address,handler)
+        self._thread = threading.Thread(target=self._server.serve_forever,daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops serving."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> StandInWebadmin:
+        self.start()
+        return self
+
+    def __exit__(self,*exc_info) -> None:
+        self.stop()
+
+    def resize(self,rows:int) -> None:
+        """Regenerates the data with `rows` rows per table (deleted library files are restored).
+        The page shown in a browser shows the new data once it fetches them again."""
+        with self._lock:
+            self.rows = rows
+            self._library = {kind: self._generate_library(kind) for kind in LIBRARY_KINDS}
+
+    def get_library_files(self,kind:str) -> List[Dict[str,Any]]:
+        """Returns the (not deleted) library files of the given kind, as the API lists them."""
+        return [file for file in self._library[kind] if not file['deleted']]
+
+    # Data
+
+    def _generate_library(self,kind:str) -> List[Dict[str,Any]]:
+        extension = {'dictionary': 'txt', 'rule': 'rule', 'charset': 'hcchr', 'masks': 'hcmask', 'pcfg': 'pcfg', 'markovChains': 'hcstat2'}[kind]
+        return [
+            {
+                'id': index+1,
+                'name': f'standin-{kind.lower()}-{index+1:05d}.{extension}',
+                'keyspace': (index+1)*1000,
+                'count': (index+1)*10,
+                'time': f'2023-01-01T00:{index//60%60:02d}:{index%60:02d}',
+                'deleted': False,
+            }
+            for index in range(self.rows)
+        ]
+
+    def _generate_host(self,index:int) -> Dict[str,Any]:
+        return {
+            'id': index+1,
+            'domain_name': f'standin-host-{index+1}',
+            'ip_address': f'10.0.0.{index+1}',
+            'os_name': 'Linux',
+            'p_model': 'Stand-in CPU',
+            'jobs': index%3,
+            'online': index%2 == 0,
+        }
+
+    def _job(self,job_id:int) -> Dict[str,Any]:
+        with self._lock:
+            if job_id not in self._jobs:
+                self._jobs[job_id] = {'id': job_id, 'name': f'Stand-in job {job_id}', 'hash_type': '100', 'hashes': None, 'host_ids': []}
+            return self._jobs[job_id]
+
+    def _job_hashes(self,job:Dict[str,Any]) -> List[Dict[str,str]]:
+        if job['hashes'] is not None:
+            return [{'hashText': hash, 'password': ''} for hash in job['hashes']]
+        return [
+            {
+                'hashText': hashlib.sha1(f'password{index}'.encode()).hexdigest(),
+                'password': f'password{index}' if index%2 == 0 else '',
+            }
+            for index in range(self.rows)
+        ]
+
+    def _job_workunits(self,job:Dict[str,Any]) -> List[Dict[str,Any]]:
+        return [
+            {
+                'id': index+1,
+                'host': self._generate_host(index%self.hosts),
+                'progress': 100,
+                'speed': f'{index+1} kH/s',
+                'cracking_time': '0:00:01',
+                'generated': '2023-01-01 00:00:00',
+                'start_index': index*1000,
+                'keyspace': 1000,
+                'retry': False,
+                'finished': True,
+            }
+            for index in range(self.rows)
+        ]
+
+    def _create_job(self,payload:Dict[str,Any]) -> int:
+        with self._lock:
+            job_id = max(self._jobs,default=0) + 1
+            self._jobs[job_id] = {
+                'id': job_id,
+                'name': payload.get('name',''),
+                'hash_type': payload.get('hash_settings',{}).get('hash_type','100'),
+                'hashes': [item['hash'] for item in payload.get('hash_settings',{}).get('hash_list',[])],
+                'host_ids': [],
+            }
+            return job_id
+
+    def handle_api(self,method:str,path:str,body:Any) -> Tuple[int,Any]:
+        """Handles an API request (`path` is the part of the path after `/api/`);
+        returns the status code and the JSON response."""
+        parts = path.strip('/').split('/')
+        match method, parts:
+            case 'GET', [kind] if kind in LIBRARY_KINDS:
+                return 200, {'items': self.get_library_files(kind)}
+            case 'DELETE', [kind, file_id] if kind in LIBRARY_KINDS:
+                for file in self._library[kind]:
+                    if str(file['id']) == file_id:
+                        file['deleted'] = True
+                        return 200, {'message': f'{file["name"]} deleted.', 'status': True}
+                return 404, {'message': 'File not found.'}
+            case 'GET', ['hashcat','hashTypes']:
+                return 200, {'hashtypes': [{'code': code, 'name': name} for code, name in HASH_TYPES]}
+            case 'GET', ['hosts']:
+                return 200, {'items': [self._generate_host(index) for index in range(self.hosts)]}
+            case 'POST', ['job']:
+                return 200, {'message': 'Job created.', 'status': True, 'job_id': self._create_job(body or {})}
+            case 'GET', ['job', job_id]:
+                job = self._job(int(job_id))
+                return 200, {'id': job['id'], 'name': job['name'], 'status': 1, 'status_text': 'finished', 'hash_type': job['hash_type']}
+            case 'GET', ['job', job_id, 'hashes']:
+                return 200, {'items': self._job_hashes(self._job(int(job_id)))}
+            case 'GET', ['job', job_id, 'workunits']:
+                return 200, {'items': self._job_workunits(self._job(int(job_id)))}
+            case 'GET', ['job', job_id, 'host']:
+                job = self._job(int(job_id))
+                return 200, {'items': [self._generate_host(host_id-1) for host_id in job['host_ids']]}
+            case 'POST', ['job', job_id, 'host']:
+                self._job(int(job_id))['host_ids'] = list((body or {}).get('newHost_ids',[]))
+                return 200, {'message': 'Hosts assigned.', 'status': True}
+            case 'GET', ['job', job_id, 'action']:
+                return 200, {'message': 'Job started.', 'status': True}
+        return 404, {'message': f'No stand-in for {method} /api/{path}.'}
+
+    def download(self,path:str) -> Optional[bytes]:
+        """Returns the content of a library file for a download path (`<kind>/<id>/download`),
+        or None if there is no such file."""
+        match = re.fullmatch(r'(\w+)/(\d+)/download',path.strip('/'))
+        if match is None or match[1] not in LIBRARY_KINDS:
+            return None
+        for file in self._library[match[1]]:
+            if file['id'] == int(match[2]) and not file['deleted']:
+                return ''.join(f'{file["name"]}-{line}\n' for line in range(10)).encode()
+        return None
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves the stand-in application for all paths except for `/static/` and `/api/`."""
+
+    webadmin : StandInWebadmin
+
+    def log_message(self,format:str,*args) -> None:
+        pass # Keep the output of the tests clean.
+
+    def _send(self,status:int,content:bytes,content_type:str) -> None:
+        self.send_response(status)
+        self.send_header('Content-Type',content_type)
+        self.send_header('Content-Length',str(len(content)))
+        self.send_header('Cache-Control','no-store')
+        self.end_headers()
+        self.wfile.write(content)
+
+    def _handle(self,method:str) -> None:
+        path = urlparse(self.path).path
+        if path.startswith('/api/'):
+            if self.webadmin.api_delay:
+                time.sleep(self.webadmin.api_delay)
+            content = self.webadmin.download(path[len('/api/'):]) if method == 'GET' else None
+            if content is not None:
+                self._send(200,content,'text/plain; charset=utf-8')
+                return
+            length = int(self.headers.get('Content-Length') or 0)
+            body = json.loads(self.rfile.read(length)) if length else None
+            status, response = self.webadmin.handle_api(method,path[len('/api/'):],body)
+            self._send(status,json.dumps(response).encode(),'application/json')
+        elif path.startswith('/static/'):
+            file = _STATIC_DIRECTORY / path[len('/static/'):]
+            if file.parent != _STATIC_DIRECTORY or not file.is_file():
+                self._send(404,b'Not found','text/plain')
+                return
+            content_type = {'.js': 'text/javascript', '.css': 'text/css'}.get(file.suffix,'text/html')
+            self._send(200,file.read_bytes(),f'{content_type}; charset=utf-8')
+        elif method == 'GET':
+            self._send(200,(_STATIC_DIRECTORY / 'app.html').read_bytes(),'text/html; charset=utf-8')
+        else:
+            self._send(405,b'Method not allowed','text/plain')
+
+    def do_GET(self) -> None:
+        self._handle('GET')
+
+    def do_POST(self) -> None:
+        self._handle('POST')
+
+    def do_DELETE(self) -> None:
+        self._handle('DELETE')
@@ -0,0 +1,489 @@
+// Stand-in Webadmin: imitates the DOM of the parts of Webadmin the page objects use.
+// See server.py for what is imitated.
+'use strict';
+
+const app = document.getElementById('app');
+
+const escape = value => String(value).replace(/[&<>"]/g, c => ({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'})[c]);
+
+const element = (tag, className = '', html = '') => {
+    const created = document.createElement(tag);
+    created.className = className;
+    created.innerHTML = html;
+    return created;
+};
+
+async function api(method, path, body) {
+    const response = await fetch(`${window.serverAddress}/${path}`, {
+        method,
+        headers: {'Content-Type': 'application/json', 'Authorization': `Bearer ${localStorage.getItem('jwt')}`},
+        body: body === undefined ? undefined : JSON.stringify(body),
+    });
+    const json = await response.json();
+    if (!response.ok) {
+        throw new Error(json.message);
+    }
+    return json;
+}
+
+// Components
+
+function closeMenus() {
+    document.querySelectorAll('.v-menu__content').forEach(menu => menu.remove());
+}
+
+document.addEventListener('click', event => {
+    if (!event.target.closest('.v-menu__content')) {
+        closeMenus();
+    }
+});
+
+function openMenu(anchor, options, onSelect) {
+    closeMenus();
+    const menu = element('div', 'v-menu__content menuable__content__active', `<div class="v-list">${
+        options.map(option => `<div class="v-list-item" data-value="${option}">${option < 0 ? 'All' : option}</div>`).join('')
+    }</div>`);
+    const rect = anchor.getBoundingClientRect();
+    menu.style.left = `${rect.left + window.scrollX}px`;
+    menu.style.top = `${rect.bottom + window.scrollY}px`;
+    menu.addEventListener('click', event => {
+        const item = event.target.closest('.v-list-item');
+        if (item) {
+            event.stopPropagation();
+            closeMenus();
+            onSelect(Number(item.dataset.value));
+        }
+    });
+    app.appendChild(menu);
+}
+
+function snackbar(type, text) {
+    document.querySelectorAll('.errorSnackbar').forEach(old => old.remove());
+    const created = element('div', 'errorSnackbar', `<div class="v-alert ${type}"><div class="v-alert__content">${escape(text)}</div></div>`);
+    app.appendChild(created);
+    setTimeout(() => created.remove(), 1500);
+}
+
+function openDialog(title, content) {
+    const overlay = element('div', 'v-dialog__content', `<div class="v-dialog v-dialog--active"><div class="v-card"><div class="v-card__title">${escape(title)}</div></div></div>`);
+    overlay.querySelector('.v-card').appendChild(content);
+    overlay.addEventListener('click', event => {
+        if (event.target === overlay) {
+            overlay.remove();
+        }
+    });
+    app.appendChild(overlay);
+    return overlay;
+}
+
+// A Vuetify-like data table. The <table> element stays the same for the lifetime of the component;
+// only the rows are re-rendered, like in Vuetify. -1 among `perPageOptions` stands for "All".
+function dataTable({headers, row, emptyText = 'No data available', footer = true, selectable = false, perPageOptions = [5, 10, 15, -1]}) {
+    const component = element('div', 'v-data-table', `<div class="v-data-table__wrapper"><table><thead><tr>${
+        (selectable ? ['', ...headers] : headers).map(header => `<th>${escape(header)}</th>`).join('')
+    }</tr></thead><tbody></tbody></table></div>`);
+    const columns = headers.length + (selectable ? 1 : 0);
+    const tbody = component.querySelector('tbody');
+    const state = {items: null, search: '', perPage: footer ? 10 : -1, page: 0, selected: new Set()};
+    // Like Vuetify, the search matches a substring of any column.
+    const shownItems = () => state.items.filter(item => Object.values(item).some(value => String(value).toLowerCase().includes(state.search)));
+
+    const checkbox = item => `<td><i class="v-icon mdi ${state.selected.has(item.id) ? 'mdi-checkbox-marked' : 'mdi-checkbox-blank-outline'}"></i></td>`;
+    const render = () => {
+        const items = state.items === null ? [] : shownItems();
+        const count = items.length;
+        const first = state.perPage < 0 ? 0 : state.page * state.perPage;
+        const last = state.perPage < 0 ? count : Math.min(first + state.perPage, count);
+        if (state.items === null) {
+            tbody.innerHTML = `<tr><td colspan="${columns}">Loading items...</td></tr>`;
+        } else if (count === 0) {
+            tbody.innerHTML = `<tr><td colspan="${columns}">${escape(state.items.length ? 'No matching records found' : emptyText)}</td></tr>`;
+        } else {
+            tbody.innerHTML = items.slice(first, last).map(item => row(item).replace('>', `>${selectable ? checkbox(item) : ''}`)).join('');
+        }
+        if (footer) {
+            component.querySelector('.v-data-footer__pagination').textContent = `${count ? first + 1 : 0}-${last} of ${count}`;
+            component.querySelector('.v-data-footer__icons-before button').disabled = first === 0;
+            component.querySelector('.v-data-footer__icons-after button').disabled = last >= count;
+        }
+    };
+
+    if (footer) {
+        component.appendChild(element('div', 'v-data-footer',
+            '<div class="v-data-footer__select">Rows per page: <div class="v-input v-select"><div class="v-select__slot">'
+            + '<div class="v-select__selection">10</div></div></div></div><div class="v-data-footer__pagination"></div>'
+            + '<div class="v-data-footer__icons-before"><button class="v-btn" aria-label="Previous page">&lsaquo;</button></div>'
+            + '<div class="v-data-footer__icons-after"><button class="v-btn" aria-label="Next page">&rsaquo;</button></div>'));
+        const slot = component.querySelector('.v-select__slot');
+        slot.addEventListener('click', event => {
+            event.stopPropagation();
+            openMenu(slot, perPageOptions, perPage => {
+                state.perPage = perPage;
+                state.page = 0;
+                slot.querySelector('.v-select__selection').textContent = perPage < 0 ? 'All' : perPage;
+                render();
+            });
+        });
+        component.querySelector('.v-data-footer__icons-before button').addEventListener('click', () => {
+            state.page -= 1;
+            render();
+        });
+        component.querySelector('.v-data-footer__icons-after button').addEventListener('click', () => {
+            state.page += 1;
+            render();
+        });
+    }
+    if (selectable) {
+        tbody.addEventListener('click', event => {
+            const icon = event.target.closest('td:first-child > i');
+            if (!icon) {
+                return;
+            }
+            const id = Number(icon.closest('tr').dataset.id);
+            if (state.selected.has(id)) {
+                state.selected.delete(id);
+            } else {
+                state.selected.add(id);
+            }
+            icon.classList.toggle('mdi-checkbox-marked');
+            icon.classList.toggle('mdi-checkbox-blank-outline');
+        });
+    }
+    render();
+    return {
+        element: component,
+        tbody,
+        setItems(items) {
+            state.items = items;
+            state.page = Math.max(0, Math.min(state.page, Math.ceil(items.length / state.perPage) - 1));
+            render();
+        },
+        setSearch(search) {
+            state.search = search.toLowerCase();
+            state.page = 0;
+            render();
+        },
+        selected: () => [...state.selected],
+    };
+}
+
+// Layout and routing
+
+function renderLayout() {
+    app.innerHTML = `
+        <header class="v-toolbar"><div class="v-toolbar__title">Fitcrack</div></header>
+        <div class="app-body">
+            <nav class="v-navigation-drawer">
+                <div id="nav-jobs-tab" class="v-tab">Jobs</div>
+                <a href="/jobs" data-route>All jobs</a>
+                <a href="/jobs/add" data-route>Add job</a>
+                <div id="nav-library-tab" class="v-tab">Library</div>
+                <a href="/dictionaries" data-route>Dictionaries</a>
+                <a href="/rules" data-route>Rules</a>
+                <a href="/charsets" data-route>Charsets</a>
+                <a href="/masks" data-route>Masks</a>
+                <a href="/pcfg" data-route>PCFG</a>
+                <a href="/markovChains" data-route>Markov chains</a>
+                <div id="nav-system-tab" class="v-tab">System</div>
+            </nav>
+            <main class="v-main"></main>
+        </div>`;
+}
+
+function navigate(path) {
+    history.pushState({}, '', path);
+    render();
+}
+
+window.addEventListener('popstate', () => render());
+
+document.addEventListener('click', event => {
+    const link = event.target.closest('a[data-route]');
+    if (link) {
+        event.preventDefault();
+        navigate(link.getAttribute('href'));
+    }
+});
+
+const LIBRARIES = {
+    '/dictionaries': {title: 'Dictionaries', kind: 'dictionary', columns: ['keyspace', 'time']},
+    '/rules': {title: 'Rules', kind: 'rule', columns: ['count', 'time']},
+    '/charsets': {title: 'Charsets', kind: 'charset', columns: ['keyspace', 'time']},
+    '/masks': {title: 'Mask sets', kind: 'masks', columns: ['time']},
+    '/pcfg': {title: 'PCFGs', kind: 'pcfg', columns: ['keyspace', 'time']},
+    '/markovChains': {title: 'Markov chains', kind: 'markovChains', columns: ['time'], plainName: true},
+};
+
+function render() {
+    closeMenus();
+    const path = window.location.pathname;
+    if (!localStorage.getItem('jwt') || path === '/login') {
+        history.replaceState({}, '', '/login');
+        loginPage();
+        return;
+    }
+    if (!document.querySelector('.v-main')) {
+        renderLayout();
+    }
+    const main = document.querySelector('.v-main');
+    main.innerHTML = '';
+    let match;
+    if (path in LIBRARIES) {
+        main.appendChild(libraryPage(LIBRARIES[path]));
+    } else if (path === '/jobs/add') {
+        main.appendChild(addJobPage());
+    } else if ((match = path.match(/^\/jobs\/(\d+)$/))) {
+        main.appendChild(jobDetailPage(Number(match[1])));
+    } else {
+        main.appendChild(element('div', 'v-card', '<h1>Welcome to Fitcrack</h1>'));
+    }
+}
+
+// Pages
+
+function loginPage() {
+    app.innerHTML = `
+        <form class="v-card login">
+            <div class="v-text-field"><label>Username</label><input type="text" name="username"></div>
+            <div class="v-text-field"><label>Password</label><input type="password" name="password"></div>
+            <button type="submit">Log in</button>
+        </form>`;
+    app.querySelector('form').addEventListener('submit', event => {
+        event.preventDefault();
+        localStorage.setItem('jwt', 'stand-in-token');
+        navigate('/');
+    });
+}
+
+function libraryPage({title, kind, columns, plainName}) {
+    const card = element('div', 'v-card', `<div class="v-card__title">${escape(title)}</div>`
+        + '<div class="v-text-field"><label>Search</label><input type="text" class="search"></div>');
+    const table = dataTable({
+        headers: ['Name', ...columns, 'Actions'], perPageOptions: [10, 25, 50],
+        row: file => `<tr data-id="${file.id}">`
+            + `<td>${plainName ? escape(file.name) : `<a href="/${kind}/${file.id}">${escape(file.name)}</a>`}</td>`
+            + columns.map(column => `<td>${escape(file[column])}</td>`).join('')
+            + `<td><a href="${window.serverAddress}/${kind}/${file.id}/download">download</a><button class="delete">delete</button></td></tr>`,
+    });
+    card.appendChild(table.element);
+    card.querySelector('input.search').addEventListener('input', event => table.setSearch(event.target.value));
+    const load = () => api('GET', kind).then(response => table.setItems(response.items));
+
+    table.tbody.addEventListener('click', event => {
+        const button = event.target.closest('button.delete');
+        if (!button) {
+            return;
+        }
+        const id = button.closest('tr').dataset.id;
+        const confirm = element('div', '', '<button class="confirm">Delete</button>');
+        const dialog = openDialog('Delete file?', confirm);
+        const confirmButton = confirm.querySelector('button');
+        confirmButton.addEventListener('click', () => {
+            dialog.remove();
+            api('DELETE', `${kind}/${id}`)
+                .then(response => snackbar('success', response.message), error => snackbar('error', error.message))
+                .then(load);
+        });
+        confirmButton.focus();
+    });
+    load();
+    return card;
+}
+
+function addJobPage() {
+    const page = element('div', 'v-card', `
+        <div class="v-text-field"><label>Name</label><input type="text" class="job-name"></div>
+        <div class="v-stepper__header">
+            <button id="job-step-1">Input settings</button>
+            <button id="job-step-2">Attack settings</button>
+            <button id="job-step-3">Host assignment</button>
+            <button id="job-step-4">Additional settings</button>
+        </div>
+        <div class="v-stepper__content" data-step="1">
+            <div class="v-btn-toggle">
+                <button id="job-input-mode-manual">Manual entry</button>
+                <button id="job-input-mode-hashlist">From hash file</button>
+                <button id="job-input-mode-extract">Extract from file</button>
+            </div>
+            <div class="v-text-field hash-type-field"><label>Hash type</label><input type="text" id="hash-type-select"></div>
+            <div class="v-text-field hash-file" hidden><label for="hash-file-input">Select a file to read</label><input type="file" id="hash-file-input"></div>
+            <div id="hashes-input"><textarea></textarea></div>
+        </div>
+        <div class="v-stepper__content" data-step="2" hidden>
+            <div class="v-btn-toggle">
+                <button id="attack-mode-dictionary">Dictionary</button>
+                <button id="attack-mode-combinator">Combination</button>
+                <button id="attack-mode-maskattack">Brute-force</button>
+                <button id="attack-mode-hybridWordlistMask">Hybrid wordlist + mask</button>
+                <button id="attack-mode-hybridMaskWordlist">Hybrid mask + wordlist</button>
+                <button id="attack-mode-princeAttack">PRINCE</button>
+                <button id="attack-mode-pcfgAttack">PCFG</button>
+            </div>
+            <div class="attack-panel"></div>
+        </div>
+        <div class="v-stepper__content" data-step="3" hidden>Host assignment is not imitated.</div>
+        <div class="v-stepper__content" data-step="4" hidden>Additional settings are not imitated.</div>
+        <button class="create"><span>Create</span></button>`);
+
+    for (let step = 1; step <= 4; step++) {
+        page.querySelector(`#job-step-${step}`).addEventListener('click', () => {
+            page.querySelectorAll('.v-stepper__content').forEach(content => {
+                content.hidden = content.dataset.step !== String(step);
+            });
+        });
+    }
+
+    // The hash input imitates a Vuetify textarea: its component model (lazyValue) follows the
+    // `input` events of the textarea, as Vue's v-model does.
+    const hashesInput = page.querySelector('#hashes-input');
+    hashesInput.__vue__ = {lazyValue: ''};
+    hashesInput.querySelector('textarea').addEventListener('input', event => {
+        hashesInput.__vue__.lazyValue = event.target.value;
+    });
+
+    // Reading hashes from a file appends them to the hashes already input.
+    const hashFileField = page.querySelector('.hash-file');
+    page.querySelector('#job-input-mode-manual').addEventListener('click', () => { hashFileField.hidden = true; });
+    page.querySelector('#job-input-mode-hashlist').addEventListener('click', () => { hashFileField.hidden = false; });
+    page.querySelector('#hash-file-input').addEventListener('change', event => {
+        const textarea = page.querySelector('#hashes-input textarea');
+        Promise.all(Array.from(event.target.files, file => file.text())).then(texts => {
+            const lines = texts.flatMap(text => text.split('\n').filter(Boolean));
+            textarea.value = [textarea.value, ...lines].filter(Boolean).join('\n');
+            hashesInput.__vue__.lazyValue = textarea.value;
+            event.target.value = '';
+        });
+    });
+
+    // Hash-type selection; the list of options exists only while it is shown.
+    const hashTypeInput = page.querySelector('#hash-type-select');
+    let hashType = null;
+    const hashTypes = api('GET', 'hashcat/hashTypes').then(response => response.hashtypes);
+    const closeHashTypes = () => page.querySelectorAll('.hash-type-field .v-list').forEach(list => list.remove());
+    const showHashTypes = () => hashTypes.then(items => {
+        closeHashTypes();
+        const filter = hashTypeInput.value.toLowerCase();
+        const matching = items.filter(item => item.name.toLowerCase().includes(filter) || item.code === filter);
+        const list = element('div', 'v-list', matching.map(item =>
+            `<div class="v-list-item" data-code="${item.code}"><span class="v-list-item__title">${escape(item.name)}</span> <span class="v-list-item__subtitle">${item.code}</span></div>`
+        ).join(''));
+        list.addEventListener('click', event => {
+            const item = event.target.closest('.v-list-item');
+            if (item) {
+                event.stopPropagation();
+                hashType = item.dataset.code;
+                hashTypeInput.value = item.querySelector('.v-list-item__title').textContent;
+                closeHashTypes();
+            }
+        });
+        hashTypeInput.parentElement.appendChild(list);
+    });
+    hashTypeInput.addEventListener('focus', showHashTypes);
+    hashTypeInput.addEventListener('input', showHashTypes);
+    document.addEventListener('click', event => {
+        if (!event.target.closest('.hash-type-field')) {
+            closeHashTypes();
+        }
+    });
+
+    // Attack settings; only the dictionary attack is imitated.
+    const attackPanel = page.querySelector('.attack-panel');
+    let dictionaryTable = null;
+    page.querySelector('#attack-mode-dictionary').addEventListener('click', () => {
+        attackPanel.innerHTML = '<span>Select dictionary</span><div class="dictionaries"></div><span>Select rule file</span><div class="rules"></div>';
+        dictionaryTable = dataTable({
+            headers: ['Name', 'Keyspace'], selectable: true,
+            row: file => `<tr data-id="${file.id}"><td><a href="/dictionaries/${file.id}">${escape(file.name)}</a></td><td>${file.keyspace}</td></tr>`,
+        });
+        const ruleTable = dataTable({
+            headers: ['Name', 'Rules'], selectable: true,
+            row: file => `<tr data-id="${file.id}"><td><a href="/rules/${file.id}">${escape(file.name)}</a></td><td>${file.count}</td></tr>`,
+        });
+        attackPanel.querySelector('.dictionaries').appendChild(dictionaryTable.element);
+        attackPanel.querySelector('.rules').appendChild(ruleTable.element);
+        api('GET', 'dictionary').then(response => dictionaryTable.setItems(response.items));
+        api('GET', 'rule').then(response => ruleTable.setItems(response.items));
+    });
+    for (const mode of ['combinator', 'maskattack', 'hybridWordlistMask', 'hybridMaskWordlist', 'princeAttack', 'pcfgAttack']) {
+        page.querySelector(`#attack-mode-${mode}`).addEventListener('click', () => {
+            dictionaryTable = null;
+            attackPanel.textContent = 'This attack mode is not imitated.';
+        });
+    }
+
+    page.querySelector('button.create').addEventListener('click', () => {
+        api('POST', 'job', {
+            name: page.querySelector('.job-name').value,
+            attack_settings: {attack_mode: 0, left_dictionaries: dictionaryTable ? dictionaryTable.selected().map(id => ({id})) : []},
+            hash_settings: {
+                hash_type: hashType,
+                hash_list: page.querySelector('#hashes-input textarea').value.split('\n').filter(Boolean).map(hash => ({hash})),
+            },
+        }).then(response => {
+            snackbar('success', response.message);
+            navigate(`/jobs/${response.job_id}`);
+        }, error => snackbar('error', error.message));
+    });
+    return page;
+}
+
+function jobDetailPage(jobId) {
+    const page = element('div', '', `
+        <div class="v-card"><div class="v-card__title">Job <span class="status"></span></div>
+            <button class="start"><span>start</span></button><button class="stop"><span>stop</span></button></div>
+        <div class="row"><div class="col v-card"><span>Hashes</span><div class="hashes"></div></div></div>
+        <div class="v-card"><div class="active-hosts"></div><button class="assign"><span>Assign Hosts</span></button></div>
+        <div class="wu-container v-card"><b>Workunits</b><div class="workunits"></div></div>`);
+
+    const hashTable = dataTable({
+        headers: ['Hash', 'Password'], footer: false,
+        row: item => `<tr><td>${escape(item.hashText)}</td><td>${escape(item.password)}</td></tr>`,
+    });
+    const online = host => host.online ? '<i class="v-icon mdi mdi-power"></i>' : '3 days ago';
+    const activeHostTable = dataTable({
+        headers: ['Name', 'IP address', 'Online'], footer: false, emptyText: 'None assigned',
+        row: host => `<tr><td><a href="/hosts/${host.id}">${escape(host.domain_name)}</a></td><td>${host.ip_address}</td><td>${online(host)}</td></tr>`,
+    });
+    const yesNo = value => `<span><span>${value ? 'Yes' : 'No'}</span></span>`;
+    const workunitTable = dataTable({
+        headers: ['Host', 'Progress', 'Speed', 'Cracking time', 'Generated', 'Start index', 'Keyspace', 'Retry', 'Finished'],
+        row: workunit => `<tr><td><a><span href="/hosts/${workunit.host.id}">${escape(workunit.host.domain_name)}</span></a></td>`
+            + `<td><div><span>${workunit.progress} %</span></div></td><td><span>${workunit.speed}</span></td>`
+            + `<td>${workunit.cracking_time}</td><td>${workunit.generated}</td><td>${workunit.start_index}</td>`
+            + `<td>${workunit.keyspace.toLocaleString('en-US')}</td><td>${yesNo(workunit.retry)}</td><td>${yesNo(workunit.finished)}</td></tr>`,
+    });
+    page.querySelector('.hashes').appendChild(hashTable.element);
+    page.querySelector('.active-hosts').appendChild(activeHostTable.element);
+    page.querySelector('.workunits').appendChild(workunitTable.element);
+
+    const loadActiveHosts = () => api('GET', `job/${jobId}/host`).then(response => activeHostTable.setItems(response.items));
+    api('GET', `job/${jobId}`).then(job => {
+        page.querySelector('.status').textContent = job.status_text.charAt(0).toUpperCase() + job.status_text.slice(1);
+    });
+    api('GET', `job/${jobId}/hashes`).then(response => hashTable.setItems(response.items));
+    api('GET', `job/${jobId}/workunits`).then(response => workunitTable.setItems(response.items));
+    loadActiveHosts();
+
+    page.querySelector('button.start').addEventListener('click', () => api('GET', `job/${jobId}/action?operation=start`));
+    page.querySelector('button.assign').addEventListener('click', () => {
+        const content = element('div', '', '<div class="hosts"></div><button id="host-mapper-assign">Assign</button>');
+        const hostTable = dataTable({
+            headers: ['Name', 'IP address', 'OS', 'Processor', 'Active jobs', 'Online'], footer: false, selectable: true,
+            row: host => `<tr data-id="${host.id}"><td><a href="/hosts/${host.id}">${escape(host.domain_name)}</a></td><td>${host.ip_address}</td>`
+                + `<td>${host.os_name}</td><td>${host.p_model}</td><td>${host.jobs}</td><td>${online(host)}</td></tr>`,
+        });
+        content.querySelector('.hosts').appendChild(hostTable.element);
+        const dialog = openDialog('Assign hosts', content);
+        api('GET', 'hosts').then(response => hostTable.setItems(response.items));
+        content.querySelector('#host-mapper-assign').addEventListener('click', () => {
+            api('POST', `job/${jobId}/host`, {newHost_ids: hostTable.selected()}).then(response => {
+                dialog.remove();
+                snackbar('success', response.message);
+                loadActiveHosts();
+            }, error => snackbar('error', error.message));
+        });
+    });
+    return page;
+}
+
+render();
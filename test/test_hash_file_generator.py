@@ -0,0 +1,34 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+import pytest
+
+import hash_file_generator
+from hash_file_generator import HASH_TYPES, generate_hash_file
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+HASH_COUNT = 5000
+
+
+@pytest.mark.parametrize('algorithm',HASH_TYPES)
+def test_plaintext_of_every_hash(tmp_path:Path,monkeypatch:pytest.MonkeyPatch,algorithm:str):
+    # Small chunks, so that the index is merged from several sorted chunks.
+    monkeypatch.setattr(hash_file_generator,'_CHUNK_SIZE',1000)
+    hash_file = generate_hash_file(tmp_path/'hashes.txt',HASH_COUNT,algorithm)
+
+    assert hash_file.hash_type == HASH_TYPES[algorithm]
+    assert list(hash_file._index) == sorted(hash_file._index)
+    for index, hash in enumerate(hash_file.hashes()):
+        assert hash_file.plaintext_of(hash) == hash_file.plaintext(index)
+    assert index == HASH_COUNT - 1
+
+
+def test_plaintext_of_unknown_hash(tmp_path:Path):
+    hash_file = generate_hash_file(tmp_path/'hashes.txt',HASH_COUNT)
+    other_hash_file = generate_hash_file(tmp_path/'other_hashes.txt',1,prefix='not-in-the-file-')
+
+    assert hash_file.plaintext_of(other_hash_file.hash(0)) is None
+    assert hash_file.is_cracked_correctly(hash_file.hash(42),hash_file.plaintext(42))
+    assert not hash_file.is_cracked_correctly(hash_file.hash(42),hash_file.plaintext(43))
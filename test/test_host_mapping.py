@@ -4,10 +4,11 @@ from typing import TYPE_CHECKING, List
 import pytest
 from selenium.webdriver.support.wait import WebDriverWait
 
+from page_object.job_detail_page import JobDetailPage
+
 if TYPE_CHECKING:
     from selenium.webdriver.remote.webdriver import WebDriver
-    from page_object.add_job_page.add_job_page import AddJobPage
-    from page_object.job_detail_page import JobDetailPage
+    from webadmin_api.client import WebadminApiClient
 
 HOST_NUMBERS = [
     pytest.param(0,id='first_host'),
@@ -16,19 +17,18 @@ HOST_NUMBERS = [
 
 
 @pytest.fixture
-def job_detail_page(add_job_page:AddJobPage) -> JobDetailPage:
-    input_settings = add_job_page.open_input_settings()
-
-    input_settings.select_hash_type_exactly('sha1')
-    input_settings.input_hashes_manually(['c0b51c46e4dcde6189e48ec9695fe55efc0ea703'])
-    
-    attack_settings = add_job_page.open_attack_settings()
-    
-    dictionary_settings = attack_settings.choose_dictionary_mode()
-
-    dictionary_settings.select_dictionaries(['darkweb2017-top1000.txt'])
-
-    job_detail_page = add_job_page.create_job()
+def job_detail_page(selenium:WebDriver,base_url:str,webadmin_api:WebadminApiClient,job_name:str) -> JobDetailPage:
+    # The job is created through the API; creating it is not what is tested here.
+    job_id = webadmin_api.create_dictionary_job(
+        job_name,
+        '100', # sha1
+        ['c0b51c46e4dcde6189e48ec9695fe55efc0ea703'],
+        ['darkweb2017-top1000.txt']
+    )
+
+    job_detail_page = JobDetailPage(selenium,no_ensure_loaded=True)
+    job_detail_page.navigate(base_url,job_id)
+    job_detail_page.ensure_loaded()
 
     if len(job_detail_page.get_available_hosts()) < 2:
         pytest.fail('To run this test, you must have two or more hosts connected.')
@@ -60,7 +60,7 @@ def test_selecting_one_host_appears(job_detail_page:JobDetailPage,desired_host_n
     assert [ host.name for host in job_detail_page.get_active_hosts() ] == [desired_host]
 
 @pytest.mark.parametrize('desired_host_number',HOST_NUMBERS)
-def test_progress_will_only_show_selected_host(job_detail_page:JobDetailPage,desired_host_number:int):
+def test_progress_will_only_show_selected_host(job_detail_page:JobDetailPage,webadmin_api:WebadminApiClient,desired_host_number:int):
     available_hosts = job_detail_page.get_available_hosts()
     desired_host = available_hosts[desired_host_number]
 
@@ -68,7 +68,7 @@ def test_progress_will_only_show_selected_host(job_detail_page:JobDetailPage,des
 
     job_detail_page.start_job()
 
-    job_detail_page.wait_until_job_finished(600)
+    job_detail_page.wait_until_job_finished(600,webadmin_api)
 
     for workunit in job_detail_page.get_workunits():
         assert workunit.host == desired_host.rsplit(' (',1)[0]
\ No newline at end of file
@@ -0,0 +1,236 @@
+"""pytest plugin that shows where the time of the tests goes.
+
+TimingBreakdownPlugin --
+the plugin; registered by `conftest.py` when the `--timing-breakdown` or `--timing-json` option is used
+
+The time of each test is split into these categories:
+
+sleep -- fixed pauses (`ActionChains.pause`)
+wait -- polling in `WebDriverWait.until` and `WebDriverWait.until_not` (including the WebDriver
+commands made while polling)
+command -- other WebDriver commands
+http -- HTTP requests made by the tests themselves (`requests`), like file downloads and
+Webadmin API calls
+other -- the rest (pytest itself, Python code of the tests, ...)
+
+Every category counts only the time not counted by a category nested in it; e.g. a WebDriver
+command sent while polling counts as wait, not command. Besides that, the same breakdown is made
+for every call of a public method of a page object (inclusive of the methods it calls), and the
+methods are summed up across the whole run.
+
+The breakdown of each test is stored in its `timing_breakdown` user property, so it is carried
+over from pytest-xdist workers too. The plugin shows the slowest page-object methods at the end of
+the run and (with `--timing-json`) writes the breakdowns of all tests and methods to a JSON file.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type
+from collections import defaultdict
+import functools
+import inspect
+import json
+import threading
+import time
+
+import pytest
+import requests
+from selenium.webdriver import ActionChains
+from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.wait import WebDriverWait
+
+from page_object.common.page_object import PageObject
+
+if TYPE_CHECKING:
+    import _pytest.config
+    import _pytest.nodes
+    import _pytest.reports
+    import _pytest.terminal
+
+
+CATEGORIES = ('sleep','wait','command','http')
+
+
+class _Span:
+    """A running measurement of a category; `child_time` is the time taken by spans nested in it."""
+    def __init__(self,category:str):
+        self.category = category
+        self.start = time.perf_counter()
+        self.child_time = 0.0
+
+
+class TimingBreakdownPlugin:
+    """The plugin. `json_path` is the path of the JSON file to write the results to, if any."""
+
+    def __init__(self,json_path:Optional[str]=None,slowest_methods:int=20):
+        self.json_path = json_path
+        self.slowest_methods = slowest_methods
+        self._totals : Dict[str,float] = dict.fromkeys(CATEGORIES,0.0)
+        self._local = threading.local()
+        self._patches : List[Tuple[Any,str,Any]] = []
+        self._method_records : Dict[str,Dict[str,Any]] = {}
+        self._item_totals_before : Dict[str,float] = self._snapshot()
+        self.tests : Dict[str,Dict[str,Any]] = {}
+        self.methods : Dict[str,Dict[str,Any]] = defaultdict(lambda: {'calls': 0, 'total': 0.0, **dict.fromkeys(CATEGORIES,0.0)})
+
+    # Measuring
+
+    @property
+    def _stack(self) -> List[_Span]:
+        if not hasattr(self._local,'stack'):
+            self._local.stack = []
+        return self._local.stack
+
+    def _measure(self,category:str,function:Callable,*args,**kwargs) -> Any:
+        """Calls `function` and counts the time it takes (less nested measurements) to `category`."""
+        span = _Span(category)
+        self._stack.append(span)
+        try:
+            return function(*args,**kwargs)
+        finally:
+            self._stack.pop()
+            elapsed = time.perf_counter() - span.start
+            self._totals[category] += elapsed - span.child_time
+            if self._stack:
+                self._stack[-1].child_time += elapsed
+
+    def _perform(self,chain:ActionChains,original:Callable) -> Any:
+        """Performs an action chain as a command, but counts the pauses in it as sleep."""
+        before = self._totals['command']
+        try:
+            return self._measure('command',original,chain)
+        finally:
+            paused = min(getattr(chain,'_timing_breakdown_pauses',0.0),self._totals['command']-before)
+            self._totals['command'] -= paused
+            self._totals['sleep'] += paused
+            chain._timing_breakdown_pauses = 0.0 # type: ignore
+
+    def _snapshot(self) -> Dict[str,float]:
+        return dict(self._totals)
+
+    def _call_method(self,qualname:str,method:Callable,*args,**kwargs) -> Any:
+        """Calls a page-object method and adds its breakdown to the record of the method."""
+        before, start = self._snapshot(), time.perf_counter()
+        try:
+            return method(*args,**kwargs)
+        finally:
+            record = self._method_records.setdefault(qualname,{'calls': 0, 'total': 0.0, **dict.fromkeys(CATEGORIES,0.0)})
+            record['calls'] += 1
+            record['total'] += time.perf_counter() - start
+            for category in CATEGORIES:
+                record[category] += self._totals[category] - before[category]
+
+    # Patching
+
+    def _patch(self,owner:Any,name:str,replacement:Callable) -> None:
+        self._patches.append((owner,name,owner.__dict__[name]))
+        setattr(owner,name,replacement)
+
+    def _patch_measured(self,owner:Any,name:str,category:str) -> None:
+        original = getattr(owner,name)
+        @functools.wraps(original)
+        def measured(*args,**kwargs):
+            return self._measure(category,original,*args,**kwargs)
+        self._patch(owner,name,measured)
+
+    def _patch_selenium_and_requests(self) -> None:
+        self._patch_measured(WebDriver,'execute','command')
+        self._patch_measured(WebDriverWait,'until','wait')
+        self._patch_measured(WebDriverWait,'until_not','wait')
+        self._patch_measured(requests.Session,'request','http')
+
+        plugin = self
+        original_pause, original_perform = ActionChains.pause, ActionChains.perform
+        @functools.wraps(original_pause)
+        def pause(chain:ActionChains,seconds:float) -> ActionChains:
+            chain._timing_breakdown_pauses = getattr(chain,'_timing_breakdown_pauses',0.0) + seconds # type: ignore
+            return original_pause(chain,seconds)
+        @functools.wraps(original_perform)
+        def perform(chain:ActionChains) -> None:
+            return plugin._perform(chain,original_perform)
+        self._patch(ActionChains,'pause',pause)
+        self._patch(ActionChains,'perform',perform)
+
+    def _patch_page_objects(self) -> None:
+        """Wraps the public methods of all page-object classes that have been imported."""
+        classes : List[Type[PageObject]] = [PageObject]
+        seen = set(classes)
+        while classes:
+            cls = classes.pop()
+            for subclass in cls.__subclasses__():
+                if subclass not in seen:
+                    seen.add(subclass)
+                    classes.append(subclass)
+            for name, attribute in list(cls.__dict__.items()):
+                if name.startswith('_') or not inspect.isfunction(attribute):
+                    continue
+                self._patch(cls,name,self._wrap_method(f'{cls.__module__}.{attribute.__qualname__}',attribute))
+
+    def _wrap_method(self,qualname:str,method:Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(*args,**kwargs):
+            return self._call_method(qualname,method,*args,**kwargs)
+        return wrapper
+
+    # Hooks
+
+    def pytest_configure(self,config:_pytest.config.Config) -> None:
+        self._patch_selenium_and_requests()
+
+    def pytest_unconfigure(self,config:_pytest.config.Config) -> None:
+        for owner, name, original in reversed(self._patches):
+            setattr(owner,name,original)
+        self._patches.clear()
+
+    def pytest_collection_finish(self,session:pytest.Session) -> None:
+        self._patch_page_objects()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self,item:_pytest.nodes.Item):
+        self._item_totals_before = self._snapshot()
+        self._method_records = {}
+        yield
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self,item:_pytest.nodes.Item,call:pytest.CallInfo):
+        if call.when == 'teardown':
+            item.user_properties.append(('timing_breakdown',{
+                **{category: self._totals[category] - self._item_totals_before[category] for category in CATEGORIES},
+                'methods': self._method_records,
+            }))
+        yield
+
+    def pytest_runtest_logreport(self,report:_pytest.reports.TestReport) -> None:
+        test = self.tests.setdefault(report.nodeid,{'duration': 0.0})
+        test['duration'] += report.duration
+        if report.when != 'teardown':
+            return
+        breakdown = dict(report.user_properties).get('timing_breakdown')
+        if breakdown is None:
+            return
+        methods = breakdown['methods']
+        test.update({category: breakdown[category] for category in CATEGORIES})
+        test['other'] = max(test['duration'] - sum(breakdown[category] for category in CATEGORIES),0.0)
+        test['methods'] = methods
+        for qualname, record in methods.items():
+            for key, value in record.items():
+                self.methods[qualname][key] += value
+
+    def pytest_terminal_summary(self,terminalreporter:_pytest.terminal.TerminalReporter) -> None:
+        if not self.tests:
+            return
+        terminalreporter.write_sep('=','timing breakdown')
+        totals = {key: sum(test.get(key,0.0) for test in self.tests.values()) for key in ('duration',*CATEGORIES,'other')}
+        terminalreporter.write_line('all tests: ' + ', '.join(f'{key} {value:.1f}s' for key, value in totals.items()))
+        terminalreporter.write_line(f'slowest page-object methods (of {len(self.methods)}):')
+        slowest = sorted(self.methods.items(),key=lambda item: item[1]['total'],reverse=True)[:self.slowest_methods]
+        for qualname, record in slowest:
+            terminalreporter.write_line(
+                f'{record["total"]:8.1f}s {record["calls"]:5d}x  {qualname}  ('
+                + ', '.join(f'{category} {record[category]:.1f}s' for category in CATEGORIES) + ')'
+            )
+
+    def pytest_sessionfinish(self,session:pytest.Session) -> None:
+        if self.json_path is None or hasattr(session.config,'workerinput'): # pytest-xdist workers leave it to the controller.
+            return
+        with open(self.json_path,'w') as file:
+            json.dump({'tests': self.tests, 'methods': self.methods},file,indent=2)
@@ -0,0 +1 @@
+"""Client of the Webadmin REST API, used for preparing state for tests without going through the UI."""
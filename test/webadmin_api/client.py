@@ -0,0 +1,168 @@
+"""Client of the Webadmin REST API.
+
+Exports single class--WebadminApiClient.
+
+Fixtures that only prepare state for a test (e.g. a job whose host mapping is tested, or a file in
+the library) do not need to click through the UI to do so; the UI is not what is being tested
+there. Sending the same requests the UI would send takes milliseconds instead of tens of seconds.
+
+The client authenticates as the user logged into Webadmin in a browser (see `get_webadmin_auth`),
+so it can only be created once the browser is logged in. All requests go through a single
+`requests.Session`, so the connection to the API is reused.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Iterable, Tuple
+
+import requests
+
+from page_object.common.helper import get_webadmin_auth
+from page_object.common.exception import WebadminError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class WebadminApiClient:
+    """Client of the Webadmin REST API. Create it using `from_driver`.
+
+    Library files are addressed by their kind, which is one of the keys of `LIBRARY_ENDPOINTS`
+    (i.e. 'dictionary', 'rule', 'charset', 'mask', 'pcfg', 'markov').
+
+    Failed requests raise WebadminError with the message Webadmin gave.
+    """
+
+    LIBRARY_ENDPOINTS = {
+        'dictionary': 'dictionary',
+        'rule': 'rule',
+        'charset': 'charset',
+        'mask': 'masks',
+        'pcfg': 'pcfg',
+        'markov': 'markovChains',
+    }
+
+    def __init__(self,api_url:str,headers:Dict[str,str],cookies:Dict[str,str]):
+        """`api_url` is the URL where the Webadmin API runs (no trailing forward slash);
+        `headers` and `cookies` authenticate the requests.
+        """
+        self.api_url = api_url
+        self.session = requests.Session()
+        self.set_auth(headers,cookies)
+
+    def set_auth(self,headers:Dict[str,str],cookies:Dict[str,str]) -> None:
+        """Replaces the headers and cookies that authenticate the requests
+        (e.g. after logging in anew), keeping the open connections.
+        """
+        self.session.headers.update(headers)
+        self.session.cookies.clear()
+        self.session.cookies.update(cookies)
+
+    @classmethod
+    def from_driver(cls,driver:WebDriver,api_url:Optional[str]=None) -> WebadminApiClient:
+        """Creates a client authenticated as the user logged into Webadmin in the browser.
+        If `api_url` is not given, the address of the API Webadmin itself uses is taken from the
+        browser (Webadmin has it configured in `window.serverAddress`).
+        """
+        if api_url is None:
+            api_url = driver.execute_script('return window.serverAddress;')
+            if not api_url:
+                raise WebadminError('The address of the Webadmin API could not be determined; set it explicitly.')
+        headers, cookies = get_webadmin_auth(driver)
+        return cls(api_url.rstrip('/'),headers,cookies)
+
+    def close(self) -> None:
+        """Closes the connections of the client."""
+        self.session.close()
+
+    def _request(self,method:str,path:str,**kwargs) -> Any:
+        """Sends a request to the API and returns the decoded JSON response."""
+        response = self.session.request(method,f'{self.api_url}/{path}',**kwargs)
+        try:
+            body = response.json()
+        except ValueError:
+            body = None
+        if not response.ok:
+            message = body.get('message') if isinstance(body,dict) else None
+            raise WebadminError(message or f'Webadmin API request {method} /{path} failed with status {response.status_code}.')
+        return body
+
+    def create_job(self,payload:Dict[str,Any]) -> int:
+        """Creates a job from `payload` (the same JSON the Add Job page sends) and returns its ID."""
+        return self._request('POST','job',json=payload)['job_id']
+
+    def create_dictionary_job(self,name:str,hash_type:str,hashes:Iterable[str],dictionaries:Iterable[str]) -> int:
+        """Creates a job with a dictionary attack and returns its ID.
+        `hash_type` is the Hashcat code of the hash type (e.g. '100' for SHA1);
+        `dictionaries` are the names of dictionaries in the library.
+        """
+        return self.create_job({
+            'name': name,
+            'comment': '',
+            'hosts_ids': [],
+            'seconds_per_job': 600,
+            'time_start': '',
+            'time_end': '',
+            'attack_settings': {
+                'attack_mode': 0,
+                'attack_name': 'dict',
+                'rules': None,
+                'left_dictionaries': [self.find_library_file('dictionary',dictionary) for dictionary in dictionaries],
+            },
+            'hash_settings': {
+                'hash_type': hash_type,
+                'hash_list': [{'hash': hash} for hash in hashes],
+                'valid_only': False,
+            },
+        })
+
+    def get_job(self,job_id:int) -> Dict[str,Any]:
+        """Returns the details of a job as Webadmin sends them to the job detail page."""
+        return self._request('GET',f'job/{job_id}')
+
+    def get_job_hashes(self,job_id:int) -> List[Tuple[str,str]]:
+        """Returns a list of tuples, where the first element is an input hash of the job and the
+        second element is the recovered password (an empty string if the password is not cracked);
+        i.e. the same as `JobDetailPage.get_hashes`.
+        """
+        items = self._request('GET',f'job/{job_id}/hashes',params={'page':1,'per_page':1000000})['items']
+        return [(item['hashText'],item['password'] or '') for item in items]
+
+    def start_job(self,job_id:int) -> None:
+        """Starts a job."""
+        self._request('GET',f'job/{job_id}/action',params={'operation':'start'})
+
+    def delete_job(self,job_id:int) -> None:
+        """Deletes a job."""
+        self._request('DELETE',f'job/{job_id}')
+
+    def get_library_files(self,kind:str) -> List[Dict[str,Any]]:
+        """Returns all files in the library of the given kind (each file as a dict with its 'id',
+        'name' and other details)."""
+        return self._request('GET',self.LIBRARY_ENDPOINTS[kind])['items']
+
+    def find_library_file(self,kind:str,name:str) -> Dict[str,Any]:
+        """Returns the file of the given kind with the given name.
+        ValueError is raised if there is no such file.
+        """
+        for file in self.get_library_files(kind):
+            if file['name'] == name:
+                return file
+        raise ValueError(f'There is no {kind} named {name}.')
+
+    def upload_library_file(self,kind:str,path:Path,**form:Any) -> int:
+        """Uploads a file to the library of the given kind and returns its ID.
+        `form` holds additional form fields of the upload (e.g. `sort='true'` for dictionaries).
+        """
+        with open(path,'rb') as file:
+            self._request('POST',f'{self.LIBRARY_ENDPOINTS[kind]}/add',files={'file':(path.name,file)},data=form)
+        return self.find_library_file(kind,path.name)['id']
+
+    def delete_library_file(self,kind:str,file_id:int) -> None:
+        """Deletes a file from the library of the given kind."""
+        self._request('DELETE',f'{self.LIBRARY_ENDPOINTS[kind]}/{file_id}')
+
+    def get_hash_types(self) -> List[Dict[str,Any]]:
+        """Returns the hash types Webadmin offers (each as a dict with its Hashcat 'code'
+        and 'name', as shown in the hash-type selection)."""
+        return self._request('GET','hashcat/hashTypes')['hashtypes']
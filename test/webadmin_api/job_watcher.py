@@ -0,0 +1,60 @@
+"""Watching jobs through the Webadmin API.
+
+JobStateTransition --
+a state of a job and the time when the watcher first saw it
+
+watch_job_until_finished --
+polling the state of a job until it finishes, with exponential backoff
+
+Cracking jobs run for minutes. Polling the state shown on the job detail page costs a WebDriver
+round trip every half a second and keeps the browser busy the whole time; polling the API is a
+single cheap HTTP request, and it need not be done often when the state does not change.
+"""
+
+from __future__ import annotations
+from typing import TYPE_CHECKING, NamedTuple, List
+import time
+
+from selenium.common.exceptions import TimeoutException
+
+if TYPE_CHECKING:
+    from webadmin_api.client import WebadminApiClient
+
+
+FINISHED_JOB_STATES = {'finished','exhausted','timeout'}
+"""States (`status_text` as Webadmin sends it, in lowercase) of a job that ended."""
+
+
+class JobStateTransition(NamedTuple):
+    """`state` is the state of a job (`status_text` as Webadmin sends it) and `timestamp` is the
+    time (as returned by `time.time()`) when the watcher first saw the job in that state.
+    """
+    state : str
+    timestamp : float
+
+
+def watch_job_until_finished(client:WebadminApiClient,job_id:int,timeout:float,initial_interval:float=0.5,max_interval:float=15,backoff:float=2) -> List[JobStateTransition]:
+    """Polls the state of a job through the API until the job is in one of `FINISHED_JOB_STATES`.
+    Returns the states the job went through (including the state at the time of the call and the
+    final state) along with the times they were first seen.
+
+    The polling interval starts at `initial_interval` seconds and is multiplied by `backoff` after
+    each poll that sees no change, up to `max_interval` seconds; a change of the state resets it.
+    Raises TimeoutException if the job does not finish within `timeout` seconds.
+    """
+    deadline = time.monotonic() + timeout
+    transitions : List[JobStateTransition] = []
+    interval = initial_interval
+    while True:
+        state = client.get_job(job_id)['status_text']
+        if not transitions or transitions[-1].state != state:
+            transitions.append(JobStateTransition(state,time.time()))
+            interval = initial_interval
+        else:
+            interval = min(interval*backoff,max_interval)
+        if state.lower() in FINISHED_JOB_STATES:
+            return transitions
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutException(f'Job {job_id} did not finish within {timeout} seconds; its states were {transitions}.')
+        time.sleep(min(interval,remaining))